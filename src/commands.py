@@ -1,6 +1,20 @@
 # --- START OF FILE commands.py ---
 from PyQt6.QtGui import QUndoCommand
 
+from src.tracing import traced
+
+
+def set_screen_rect(window, ul, br):
+    """
+    Moves/resizes a window in the model. SCREENRECT is replaced rather than edited in place,
+    because the property editor's Reset snapshot shares it (see PropertyEditor.load_property).
+    """
+    screen_rect = dict(window.properties.get('SCREENRECT') or {})
+    screen_rect['UPPERLEFT'] = ul
+    screen_rect['BOTTOMRIGHT'] = br
+    window.properties['SCREENRECT'] = screen_rect
+
+
 class CommandAddObject(QUndoCommand):
     def __init__(self, main_window, new_object, parent_uuid, insert_index, description="Add Object"):
         super().__init__(description)
@@ -9,6 +23,7 @@ class CommandAddObject(QUndoCommand):
         self.parent_uuid = parent_uuid
         self.insert_index = insert_index
 
+    @traced(category="undo")
     def redo(self):
         windows = self.main_window.parser.get_windows()
         parent = self.main_window.object_tree.model._find_window_by_uuid(windows,
@@ -24,6 +39,7 @@ class CommandAddObject(QUndoCommand):
         self.main_window.update_modified_state(True)
         self.main_window.handle_object_added(self.new_object)
 
+    @traced(category="undo")
     def undo(self):
         windows = self.main_window.parser.get_windows()
         parent = self.main_window.object_tree.model._find_window_by_uuid(windows,
@@ -46,6 +62,7 @@ class CommandDeleteObject(QUndoCommand):
         self.parent_uuid = parent_uuid
         self.insert_index = insert_index
 
+    @traced(category="undo")
     def redo(self):
         windows = self.main_window.parser.get_windows()
         parent = self.main_window.object_tree.model._find_window_by_uuid(windows,
@@ -59,6 +76,7 @@ class CommandDeleteObject(QUndoCommand):
         self.main_window.update_modified_state(True)
         self.main_window.handle_object_deleted(self.target_object.window_uuid)
 
+    @traced(category="undo")
     def undo(self):
         windows = self.main_window.parser.get_windows()
         parent = self.main_window.object_tree.model._find_window_by_uuid(windows,
@@ -87,6 +105,7 @@ class CommandMoveObject(QUndoCommand):
         self.old_row = -1
         self.first_run = True
 
+    @traced(category="undo")
     def redo(self):
         windows = self.main_window.parser.get_windows()
         tree_model = self.main_window.object_tree.model
@@ -113,6 +132,7 @@ class CommandMoveObject(QUndoCommand):
 
         self.main_window.object_tree._refresh_tree_state()
 
+    @traced(category="undo")
     def undo(self):
         windows = self.main_window.parser.get_windows()
         tree_model = self.main_window.object_tree.model
@@ -144,14 +164,12 @@ class CommandChangeGeometry(QUndoCommand):
         self.new_br = list(new_br)
 
     def id(self):
-        """Returns a unique ID so Qt knows which commands can be merged."""
-        # Constrain hash to 32-bit signed integer range
-        hash_val = hash(self.window_uuid) & 0x7FFFFFFF  # Keep only positive values
-        return 1100 + (hash_val % 1000000)
+        """Qt only tries to merge commands with the same id; mergeWith checks they move the same window."""
+        return 1100
 
     def mergeWith(self, command):
         """Compresses rapid spinbox inputs into a single Undo action."""
-        if command.id() != self.id():
+        if command.id() != self.id() or command.window_uuid != self.window_uuid:
             return False
 
         # Update our 'new' state to the incoming command's state, preserving the original 'old' state
@@ -171,10 +189,8 @@ class CommandChangeGeometry(QUndoCommand):
             self.main_window.object_tree.model.parser_windows, self.window_uuid
         )
         if window:
-            if 'SCREENRECT' not in window.properties:
-                window.properties['SCREENRECT'] = {}
-            window.properties['SCREENRECT']['UPPERLEFT'] = ul
-            window.properties['SCREENRECT']['BOTTOMRIGHT'] = br
+            set_screen_rect(window, ul, br)
+            self.main_window.invalidate_validation([window])
 
             # 2. Instantly update Canvas graphics
             if hasattr(self.main_window, 'visual_preview'):
@@ -182,22 +198,16 @@ class CommandChangeGeometry(QUndoCommand):
 
             # 3. Synchronize Property Editor UI if the item is currently selected
             if self.main_window.selected_object and self.main_window.selected_object.window_uuid == self.window_uuid:
-                self.main_window._is_syncing = True
-                gp = self.main_window.property_editor.general_properties
-                gp.upper_left_x_spinbox.setValue(ul[0])
-                gp.upper_left_y_spinbox.setValue(ul[1])
-                gp.bottom_right_x_spinbox.setValue(br[0])
-                gp.bottom_right_y_spinbox.setValue(br[1])
-                gp.width_spinbox.setValue(max(0, br[0] - ul[0]))
-                gp.height_spinbox.setValue(max(0, br[1] - ul[1]))
-                self.main_window._is_syncing = False
+                self.main_window.property_editor.show_geometry(ul, br)
 
         self.main_window.update_modified_state(True)
         self.main_window._is_undoing = False
 
+    @traced(category="undo")
     def redo(self):
         self._sync_system_state(is_undo=False)
 
+    @traced(category="undo")
     def undo(self):
         self._sync_system_state(is_undo=True)
 
@@ -209,10 +219,8 @@ class CommandChangeGeometry(QUndoCommand):
             return
 
         # 1. Update the underlying data dictionary
-        if 'SCREENRECT' not in window.properties:
-            window.properties['SCREENRECT'] = {}
-        window.properties['SCREENRECT']['UPPERLEFT'] = list(ul)
-        window.properties['SCREENRECT']['BOTTOMRIGHT'] = list(br)
+        set_screen_rect(window, list(ul), list(br))
+        self.main_window.invalidate_validation([window])
 
         self.main_window.update_modified_state(True)
 
@@ -223,24 +231,7 @@ class CommandChangeGeometry(QUndoCommand):
         # 3. Update Property Editor spinboxes (only if this object is currently selected)
         if getattr(self.main_window, 'selected_object',
                    None) and self.main_window.selected_object.window_uuid == self.window_uuid:
-            if hasattr(self.main_window.property_editor, 'general_properties'):
-                gp = self.main_window.property_editor.general_properties
-
-                # Block signals temporarily to prevent infinite feedback loops
-                gp.upper_left_x_spinbox.blockSignals(True)
-                gp.upper_left_y_spinbox.blockSignals(True)
-                gp.bottom_right_x_spinbox.blockSignals(True)
-                gp.bottom_right_y_spinbox.blockSignals(True)
-
-                gp.upper_left_x_spinbox.setValue(ul[0])
-                gp.upper_left_y_spinbox.setValue(ul[1])
-                gp.bottom_right_x_spinbox.setValue(br[0])
-                gp.bottom_right_y_spinbox.setValue(br[1])
-
-                gp.upper_left_x_spinbox.blockSignals(False)
-                gp.upper_left_y_spinbox.blockSignals(False)
-                gp.bottom_right_x_spinbox.blockSignals(False)
-                gp.bottom_right_y_spinbox.blockSignals(False)
+            self.main_window.property_editor.show_geometry(ul, br)
 
 
 class CommandChangeProperty(QUndoCommand):
@@ -254,9 +245,11 @@ class CommandChangeProperty(QUndoCommand):
         self.old_value = old_value
         self.new_value = new_value
 
+    @traced(category="undo")
     def redo(self):
         self._apply_property(self.new_value)
 
+    @traced(category="undo")
     def undo(self):
         self._apply_property(self.old_value)
 
@@ -272,9 +265,90 @@ class CommandChangeProperty(QUndoCommand):
         # Set a flag to prevent UI property syncs from creating feedback loops in the Undo Stack
         self.main_window._is_undoing = True
         try:
-            # Reload the property editor UI if this object is selected
-            if getattr(self.main_window, 'selected_object',
-                       None) and self.main_window.selected_object.window_uuid == self.window_uuid:
-                self.main_window.load_object_property()
+            # Only the widgets and labels showing this property are refreshed
+            self.main_window.handle_property_changed(window, self.prop_key)
+        finally:
+            self.main_window._is_undoing = False
+
+
+class CommandChangeProperties(QUndoCommand):
+    """Command changing one property of several windows at once (multi-selection editing)."""
+
+    def __init__(self, main_window, prop_key, changes, description="Change Properties"):
+        super().__init__(description)
+        self.main_window = main_window
+        self.prop_key = prop_key
+        self.changes = changes  # [(window_uuid, old_value, new_value)]
+
+    @traced(category="undo")
+    def redo(self):
+        self._apply_properties({window_uuid: new for window_uuid, old, new in self.changes})
+
+    @traced(category="undo")
+    def undo(self):
+        self._apply_properties({window_uuid: old for window_uuid, old, new in self.changes})
+
+    def _apply_properties(self, values):
+        # One pass over the hierarchy instead of one lookup per window
+        windows = []
+        pending = list(self.main_window.parser.get_windows())
+        while pending:
+            window = pending.pop()
+            if window.window_uuid in values:
+                windows.append(window)
+            pending.extend(getattr(window, 'children', None) or [])
+
+        for window in windows:
+            value = values[window.window_uuid]
+            if value is None:
+                window.properties.pop(self.prop_key, None)  # The window did not have the property before
+            else:
+                window.properties[self.prop_key] = value
+        self.main_window.update_modified_state(True)
+
+        self.main_window._is_undoing = True
+        try:
+            self.main_window.handle_properties_changed(windows, self.prop_key)
+        finally:
+            self.main_window._is_undoing = False
+
+
+class CommandChangeStatements(QUndoCommand):
+    """Command applying the statements edited in the Raw tab to one window (see PropertyEditor.apply_raw_edit)."""
+
+    def __init__(self, main_window, window_uuid, changes, old_tags, new_tags, description="Edit Raw Properties"):
+        super().__init__(description)
+        self.main_window = main_window
+        self.window_uuid = window_uuid
+        self.changes = changes  # [(tag, old_value, new_value)], values as in source_text.statement_values
+        self.old_tags = old_tags  # source_tags before / after, for the tag order validation rule
+        self.new_tags = new_tags
+
+    @traced(category="undo")
+    def redo(self):
+        self._apply_statements({tag: new for tag, old, new in self.changes}, self.new_tags)
+
+    @traced(category="undo")
+    def undo(self):
+        self._apply_statements({tag: old for tag, old, new in self.changes}, self.old_tags)
+
+    def _apply_statements(self, values, source_tags):
+        from src.window.source_text import set_statement_value, statement_key
+
+        window = self.main_window.object_tree.model._find_window_by_uuid(self.main_window.parser.get_windows(),
+                                                                         self.window_uuid)
+        if not window:
+            return
+
+        for tag, value in values.items():
+            set_statement_value(window.properties, tag, value)
+        window.source_tags = source_tags
+        self.main_window.invalidate_validation([window])
+        self.main_window.update_modified_state(True)
+
+        self.main_window._is_undoing = True
+        try:
+            for prop_key in dict.fromkeys(statement_key(tag) for tag in values):
+                self.main_window.handle_property_changed(window, prop_key)
         finally:
             self.main_window._is_undoing = False
@@ -0,0 +1,156 @@
+import os
+import weakref
+from collections import OrderedDict
+
+from PyQt6.QtGui import QUndoStack
+
+from src.parse_cache import ParseCache
+
+
+class Document:
+    """
+    State of one open WND file: its parsed model, undo history, and the canvas scene
+    and tree model that are kept detached while another document is active.
+    """
+
+    # Rough per-window cost of a hydrated document (model dicts, canvas items and tree items)
+    ESTIMATED_BYTES_PER_WINDOW = 32 * 1024
+    # Rough cost of an undo command (old and new property values)
+    ESTIMATED_BYTES_PER_COMMAND = 4 * 1024
+
+    def __init__(self, file_path, undo_group):
+        self.file_path = file_path
+        self.parser = None
+        self.signature = None  # File signature the model was last in sync with (load or save)
+        self.is_modified = False
+        self.changed_on_disk = False
+
+        self.undo_stack = QUndoStack(undo_group)
+        undo_group.addStack(self.undo_stack)
+        self._cached_parser = None  # Weak reference to the model put in the parse cache by `dehydrate`
+
+        # Detached views, only set while the document is inactive
+        self.canvas_state = None
+        self.tree_state = None
+
+    @property
+    def display_name(self):
+        name = os.path.basename(self.file_path)
+        return f"{name} *" if self.is_modified else name
+
+    @property
+    def is_hydrated(self):
+        return self.parser is not None
+
+    def window_count(self):
+        if not self.parser:
+            return 0
+
+        def _count(windows):
+            return sum(1 + _count(w.children) for w in windows)
+
+        return _count(self.parser.get_windows())
+
+    def estimated_size(self):
+        return (self.window_count() * self.ESTIMATED_BYTES_PER_WINDOW
+                + self.undo_stack.count() * self.ESTIMATED_BYTES_PER_COMMAND)
+
+    def release_views(self):
+        """Destroys the detached canvas scene and tree model."""
+        if self.canvas_state:
+            self.canvas_state.release()
+            self.canvas_state = None
+        if self.tree_state:
+            self.tree_state['model'].clear()
+            self.tree_state = None
+
+    def dehydrate(self, parse_cache=None):
+        """
+        Drops everything but the file path and the undo history. An unmodified model is moved to the parse cache,
+        so reactivating the document only needs to rebuild the tree and canvas, and its undo history stays valid.
+        """
+        if parse_cache is not None and self.parser and not self.is_modified and self.signature:
+            parse_cache.put(self.file_path, self.parser, self.signature)
+            self._cached_parser = weakref.ref(self.parser)
+        self.release_views()
+        self.parser = None
+
+    def hydrate(self, parser):
+        """
+        Sets the model of the document. The undo history refers to the windows of the model it was recorded on,
+        so it is cleared unless `parser` is the model `dehydrate` put in the parse cache.
+        """
+        cached_parser = self._cached_parser() if self._cached_parser else None
+        if parser is None or parser is not cached_parser:
+            self.undo_stack.clear()
+        self._cached_parser = None
+        self.parser = parser
+
+
+class DocumentManager:
+    """
+    Keeps the open documents in most-recently-used order and decides which inactive
+    documents are dehydrated to stay within the document count and memory budget.
+    Documents with unsaved changes are never dehydrated.
+    """
+
+    def __init__(self, undo_group, parse_cache, max_hydrated=8, memory_budget_mb=128):
+        self.undo_group = undo_group
+        self.parse_cache = parse_cache
+        self.max_hydrated = max_hydrated
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.documents = OrderedDict()  # normalized path -> Document, most recently used last
+
+    def get(self, file_path):
+        return self.documents.get(ParseCache.normalize(file_path))
+
+    def open(self, file_path):
+        """Returns the document for a file, creating an (unloaded) one if it is not open yet."""
+        document = self.get(file_path)
+        if document is None:
+            document = Document(file_path, self.undo_group)
+            self.documents[ParseCache.normalize(file_path)] = document
+        self.touch(document)
+        return document
+
+    def touch(self, document):
+        """Marks a document as most recently used."""
+        key = ParseCache.normalize(document.file_path)
+        if key in self.documents:
+            self.documents.move_to_end(key)
+
+    def rename(self, document, new_path):
+        """Re-keys a document after 'Save As'."""
+        self.documents.pop(ParseCache.normalize(document.file_path), None)
+        document.file_path = new_path
+        self.documents[ParseCache.normalize(new_path)] = document
+
+    def close(self, document):
+        """Forgets a document, keeping its unmodified model in the parse cache for a quick reopen."""
+        self.documents.pop(ParseCache.normalize(document.file_path), None)
+        document.dehydrate(self.parse_cache)
+        self.undo_group.removeStack(document.undo_stack)
+        document.undo_stack.deleteLater()
+
+    def modified_documents(self):
+        return [d for d in self.documents.values() if d.is_modified]
+
+    def enforce_budget(self, active_document):
+        """
+        Dehydrates least recently used documents until the hydrated ones fit the budget.
+        :return: List of documents that were dehydrated.
+        """
+        hydrated = [d for d in self.documents.values() if d.is_hydrated]
+        total_size = sum(d.estimated_size() for d in hydrated)
+        dehydrated = []
+
+        for document in hydrated:  # Least recently used first
+            if len(hydrated) - len(dehydrated) <= self.max_hydrated and total_size <= self.memory_budget:
+                break
+            if document is active_document or document.is_modified:
+                continue
+            total_size -= document.estimated_size()
+            document.dehydrate(self.parse_cache)
+            dehydrated.append(document)
+
+        return dehydrated
@@ -1,40 +1,168 @@
+import atexit
+import copy
 import json
 import os
+import threading
+
+
+class ConfigStore:
+    """
+    Process-wide, in-memory copy of one JSON config file.
+
+    The file is read once; reads are served from memory. Writes are collected and flushed
+    by a background timer, merged into the current file content and written atomically
+    (temp file + replace). `watch` picks up changes written by another GenWND instance.
+    """
+    _stores = {}
+    _stores_lock = threading.Lock()
+
+    @classmethod
+    def for_file(cls, json_file):
+        """Returns the shared store of a config file."""
+        path = os.path.abspath(json_file)
+        with cls._stores_lock:
+            store = cls._stores.get(path)
+            if store is None:
+                store = cls._stores[path] = cls(path)
+        return store
+
+    def __init__(self, path, flush_delay=0.5):
+        self.path = path
+        self.flush_delay = flush_delay
+        self._lock = threading.RLock()
+        self._data = None
+        self._pending = {}  # Keys written since the last flush
+        self._flush_timer = None
+        self._written_signature = None
+        self._watcher = None
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def _ensure_loaded(self):
+        if self._data is None:
+            self._data = self._read()
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._ensure_loaded()
+            return copy.deepcopy(self._data.get(key, default))
+
+    def snapshot(self):
+        with self._lock:
+            self._ensure_loaded()
+            return copy.deepcopy(self._data)
+
+    def update(self, values):
+        """Applies new values in memory and schedules a write-back."""
+        with self._lock:
+            self._ensure_loaded()
+            values = copy.deepcopy(values)
+            self._data.update(values)
+            self._pending.update(values)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Writes pending changes now, merged into what is currently on disk."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+
+            try:
+                data = self._read()
+            except ValueError:
+                data = dict(self._data)  # Unreadable file: rewrite it from memory
+            data.update(self._pending)
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(data, f, indent=4)
+            os.replace(temp_path, self.path)
+
+            self._data = data
+            self._pending = {}
+            self._written_signature = self._signature(self.path)
+
+    def reload(self):
+        """Re-reads the file, keeping changes that were not flushed yet."""
+        with self._lock:
+            if self._signature(self.path) == self._written_signature:
+                return  # Our own write
+            try:
+                data = self._read()
+            except ValueError:
+                return  # Keep the last good content
+            data.update(self._pending)
+            self._data = data
+
+    def watch(self):
+        """Reloads the store whenever the file changes on disk. Needs a running Qt application."""
+        if self._watcher is not None:
+            return
+        from PyQt6.QtCore import QFileSystemWatcher
+
+        self._watcher = QFileSystemWatcher()
+        if os.path.exists(self.path):
+            self._watcher.addPath(self.path)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+
+    def _on_file_changed(self, path):
+        # Atomic replaces (ours and other instances') drop the file from the watcher
+        if os.path.exists(path) and path not in self._watcher.files():
+            self._watcher.addPath(path)
+        self.reload()
+
 
 class EnvironmentManager:
     def __init__(self, json_file=f'resources/user_config.json'):
         """Initialize the EnvironmentManager with a given JSON file."""
         self.json_file = json_file
+        self.store = ConfigStore.for_file(json_file)
 
     def load_data(self):
-        """Loads data from the JSON file if it exists, returns an empty dictionary if not."""
-        if os.path.exists(self.json_file):
-            with open(self.json_file, 'r') as f:
-                return json.load(f)
-        return {}
+        """Returns a copy of all settings, an empty dictionary if the file does not exist."""
+        return self.store.snapshot()
 
     def save_data(self, data):
-        try:
-            with open(self.json_file, 'r') as f:
-                existing_data = json.load(f)
-        except FileNotFoundError:
-            existing_data = {}
-
-        existing_data.update(data)
-
-        with open(self.json_file, 'w') as f:
-            json.dump(existing_data, f, indent=4)
+        """Merges the given settings into the config; written back in the background."""
+        self.store.update(data)
 
     def get(self, key):
         """Returns the value of the variable by key, or None if the key doesn't exist."""
-        data = self.load_data()
-        return data.get(key, None)
+        return self.store.get(key)
 
     def set(self, key, value):
         """Sets or updates a variable with a given key and value."""
-        data = self.load_data()
-        data[key] = value
-        self.save_data(data)
+        self.store.update({key: value})
+
+    def flush(self):
+        """Writes pending changes to disk immediately."""
+        self.store.flush()
+
+    def watch(self):
+        """Picks up changes made to the config file by another instance."""
+        self.store.watch()
 
 # Example usage
 EnvironmentManager(f'resources/user_config.json').get('default_directory')
@@ -1,7 +1,46 @@
+import threading
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import QMessageBox
 from log_manager import LogManager
 
 class ErrorHandler:
+    _thread_state = threading.local()
+
+    @staticmethod
+    @contextmanager
+    def headless():
+        """
+        Suppress GUI prompts for errors raised on the current thread.
+        Used by background parsing, where non-critical errors are logged and skipped.
+        """
+        previous = getattr(ErrorHandler._thread_state, 'headless', False)
+        ErrorHandler._thread_state.headless = True
+        try:
+            yield
+        finally:
+            ErrorHandler._thread_state.headless = previous
+
+    @staticmethod
+    @contextmanager
+    def collecting(errors):
+        """
+        Record errors raised on the current thread into the list `errors`, as
+        (file path, line number, line content, message, error level), instead of logging or prompting.
+        Critical errors still raise after being recorded. Used by the lint tool and the Raw tab.
+        """
+        previous = getattr(ErrorHandler._thread_state, 'collected', None)
+        ErrorHandler._thread_state.collected = errors
+        try:
+            yield errors
+        finally:
+            ErrorHandler._thread_state.collected = previous
+
+    @staticmethod
+    def is_headless():
+        """Returns True if errors on the current thread must not open dialogs."""
+        return getattr(ErrorHandler._thread_state, 'headless', False)
+
     @staticmethod
     def raise_error(file_path, line_number, line_content, error_message, error_level=1):
         """
@@ -13,12 +52,19 @@ class ErrorHandler:
         :param error_message: Description of the error.
         :param error_level: Severity level of the error (1: Critical, 2: Non-critical, 3+: Log only).
         """
-        log_manager = LogManager()  # Get the singleton log manager
-
         error_details = (f"Error in file '{file_path}'\n"
                          f"At line {line_number + 1}: {error_message}.\n"
                          f"Line content: `{line_content}`")
 
+        collected = getattr(ErrorHandler._thread_state, 'collected', None)
+        if collected is not None:
+            collected.append((file_path, line_number, line_content, str(error_message), error_level))
+            if error_level == 1:
+                raise ValueError(error_details)
+            return
+
+        log_manager = LogManager()  # Get the singleton log manager
+
         if error_level == 1:
             # Critical error
             log_manager.log(f"Critical Error: {error_details}", level="ERROR")
@@ -26,6 +72,9 @@ class ErrorHandler:
         elif error_level == 2:
             # Non-critical error, show GUI dialog for skipping or aborting
             log_manager.log(f"Non-Critical Error: {error_details}", level="WARNING")
+            if ErrorHandler.is_headless():
+                # No user to ask on background threads, skip like the CLI tools do
+                return
             response = QMessageBox.warning(
                 None,  # Parent widget, None for a toplevel dialog
                 "Non-Critical Error",
@@ -1,6 +1,6 @@
 import os
 from PyQt6.QtWidgets import QTreeView, QMenu, QMessageBox, QInputDialog, QLineEdit, QItemDelegate
-from PyQt6.QtCore import QDir, QModelIndex, QRegularExpression, pyqtSignal
+from PyQt6.QtCore import QDir, QModelIndex, QRegularExpression, QTimer, pyqtSignal
 from PyQt6.QtGui import QFileSystemModel, QDrag, QRegularExpressionValidator
 from PyQt6.QtCore import Qt, QMimeData
 import shutil
@@ -9,6 +9,7 @@ class FileTree(QTreeView):
     # Define a new signal to notify MainWindow when a file is selected
     file_selected_signal = pyqtSignal(str)
     folder_selected_signal = pyqtSignal(str)
+    file_hovered_signal = pyqtSignal(str)  # A WND file the user rests the mouse on (likely to be opened next)
 
     def __init__(self, parent=None, main_window=None):
         super().__init__(parent)
@@ -16,21 +17,8 @@ class FileTree(QTreeView):
         # Store the reference to the MainWindow
         self.main_window = main_window
 
-        # Create a file system model
-        self.model = QFileSystemModel()
-        self.model.setReadOnly(False)
-
-        # Filter files: show only .wnd files
-        self.model.setNameFilters(["*.wnd"])
-        self.model.setNameFilterDisables(False)
-
-        # Filter all files and directories, excluding hidden ones (starting with dot) and .., .
-        self.model.setFilter(QDir.Filter.AllDirs | QDir.Filter.Files | QDir.Filter.NoDotAndDotDot)
-
-        # Set the model to the tree view
-        self.setModel(self.model)
-        # Add the root directory for browsing (initially set to the current directory)
-        self.set_root_path(QDir.currentPath())
+        # The file system model is created when the first root path is set, which starts the directory scan
+        self.model = None
 
         # Allow expanding and collapsing of directories
         self.setExpandsOnDoubleClick(True)
@@ -38,6 +26,15 @@ class FileTree(QTreeView):
         self.doubleClicked.connect(self.handle_double_click)  # Double click handling
         self.clicked.connect(self.handle_single_click)  # Single click handling
 
+        # Report hovered WND files after a short rest, so sweeping over the tree does not flood the signal
+        self.setMouseTracking(True)
+        self._hovered_path = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(150)
+        self._hover_timer.timeout.connect(self._emit_hovered_file)
+        self.entered.connect(self.handle_hover)
+
         # Set the delegate for renaming files
         self.delegate = FileNameDelegate(self)
         self.setItemDelegate(self.delegate)
@@ -50,6 +47,26 @@ class FileTree(QTreeView):
         self.setHeaderHidden(True)
         # self.setColumnWidth(0, 250)  # Limit the width of the file column
 
+        # Enable drag and drop
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setDropIndicatorShown(True)
+
+    def _create_model(self):
+        # Create a file system model
+        self.model = QFileSystemModel()
+        self.model.setReadOnly(False)
+
+        # Filter files: show only .wnd files
+        self.model.setNameFilters(["*.wnd"])
+        self.model.setNameFilterDisables(False)
+
+        # Filter all files and directories, excluding hidden ones (starting with dot) and .., .
+        self.model.setFilter(QDir.Filter.AllDirs | QDir.Filter.Files | QDir.Filter.NoDotAndDotDot)
+
+        # Set the model to the tree view
+        self.setModel(self.model)
+
         # Limit the width of the file column
         self.setColumnWidth(0, 250)
 
@@ -57,13 +74,14 @@ class FileTree(QTreeView):
         for column in range(1, self.model.columnCount()):
             self.hideColumn(column)
 
-        # Enable drag and drop
-        self.setDragEnabled(True)
-        self.setAcceptDrops(True)
-        self.setDropIndicatorShown(True)
+    def root_path(self):
+        """The current root folder, or an empty string before one is set."""
+        return self.model.rootPath() if self.model is not None else ""
 
     def set_root_path(self, path):
         """Set the root path for the tree view, filter out '.' and '..' directories"""
+        if self.model is None:
+            self._create_model()
         self.model.setRootPath(path)
         self.setRootIndex(self.model.index(path))
 
@@ -73,8 +91,49 @@ class FileTree(QTreeView):
         # Ensure the root path is always displayed in the tree view
         self.setRootIndex(self.model.index(path))  # This ensures the root directory is set properly
 
+    def handle_hover(self, index):
+        file_path = self.model.filePath(index) if index.isValid() else None
+        if file_path and file_path.endswith(".wnd"):
+            self._hovered_path = file_path
+            self._hover_timer.start()
+        else:
+            self._hovered_path = None
+            self._hover_timer.stop()
+
+    def _emit_hovered_file(self):
+        if self._hovered_path:
+            self.file_hovered_signal.emit(self._hovered_path)
+
+    def leaveEvent(self, event):
+        self._hovered_path = None
+        self._hover_timer.stop()
+        super().leaveEvent(event)
+
+    @staticmethod
+    def sibling_files(file_path, count):
+        """Returns up to `count` WND files next to file_path in its folder, nearest first (following ones first)."""
+        folder = os.path.dirname(file_path)
+        try:
+            names = sorted((n for n in os.listdir(folder) if n.lower().endswith(".wnd")), key=str.lower)
+        except OSError:
+            return []
+
+        name = os.path.basename(file_path)
+        if name not in names:
+            return []
+        position = names.index(name)
+        following = names[position + 1:]
+        preceding = names[:position][::-1]
+
+        siblings = []
+        for distance in range(max(len(following), len(preceding))):
+            siblings.extend(group[distance] for group in (following, preceding) if distance < len(group))
+        return [os.path.join(folder, n) for n in siblings[:count]]
+
     def show_context_menu(self, pos):
         """Show context menu for file operations (e.g., add, delete)"""
+        if self.model is None:
+            return
 
         index = self.indexAt(pos)
         if index.isValid():
@@ -273,7 +332,7 @@ class FileTree(QTreeView):
 
     def dropEvent(self, event):
         """Handles drop event"""
-        if not event.mimeData().hasText():
+        if self.model is None or not event.mimeData().hasText():
             return
 
         source_file_path = event.mimeData().text()
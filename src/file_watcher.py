@@ -0,0 +1,123 @@
+import hashlib
+import os
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from log_manager import LogManager
+
+
+class FileWatcher(QObject):
+    """
+    Watches the project folder and the open document for external edits.
+
+    File system notifications are debounced, and only the files that were reported are re-hashed.
+    A file is only reported as changed when its content differs from the last known hash,
+    so touching a file or rewriting it with identical content is ignored.
+    """
+    files_changed_signal = pyqtSignal(list)  # Paths whose content changed on disk
+
+    def __init__(self, parent=None, debounce_ms=300):
+        super().__init__(parent)
+        self.log_manager = LogManager()
+        self.root_path = None
+        self.known_hashes = {}  # path -> sha1 of the last known content
+        self._pending_paths = set()
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_file_changed)
+        self.watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._flush_pending)
+
+    @staticmethod
+    def hash_file(path):
+        """Returns the sha1 hex digest of a file, or None if it cannot be read."""
+        try:
+            with open(path, 'rb') as file:
+                return hashlib.sha1(file.read()).hexdigest()
+        except OSError:
+            return None
+
+    def watch_root(self, root_path):
+        """Replaces the watched project folder, including all sub folders and their WND files."""
+        self._unwatch_all()
+        self.root_path = root_path
+        if not root_path or not os.path.isdir(root_path):
+            return
+
+        directories = []
+        files = []
+        for dir_path, _, file_names in os.walk(root_path):
+            directories.append(dir_path)
+            files.extend(os.path.join(dir_path, f) for f in file_names if f.lower().endswith('.wnd'))
+
+        self.watcher.addPaths(directories)
+        if files:
+            self.watcher.addPaths(files)
+
+    def watch_file(self, path):
+        """Watches a single file (e.g. an open document outside the project folder)."""
+        if path and os.path.isfile(path) and path not in self.watcher.files():
+            self.watcher.addPath(path)
+
+    def remember(self, path, content_hash=None):
+        """Records the current on-disk content of a file as known (after loading or saving it)."""
+        if not path:
+            return
+        self.known_hashes[os.path.normpath(path)] = content_hash or self.hash_file(path)
+        self.watch_file(path)
+
+    def is_known_content(self, path):
+        """True if the file on disk still matches the last remembered content."""
+        known = self.known_hashes.get(os.path.normpath(path))
+        return known is not None and known == self.hash_file(path)
+
+    def _unwatch_all(self):
+        watched = self.watcher.files() + self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+
+    def _on_file_changed(self, path):
+        # Editors that save atomically replace the file, which drops it from the watcher
+        if os.path.exists(path) and path not in self.watcher.files():
+            self.watcher.addPath(path)
+        self._queue(path)
+
+    def _on_directory_changed(self, dir_path):
+        """A file was added, removed or renamed: start watching any new WND files."""
+        try:
+            entries = os.listdir(dir_path)
+        except OSError:
+            return
+
+        watched_files = set(self.watcher.files())
+        for entry in entries:
+            path = os.path.join(dir_path, entry)
+            if os.path.isdir(path):
+                if path not in self.watcher.directories():
+                    self.watcher.addPath(path)
+            elif entry.lower().endswith('.wnd') and path not in watched_files:
+                self.watcher.addPath(path)
+                self._queue(path)
+
+    def _queue(self, path):
+        self._pending_paths.add(os.path.normpath(path))
+        self._debounce_timer.start()
+
+    def _flush_pending(self):
+        """Re-hashes the files collected during the debounce window and reports real changes."""
+        pending, self._pending_paths = self._pending_paths, set()
+        changed = []
+        for path in sorted(pending):
+            new_hash = self.hash_file(path)
+            if new_hash is not None and new_hash == self.known_hashes.get(path):
+                continue
+            self.known_hashes[path] = new_hash
+            changed.append(path)
+
+        if changed:
+            self.log_manager.log(f"Files changed on disk: {changed}", level="INFO")
+            self.files_changed_signal.emit(changed)
@@ -1,62 +1,157 @@
+import atexit
 import logging
+import logging.handlers
 import os
-import shutil
+import queue
+import sys
+import threading
+import time
 import traceback
-from datetime import datetime
+
+from src.environment_manager import EnvironmentManager
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets at most `max_per_second` records per log call site through, then reports how many were dropped.
+    Keeps hot paths (selection changes, per-line parser diagnostics) from flooding the log.
+    Errors are never dropped.
+    """
+
+    def __init__(self, max_per_second=20):
+        super().__init__()
+        self.max_per_second = max_per_second
+        self._windows = {}  # (pathname, lineno) -> [window start, passed count, suppressed count]
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if self.max_per_second <= 0 or record.levelno >= logging.ERROR:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= 1.0:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.getMessage()} ({suppressed} similar message(s) suppressed)"
+                    record.args = None
+                return True
+            if window[1] < self.max_per_second:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
 
 class LogManager:
+    """
+    Application-wide logging.
+
+    Records are put on a queue by a QueueHandler and written by a QueueListener thread, so logging
+    never blocks the GUI thread on file or console I/O. Every calling module logs to its own
+    'genwnd.<module>' logger, which allows per-subsystem levels. Configured by the "logging" key
+    of the user config, e.g. {"level": "INFO", "subsystems": {"error_handler": "WARNING"}}.
+    """
     _instance = None
     _log_initialized = False  # Flag to track initialization
+    _init_lock = threading.Lock()
+
+    log_file = "logs/log_current.log"
+    default_config = {
+        "level": "INFO",
+        "subsystems": {},
+        "max_bytes": 2 * 1024 * 1024,  # Size-based rotation
+        "backup_count": 3,
+        "rate_limit_per_second": 20,
+        "console": True,
+    }
+    _levels = {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL
+    }
 
     def __new__(cls, *args, **kwargs):
         """Singleton pattern to ensure only one instance of LogManager"""
         if not cls._instance:
             cls._instance = super(LogManager, cls).__new__(cls, *args, **kwargs)
+            cls._instance._loggers = {}
+            cls._instance._listener = None
         return cls._instance
 
     def _initialize_log(self):
-        """Initialize the log configuration"""
-        if LogManager._log_initialized:
-            return  # Skip if already initialized
-
-        log_dir = 'logs'
-        os.makedirs(log_dir, exist_ok=True)
-
-        # If log_current.log exists, move it to log_current_old.log
-        if os.path.exists("logs/log_current.log"):
-            if os.path.exists("logs/log_current_old.log"):
-                os.remove("logs/log_current_old.log")  # Remove the old backup log if it exists
-            try:
-                shutil.move("logs/log_current.log", "logs/log_current_old.log")
-            except PermissionError as e:
-                print(f"Error moving log file: {e}")
-                # Optionally, log the exception instead of printing
-                # logging.exception("Error moving log file")
-
-        # Set up logging to the current log file
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            handlers=[logging.FileHandler("logs/log_current.log"), logging.StreamHandler()]
-        )
-
-        LogManager._log_initialized = True  # Mark as initialized
-
-    def log(self, message, level="INFO"):
-        """Log the given message at the specified level"""
+        """Initialize the queue handler, the background listener and the rotating log file"""
+        with LogManager._init_lock:
+            if LogManager._log_initialized:
+                return  # Skip if already initialized
+
+            config = dict(self.default_config)
+            config.update(EnvironmentManager('resources/user_config.json').get('logging') or {})
+
+            os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
+            handlers = [logging.handlers.RotatingFileHandler(
+                self.log_file, maxBytes=config["max_bytes"], backupCount=config["backup_count"], encoding='utf-8')]
+            if config["console"]:
+                handlers.append(logging.StreamHandler())
+            for handler in handlers:
+                handler.setFormatter(formatter)
+
+            log_queue = queue.SimpleQueue()
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.addFilter(RateLimitFilter(config["rate_limit_per_second"]))
+
+            root_logger = logging.getLogger("genwnd")
+            root_logger.handlers.clear()
+            root_logger.addHandler(queue_handler)
+            root_logger.setLevel(self._levels.get(str(config["level"]).upper(), logging.INFO))
+            root_logger.propagate = False
+            for subsystem, level in config["subsystems"].items():
+                logging.getLogger(f"genwnd.{subsystem}").setLevel(self._levels.get(str(level).upper(), logging.INFO))
+
+            self._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+            atexit.register(self.shutdown)
+
+            LogManager._log_initialized = True  # Mark as initialized
+
+    def shutdown(self):
+        """Flushes pending records and stops the background listener"""
+        with LogManager._init_lock:
+            if self._listener is None:
+                return
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+            logging.getLogger("genwnd").handlers.clear()
+            LogManager._log_initialized = False
+
+    def _get_logger(self, subsystem):
+        logger = self._loggers.get(subsystem)
+        if logger is None:
+            name = "main" if subsystem == "__main__" else subsystem.rsplit('.', 1)[-1]
+            logger = self._loggers[subsystem] = logging.getLogger(f"genwnd.{name}")
+        return logger
+
+    def log(self, message, level="INFO", subsystem=None):
+        """
+        Log the given message at the specified level
+        :param subsystem: Name used for per-subsystem levels, defaults to the calling module (e.g. 'property_editor').
+        """
         if not LogManager._log_initialized:
             self._initialize_log() # Initialize the log only when needed
 
-        log_function = {
-            "DEBUG": logging.debug,
-            "INFO": logging.info,
-            "WARNING": logging.warning,
-            "ERROR": logging.error,
-            "CRITICAL": logging.critical
-        }.get(level.upper(), logging.info)
-
-        log_function(message)
+        logger = self._get_logger(subsystem or sys._getframe(1).f_globals.get('__name__', 'app'))
+        level_number = self._levels.get(level.upper(), logging.INFO)
+        if logger.isEnabledFor(level_number):
+            logger.log(level_number, message, stacklevel=2)
 
     def log_exception(self, exception):
         """Log an exception with stack trace"""
@@ -64,4 +159,4 @@ class LogManager:
             self._initialize_log() # Initialize the log only when needed
         error_message = f"Exception: {str(exception)}"
         stack_trace = traceback.format_exc()
-        logging.critical(f"{error_message}\nStack Trace:\n{stack_trace}")
\ No newline at end of file
+        logging.getLogger("genwnd").critical(f"{error_message}\nStack Trace:\n{stack_trace}", stacklevel=2)
@@ -2,20 +2,29 @@ import sys
 import os
 import traceback
 
+from src.startup_profiler import startup_profiler
+
+if "--profile-startup" in sys.argv:
+    startup_profiler.enable()  # Before the imports below, so they are timed too
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QHBoxLayout, QWidget, QMenuBar, QFileDialog,
-    QPushButton, QToolBar, QSplitter, QLabel, QVBoxLayout, QStatusBar, QMessageBox
+    QPushButton, QToolBar, QSplitter, QLabel, QVBoxLayout, QStatusBar, QMessageBox, QTabBar
 )
-from PyQt6.QtGui import QAction, QIcon, QUndoStack
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QAction, QIcon, QUndoStack, QUndoGroup
+from PyQt6.QtCore import Qt, QTimer
 
-from commands import CommandChangeGeometry
+from commands import CommandChangeGeometry, set_screen_rect
 from object_tree import ObjectTree
 from file_tree import FileTree
 from property_editor import PropertyEditor
+from src.document_manager import DocumentManager
 from src.environment_manager import EnvironmentManager
-from src.setting import SettingsWidget
-from src.window.wnd_parser import WndParser
+from src.file_watcher import FileWatcher
+from src.memory_diagnostics import memory_diagnostics
+from src.parse_cache import ParseCache, ParsePrefetcher
+from src.project_index import ProjectIndex, ProjectIndexer
+from src.tracing import traced, tracer
 from log_manager import LogManager
 from visual_preview import VisualPreview
 
@@ -28,34 +37,83 @@ class MainWindow(QMainWindow):
         self.resize(1200, 800)
 
         # Environment & State
-        self.default_directory = EnvironmentManager('resources/user_config.json').get(
-            'default_directory') or os.path.expanduser("~/Documents")
+        self.config = EnvironmentManager('resources/user_config.json')
+        self.config.watch()
+        self.default_directory = self.config.get('default_directory') or os.path.expanduser("~/Documents")
         self.log_manager = LogManager()
-        self.settings_widget = SettingsWidget()
+        self._settings_widget = None  # Built on first use
 
-        self.selected_file = None
         self.selected_object = None
-        self.parser = None
-        self.is_modified = False
+        self.selected_objects = []  # Set instead of selected_object while several objects are selected
         self.show_labels = True
 
         # Setup exception handling globally
         sys.excepthook = self.handle_exception
 
-        # Initialize Undo Stack
-        self.undo_stack = QUndoStack(self)
+        # Open documents, each with its own undo stack. The group routes Undo/Redo to the active one,
+        # and the idle stack stands in while no document is open.
+        self.undo_group = QUndoGroup(self)
+        self._idle_undo_stack = QUndoStack(self.undo_group)
+        self.undo_group.addStack(self._idle_undo_stack)
+        self.undo_group.setActiveStack(self._idle_undo_stack)
+
+        self.parse_cache = ParseCache()
+        self.documents = DocumentManager(self.undo_group, self.parse_cache)
+        self.active_document = None
+
+        # Speculative parsing of files the user is likely to open next (hovered or next to the opened one)
+        self.parse_prefetcher = ParsePrefetcher(self.parse_cache, self)
+        self.prefetch_sibling_count = 3
+
+        # Project-wide symbol index, kept up to date in the background
+        self.project_index = ProjectIndex('resources/project_index.db')
+        self.project_indexer = ProjectIndexer(self.project_index, self)
+        self._usage_search_widget = None  # Built on first use
+        self._memory_diagnostics_widget = None  # Built on first use
+
+        # Reacts to external edits of project files and the open document
+        self.file_watcher = FileWatcher(self)
 
         # Enable Drag & Drop
         self.setAcceptDrops(True)
 
         # Build UI Components
-        self._setup_menus()
-        self._setup_toolbars()
-        self._setup_ui_layout()
+        with startup_profiler.section("Menus"):
+            self._setup_menus()
+        with startup_profiler.section("Toolbars"):
+            self._setup_toolbars()
+        with startup_profiler.section("Panels"):
+            self._setup_ui_layout()
         self._connect_signals()
 
         # Load styles
-        self.load_styles()
+        with startup_profiler.section("Stylesheet"):
+            self.load_styles()
+
+        # The project folder is scanned (file tree, index, watcher) once the window is on screen
+        QTimer.singleShot(0, lambda: self.set_project_root(self.default_directory))
+
+    @property
+    def settings_widget(self):
+        if self._settings_widget is None:
+            from src.setting import SettingsWidget
+            self._settings_widget = SettingsWidget()
+        return self._settings_widget
+
+    @property
+    def usage_search_widget(self):
+        if self._usage_search_widget is None:
+            from src.usage_search import UsageSearchWidget
+            self._usage_search_widget = UsageSearchWidget(self.project_index)
+            self._usage_search_widget.file_requested_signal.connect(self.select_file)
+        return self._usage_search_widget
+
+    @property
+    def memory_diagnostics_widget(self):
+        if self._memory_diagnostics_widget is None:
+            from src.memory_diagnostics import MemoryDiagnosticsWidget
+            self._memory_diagnostics_widget = MemoryDiagnosticsWidget(self)
+        return self._memory_diagnostics_widget
 
     def _setup_menus(self):
         """Initializes the top File and Edit menus."""
@@ -89,16 +147,39 @@ class MainWindow(QMainWindow):
 
         # Edit Menu (Undo/Redo)
         edit_menu = menu_bar.addMenu("Edit")
-        self.undo_action = self.undo_stack.createUndoAction(self, "Undo")
+        self.undo_action = self.undo_group.createUndoAction(self, "Undo")
         self.undo_action.setShortcut("Ctrl+Z")
         self.undo_action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
 
-        self.redo_action = self.undo_stack.createRedoAction(self, "Redo")
+        self.redo_action = self.undo_group.createRedoAction(self, "Redo")
         self.redo_action.setShortcut("Ctrl+Y")
         self.redo_action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
 
         edit_menu.addAction(self.undo_action)
         edit_menu.addAction(self.redo_action)
+        edit_menu.addSeparator()
+
+        find_usages_action = QAction("Find Usages", self)
+        find_usages_action.setShortcut("Ctrl+Shift+F")
+        find_usages_action.triggered.connect(self.open_usage_search)
+        edit_menu.addAction(find_usages_action)
+
+        validate_action = QAction("Validate Document", self)
+        validate_action.setShortcut("Ctrl+Shift+V")
+        validate_action.triggered.connect(self.validate_document)
+        edit_menu.addAction(validate_action)
+
+        # Diagnostics Menu
+        diagnostics_menu = menu_bar.addMenu("Diagnostics")
+        self.record_trace_action = QAction("Record Trace", self)
+        self.record_trace_action.setCheckable(True)
+        self.record_trace_action.setChecked(tracer.enabled)
+        self.record_trace_action.toggled.connect(self.toggle_trace_recording)
+        diagnostics_menu.addAction(self.record_trace_action)
+
+        memory_report_action = QAction("Memory Report", self)
+        memory_report_action.triggered.connect(self.open_memory_diagnostics)
+        diagnostics_menu.addAction(memory_report_action)
 
         self.addAction(self.undo_action)
         self.addAction(self.redo_action)
@@ -129,9 +210,9 @@ class MainWindow(QMainWindow):
     def _setup_ui_layout(self):
         """Creates and arranges the main layout splitters and panels."""
         # File Tree Panel
-        self.file_tree = FileTree(self, main_window=self)
-        self.file_tree.setMinimumWidth(250)
-        self.file_tree.set_root_path(self.default_directory)
+        with startup_profiler.section("FileTree"):
+            self.file_tree = FileTree(self, main_window=self)
+            self.file_tree.setMinimumWidth(250)
 
         self.root_path_label = QLabel()
         self.root_path_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -144,26 +225,44 @@ class MainWindow(QMainWindow):
         file_tree_widget.setLayout(file_tree_layout)
 
         # Object Tree Panel
-        self.object_tree = ObjectTree(self, main_window=self)
-        self.object_tree.tree_view.setHeaderHidden(True)
-        self.object_tree.setMinimumWidth(300)
+        with startup_profiler.section("ObjectTree"):
+            self.object_tree = ObjectTree(self, main_window=self)
+            self.object_tree.tree_view.setHeaderHidden(True)
+            self.object_tree.setMinimumWidth(300)
 
         # Property Editor Panel
-        self.property_editor = PropertyEditor(self, main_window=self)
+        with startup_profiler.section("PropertyEditor"):
+            self.property_editor = PropertyEditor(self, main_window=self)
 
         # Ensure property editor hierarchy also receives the global shortcuts
         self.property_editor.addAction(self.undo_action)
         self.property_editor.addAction(self.redo_action)
 
         # Visual Preview (Canvas)
-        self.visual_preview = VisualPreview(self)
-        self.visual_preview.setMinimumWidth(300)
+        with startup_profiler.section("VisualPreview"):
+            self.visual_preview = VisualPreview(self)
+            self.visual_preview.setMinimumWidth(300)
+
+        # Open document tabs above the canvas
+        self.document_tabs = QTabBar()
+        self.document_tabs.setTabsClosable(True)
+        self.document_tabs.setMovable(True)
+        self.document_tabs.setDocumentMode(True)
+        self.document_tabs.setExpanding(False)
+
+        canvas_layout = QVBoxLayout()
+        canvas_layout.setContentsMargins(0, 0, 0, 0)
+        canvas_layout.setSpacing(0)
+        canvas_layout.addWidget(self.document_tabs)
+        canvas_layout.addWidget(self.visual_preview)
+        canvas_widget = QWidget()
+        canvas_widget.setLayout(canvas_layout)
 
         # Main Splitter setup
         splitter = QSplitter(Qt.Orientation.Horizontal)
         splitter.addWidget(file_tree_widget)  # Index 0
         splitter.addWidget(self.object_tree)  # Index 1
-        splitter.addWidget(self.visual_preview)  # Index 2
+        splitter.addWidget(canvas_widget)  # Index 2
         splitter.addWidget(self.property_editor)  # Index 3
 
         # Default widths in pixels
@@ -201,6 +300,7 @@ class MainWindow(QMainWindow):
         # Panel Selection Signals
         self.file_tree.file_selected_signal.connect(self.select_file)
         self.file_tree.folder_selected_signal.connect(self.select_folder)
+        self.file_tree.file_hovered_signal.connect(self.prefetch_files)
         self.object_tree.objects_selected_signal.connect(self.select_objects_from_tree)
 
         # Canvas <-> Data Sync Signals
@@ -209,6 +309,36 @@ class MainWindow(QMainWindow):
         self.visual_preview.item_moved_signal.connect(self.handle_canvas_item_moved)
         self.visual_preview.bulk_geometry_change_signal.connect(self.handle_bulk_geometry_change)
 
+        # Document tabs
+        self.document_tabs.currentChanged.connect(self._on_document_tab_changed)
+        self.document_tabs.tabCloseRequested.connect(self._on_document_tab_close_requested)
+
+        # Project index & external file changes
+        self.file_watcher.files_changed_signal.connect(self.handle_external_file_changes)
+
+    # --- ACTIVE DOCUMENT STATE ---
+    @property
+    def parser(self):
+        return self.active_document.parser if self.active_document else None
+
+    @property
+    def selected_file(self):
+        return self.active_document.file_path if self.active_document else None
+
+    @property
+    def undo_stack(self):
+        return self.undo_group.activeStack()
+
+    @property
+    def is_modified(self):
+        return self.active_document.is_modified if self.active_document else False
+
+    @is_modified.setter
+    def is_modified(self, modified):
+        if self.active_document:
+            self.active_document.is_modified = modified
+            self._update_document_tab(self.active_document)
+
     # --- UI ACTIONS ---
     def toggle_file_tree_visibility(self):
         self.file_tree.setVisible(not self.file_tree.isVisible())
@@ -221,7 +351,7 @@ class MainWindow(QMainWindow):
 
     def update_status_bar(self):
         """Updates the status bar with the active root path, file, and object info."""
-        root_path = self.file_tree.model.rootPath()
+        root_path = self.file_tree.root_path()
         root_path_info = f"Root: {os.path.basename(root_path)}" if root_path else "Root: Not available"
 
         file_name = f"File: {os.path.basename(self.selected_file)}" if self.selected_file else "No file selected"
@@ -279,6 +409,50 @@ class MainWindow(QMainWindow):
     def open_settings(self):
         self.settings_widget.show()
 
+    def open_usage_search(self):
+        """Opens the Find Usages window, pre-filled with the selected object's name."""
+        if self.selected_object and hasattr(self.selected_object, 'properties'):
+            self.usage_search_widget.search(self.selected_object.properties.get('NAME', ''))
+        self.usage_search_widget.show()
+        self.usage_search_widget.raise_()
+
+    def validate_document(self):
+        """Runs the validation rules on the windows of the active document that changed since the last run."""
+        if not self.parser:
+            self.status_bar.showMessage("No document to validate.")
+            return
+
+        issues, checked = self.parser.validator.revalidate(self.parser.get_windows())
+        for issue in issues:
+            self.log_manager.log(f"Validation ({issue.rule}): {issue!r}", level="WARNING")
+
+        summary = f"{len(issues)} validation issue(s), {checked} window(s) checked."
+        self.status_bar.showMessage(summary)
+        if issues:
+            message = QMessageBox(QMessageBox.Icon.Warning, "Validate Document", summary, parent=self)
+            message.setDetailedText("\n\n".join(repr(issue) for issue in issues))
+            message.exec()
+
+    def toggle_trace_recording(self, checked):
+        """Starts recording timing spans, or stops and exports them as a Chrome trace for a bug report."""
+        if checked:
+            tracer.start()
+            self.status_bar.showMessage("Recording trace... uncheck Diagnostics > Record Trace to export it.")
+            return
+
+        tracer.stop()
+        path, _ = QFileDialog.getSaveFileName(self, "Export Trace", "genwnd_trace.json",
+                                              "Chrome Trace (*.json);;All Files (*)")
+        if path:
+            count = tracer.export_chrome_trace(path)
+            self.log_manager.log(f"Exported {count} trace spans to {path}", level="INFO")
+            self.status_bar.showMessage(f"Trace exported to {path}")
+
+    def open_memory_diagnostics(self):
+        """Opens the memory report of the open documents (model, undo stack, canvas and tree) and leaked items."""
+        self.memory_diagnostics_widget.show()
+        self.memory_diagnostics_widget.raise_()
+
     # --- SELECTION & SYNC LOGIC ---
     def select_objects_from_tree(self, window_objects):
         """Triggered when the user changes selection in the Object Tree."""
@@ -301,15 +475,16 @@ class MainWindow(QMainWindow):
 
     def _update_selection_state(self, window_objects):
         """Centralized handler to load properties and update the status bar."""
+        self.selected_objects = list(window_objects) if len(window_objects) > 1 else []
         if len(window_objects) == 1:
             self.selected_object = window_objects[0]
             self.update_status_bar()
             self.load_object_property()
-            self.log_manager.log(f"Object selected: {self.selected_object.properties.get('NAME', 'Unnamed')}", level="INFO")
+            self.log_manager.log(f"Object selected: {self.selected_object.properties.get('NAME', 'Unnamed')}", level="DEBUG")
         elif len(window_objects) > 1:
             self.selected_object = None
-            self.property_editor.clear()
-            self.status_bar.showMessage(f"{len(window_objects)} objects selected. Properties disabled.")
+            self.property_editor.load_properties(window_objects)
+            self.status_bar.showMessage(f"{len(window_objects)} objects selected. Editing shared properties.")
         else:
             self.selected_object = None
             self.property_editor.clear()
@@ -318,31 +493,15 @@ class MainWindow(QMainWindow):
     def handle_canvas_item_moved(self, window, ul, br):
         """Triggered when an item is dynamically dragged/resized on the visual preview."""
         # 1. Update underlying dictionary data
-        if 'SCREENRECT' not in window.properties:
-            window.properties['SCREENRECT'] = {}
-        window.properties['SCREENRECT']['UPPERLEFT'] = list(ul)
-        window.properties['SCREENRECT']['BOTTOMRIGHT'] = list(br)
+        set_screen_rect(window, list(ul), list(br))
 
         # 2. Trigger save state
         self.update_modified_state(True)
+        self.invalidate_validation([window])
 
         # 3. Synchronize active spinboxes in Property Editor without firing undo commands
         if self.selected_object and getattr(self.selected_object, 'window_uuid', None) == window.window_uuid:
-            if hasattr(self.property_editor, 'general_properties'):
-                gp = self.property_editor.general_properties
-                w = max(0, br[0] - ul[0])
-                h = max(0, br[1] - ul[1])
-                for spinbox, val in [
-                    (gp.upper_left_x_spinbox, ul[0]),
-                    (gp.upper_left_y_spinbox, ul[1]),
-                    (gp.bottom_right_x_spinbox, br[0]),
-                    (gp.bottom_right_y_spinbox, br[1]),
-                    (gp.width_spinbox, w),
-                    (gp.height_spinbox, h)
-                ]:
-                    spinbox.blockSignals(True)
-                    spinbox.setValue(val)
-                    spinbox.blockSignals(False)
+            self.property_editor.show_geometry(ul, br)
 
     def handle_object_added(self, window_object):
         """Routes object addition to the Tree and Canvas."""
@@ -363,6 +522,39 @@ class MainWindow(QMainWindow):
             self.selected_object = None
             self.property_editor.clear()
             self.update_status_bar()
+        elif any(window.window_uuid == window_uuid for window in self.selected_objects):
+            self.selected_objects = []
+            self.property_editor.clear()
+            self.update_status_bar()
+
+    def handle_property_changed(self, window, prop_key):
+        """Routes a single property change to the Property Editor and, for names and geometry, the Tree and Canvas."""
+        self.handle_properties_changed([window], prop_key)
+
+    def handle_properties_changed(self, windows, prop_key):
+        """Routes a property change of one or more windows to the Property Editor, Tree and Canvas in one pass."""
+        self.invalidate_validation(windows)
+        if prop_key in ('NAME', 'WINDOWTYPE'):
+            self.object_tree.update_item_labels(windows)
+            if hasattr(self, 'visual_preview'):
+                for window in windows:
+                    self.visual_preview.update_item_label(window)
+        elif prop_key == 'SCREENRECT' and hasattr(self, 'visual_preview'):
+            for window in windows:
+                self.visual_preview.update_item_geometry_from_data(window)
+
+        changed = {window.window_uuid for window in windows}
+        if self.selected_object and self.selected_object.window_uuid in changed:
+            self.property_editor.property_changed(prop_key)
+            if prop_key == 'NAME':
+                self.update_status_bar()
+        elif any(window.window_uuid in changed for window in self.selected_objects):
+            self.property_editor.multi_properties.refresh()
+
+    def invalidate_validation(self, windows):
+        """Marks edited windows of the active document to be checked again by the next validation run."""
+        if self.parser:
+            self.parser.validator.invalidate(windows)
 
     def handle_bulk_geometry_change(self, macro_name, changes):
         """Pushes a bulk geometry operation as a single Undo macro."""
@@ -373,108 +565,180 @@ class MainWindow(QMainWindow):
         self.undo_stack.endMacro()
 
     # --- FILE & FOLDER OPERATIONS ---
-    def select_file(self, file_path):
-        """Handles selection of a file from the file tree, prompting for save if modified."""
-        if self.is_modified:
-            reply = QMessageBox.question(
-                self, 'Unsaved Changes',
-                "You have unsaved changes. Do you want to save before selecting a new file?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel
-            )
-            if reply == QMessageBox.StandardButton.Yes:
-                self.save_file()
-                self._select_file(file_path)
-            elif reply == QMessageBox.StandardButton.No:
-                self._select_file(file_path)
-        else:
-            self._select_file(file_path)
-
-    def _select_file(self, file_path):
-        """Internal logic to actually load the file after checks."""
-        self.object_tree.clear()
-        self.visual_preview.clear()
-        self.selected_file = file_path
-        self.selected_object = None
-        self.load_wnd_file(file_path)
+    def set_project_root(self, folder):
+        """Points the file tree, the project index and the file watcher at a project folder."""
+        self.file_tree.set_root_path(folder)
+        self.project_indexer.start_indexing(folder)
+        self.file_watcher.watch_root(folder)
         self.update_status_bar()
+
+    def handle_external_file_changes(self, paths):
+        """Updates the project index and offers to reload open documents that another tool rewrote."""
+        self.project_indexer.index_files(paths)
+
+        for path in paths:
+            document = self.documents.get(path)
+            if document is None or not os.path.isfile(path):
+                continue
+            if document is self.active_document:
+                self._prompt_reload_document(document)
+            elif document.is_modified:
+                # Asked when the user switches back to it
+                document.changed_on_disk = True
+            else:
+                # Nothing to lose: drop the stale model, it is parsed again on activation
+                self.parse_cache.discard(path)
+                document.dehydrate()
+
+    def _prompt_reload_document(self, document):
+        document.changed_on_disk = False
+        message = f"'{os.path.basename(document.file_path)}' was changed by another program.\nDo you want to reload it?"
+        if document.is_modified:
+            message += "\n\nYour unsaved changes will be lost."
+        reply = QMessageBox.question(self, 'File Changed on Disk', message,
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            self.log_manager.log(f"Reloading file changed on disk: {document.file_path}", level="INFO")
+            self.load_wnd_file(document.file_path)
+
+    def select_file(self, file_path):
+        """Handles selection of a file from the file tree by opening it, or switching to its tab."""
+        self.open_document(file_path)
         self.log_manager.log(f"File selected: {file_path}", level="INFO")
+        # Browsing usually continues with the neighbouring files
+        self.prefetch_files(self.file_tree.sibling_files(file_path, self.prefetch_sibling_count))
+
+    def prefetch_files(self, file_paths):
+        """Pre-parses files in the background so opening them only has to build the tree and canvas."""
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+        candidates = []
+        for path in file_paths:
+            document = self.documents.get(path)
+            if document is None or not document.is_hydrated:
+                candidates.append(path)
+        self.parse_prefetcher.request(candidates)
 
     def select_folder(self, folder_path):
-        """Handles folder selection and resets file and object selections."""
-        self.selected_file = folder_path
-        self.selected_object = None
-        self.object_tree.clear()
-        self.property_editor.clear()
-        self.visual_preview.clear()
+        """Handles folder selection. Open documents stay open."""
         self.update_status_bar()
         self.log_manager.log(f"Folder selected: {folder_path}", level="INFO")
 
     def open_file(self):
         """Prompts dialog to open a specific WND file."""
-        if self.is_modified:
-            reply = QMessageBox.question(
-                self, 'Unsaved Changes',
-                "You have unsaved changes. Do you want to save before opening a new file?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel
-            )
-            if reply == QMessageBox.StandardButton.Yes:
-                self.save_file()
-                self._open_file()
-            elif reply == QMessageBox.StandardButton.No:
-                self._open_file()
-        else:
-            self._open_file()
-
-    def _open_file(self):
         file, _ = QFileDialog.getOpenFileName(self, "Open File", self.default_directory,
                                               "WND Files (*.wnd);;All Files (*)")
         if file:
             self.log_manager.log(f"File selected: {file}", level="INFO")
-            self.selected_file = file
-            self.selected_object = None
-            self.property_editor.clear()
-            self.object_tree.clear()
-            self.visual_preview.clear()
-            self.update_status_bar()
-            self.load_wnd_file(file)
+            self.open_document(file)
 
             self.default_directory = os.path.dirname(file)
-            EnvironmentManager('resources/user_config.json').set('default_directory', self.default_directory)
+            self.config.set('default_directory', self.default_directory)
 
     def open_folder(self):
         """Prompts dialog to open a specific directory."""
         folder = QFileDialog.getExistingDirectory(self, "Open Folder", self.default_directory)
         if folder:
             self.log_manager.log(f"Folder selected: {folder}", level="INFO")
-            self.file_tree.set_root_path(folder)
-            self.selected_file = folder
-            self.selected_object = None
-            self.property_editor.clear()
-            self.object_tree.clear()
+            self.set_project_root(folder)
             self.update_status_bar()
 
             self.default_directory = folder
-            EnvironmentManager('resources/user_config.json').set('default_directory', folder)
+            self.config.set('default_directory', folder)
 
     def load_wnd_file(self, file_path):
-        """Parses the WND file and populates the UI components."""
-        try:
-            self.selected_file = file_path
+        """Parses the WND file from disk (again), discarding the in-memory model and undo history of its document."""
+        document = self.documents.get(file_path)
+        if document is None:
+            self.open_document(file_path)
+            return
+
+        self.parse_cache.discard(file_path)
+        document.parser = None
+        document.changed_on_disk = False
+        document.undo_stack.clear()
+        self._set_document_modified(document, False)
+
+        if document is self.active_document:
             self.selected_object = None
+            self.selected_objects = []
             self.property_editor.clear()
+            self._build_document_views(document)
+            self.update_status_bar()
+        else:
+            document.release_views()
+            self.activate_document(document)
+
+    # --- DOCUMENTS ---
+    def open_document(self, file_path):
+        """Opens a WND file in its own tab, or switches to the tab if it is already open."""
+        document = self.documents.get(file_path)
+        if document is None:
+            document = self.documents.open(file_path)
+            self.document_tabs.blockSignals(True)
+            index = self.document_tabs.addTab(document.display_name)
+            self.document_tabs.setTabData(index, document)
+            self.document_tabs.setTabToolTip(index, document.file_path)
+            self.document_tabs.blockSignals(False)
+        self.activate_document(document)
+        return document
+
+    def activate_document(self, document):
+        """
+        Makes a document the active one. Hydrated documents swap their tree, canvas and undo stack in
+        without any parsing, dehydrated ones are rebuilt from the parse cache or from disk.
+        """
+        if document is self.active_document:
+            return
+
+        previous = self.active_document
+        canvas_state = self.visual_preview.swap_canvas_state(document.canvas_state)
+        tree_state = self.object_tree.swap_model(document.tree_state)
+        document.canvas_state = document.tree_state = None
+        if previous is not None:
+            previous.canvas_state, previous.tree_state = canvas_state, tree_state
+        else:
+            canvas_state.release()
+
+        self.active_document = document
+        self.documents.touch(document)
+        self.undo_group.setActiveStack(document.undo_stack)
+        self._select_document_tab(document)
 
-            self.parser = WndParser()
-            self.parser.parse_file(file_path)
-            windows = self.parser.get_windows()
+        if not document.is_hydrated:
+            self._build_document_views(document)
+        self.object_tree.update_buttons_state()
+        self.select_objects_from_canvas(self.visual_preview.selected_uuids())
+
+        for dehydrated in self.documents.enforce_budget(document):
+            self.log_manager.log(f"Dehydrated inactive document: {dehydrated.file_path}", level="INFO")
+
+        if document.changed_on_disk:
+            self._prompt_reload_document(document)
+
+    def _build_document_views(self, document):
+        """Loads the model of the active document (parse cache first) and populates the tree and canvas."""
+        try:
+            parser = self.parse_cache.take(document.file_path)
+            if parser is None:
+                from src.window.wnd_parser import WndParser
+
+                document.signature = ParseCache.file_signature(document.file_path)
+                parser = WndParser()
+                parser.parse_file(document.file_path, lossless=True)
+            windows = parser.get_windows()
 
             self.object_tree.load_objects(windows)
             self.visual_preview.load_hierarchy(windows)
-            self.undo_stack.clear()
+            document.hydrate(parser)
+            document.signature = document.signature or ParseCache.file_signature(document.file_path)
 
-            self.log_manager.log(f"Loaded objects from file {file_path}", level="INFO")
+            self.log_manager.log(f"Loaded objects from file {document.file_path}", level="INFO")
             self.update_modified_state(False)
+            self.file_watcher.remember(document.file_path)
 
         except ValueError as e:
+            document.hydrate(None)
             error_msg = f"Error loading file: {e}"
             self.log_manager.log(error_msg, level="ERROR")
             self.object_tree.display_error(error_msg)
@@ -482,6 +746,74 @@ class MainWindow(QMainWindow):
             self.update_status_bar()
             self.visual_preview.clear()
 
+    def close_document(self, document):
+        """Closes a document tab, offering to save unsaved changes. Returns False if the user cancelled."""
+        if document.is_modified:
+            reply = QMessageBox.question(
+                self, 'Unsaved Changes',
+                f"'{os.path.basename(document.file_path)}' has unsaved changes. Do you want to save before closing it?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                if not self.save_document(document):
+                    return False
+            elif reply != QMessageBox.StandardButton.No:
+                return False
+
+        if document is self.active_document:
+            remaining = [d for d in self.documents.documents.values() if d is not document]
+            if remaining:
+                self.activate_document(remaining[-1])  # Most recently used
+            else:
+                document.canvas_state = self.visual_preview.swap_canvas_state()
+                document.tree_state = self.object_tree.swap_model()
+                self.active_document = None
+                self.undo_group.setActiveStack(self._idle_undo_stack)
+                self._update_selection_state([])
+
+        self.document_tabs.blockSignals(True)
+        self.document_tabs.removeTab(self._document_tab_index(document))
+        self.document_tabs.blockSignals(False)
+        if self.active_document:
+            self._select_document_tab(self.active_document)
+
+        self.documents.close(document)
+        self.log_manager.log(f"Document closed: {document.file_path}", level="INFO")
+        return True
+
+    def _document_tab_index(self, document):
+        for index in range(self.document_tabs.count()):
+            if self.document_tabs.tabData(index) is document:
+                return index
+        return -1
+
+    def _select_document_tab(self, document):
+        self.document_tabs.blockSignals(True)
+        self.document_tabs.setCurrentIndex(self._document_tab_index(document))
+        self.document_tabs.blockSignals(False)
+
+    def _update_document_tab(self, document):
+        index = self._document_tab_index(document)
+        if index >= 0:
+            self.document_tabs.setTabText(index, document.display_name)
+            self.document_tabs.setTabToolTip(index, document.file_path)
+
+    def _set_document_modified(self, document, modified):
+        document.is_modified = modified
+        self._update_document_tab(document)
+        if document is self.active_document:
+            self.object_tree.update_buttons_state()
+
+    def _on_document_tab_changed(self, index):
+        document = self.document_tabs.tabData(index) if index >= 0 else None
+        if document is not None:
+            self.activate_document(document)
+
+    def _on_document_tab_close_requested(self, index):
+        document = self.document_tabs.tabData(index)
+        if document is not None:
+            self.close_document(document)
+
     def load_object_property(self):
         """Loads properties of the currently selected object into the Property Editor."""
         if self.selected_object:
@@ -489,29 +821,37 @@ class MainWindow(QMainWindow):
                 self.property_editor.load_property(self.selected_object)
                 self.log_manager.log(
                     f"Loaded properties from object {self.selected_object.properties.get('WINDOWTYPE')} - {self.selected_object.properties.get('NAME', 'Unnamed')}",
-                    level="INFO")
+                    level="DEBUG")
             except ValueError as e:
                 error_msg = f"Error loading object properties: {e}"
                 self.log_manager.log(error_msg, level="ERROR")
                 self.property_editor.display_error(error_msg)
 
     def save_file(self):
-        """Saves current data to the selected file using the parser's representation."""
-        if self.selected_file and self.parser:
-            try:
-                self.parser.enforce_file_names(os.path.basename(self.selected_file))
-
-                with open(self.selected_file, 'w') as file:
-                    file.write(str(self.parser))
-                self.update_modified_state(False)
-                self.log_manager.log(f"File saved: {self.selected_file}", level="INFO")
-            except Exception as e:
-                self.log_manager.log(f"Error saving file: {e}", level="ERROR")
-                self.show_error_message("Save Error", f"An error occurred while saving: {e}")
+        """Saves the active document to its file using the parser's representation."""
+        if self.active_document and self.parser:
+            self.save_document(self.active_document)
         else:
             self.log_manager.log("No file selected to save", level="ERROR")
             self.show_error_message("Save Error", "No file selected to save.")
 
+    @traced(category="document")
+    def save_document(self, document):
+        """Writes a document to its file. Returns True on success."""
+        try:
+            document.parser.enforce_file_names(os.path.basename(document.file_path))
+            document.parser.write_file(document.file_path)
+            document.signature = ParseCache.file_signature(document.file_path)
+            self.file_watcher.remember(document.file_path)
+            self._set_document_modified(document, False)
+            self.log_manager.log(f"File saved: {document.file_path}", level="INFO")
+            self.project_indexer.index_files([document.file_path])
+            return True
+        except Exception as e:
+            self.log_manager.log(f"Error saving file: {e}", level="ERROR")
+            self.show_error_message("Save Error", f"An error occurred while saving: {e}")
+            return False
+
     def save_as_file(self):
         """Prompts for location and saves file under a new name."""
         if self.parser:
@@ -519,10 +859,17 @@ class MainWindow(QMainWindow):
             if file:
                 try:
                     self.parser.enforce_file_names(os.path.basename(self.selected_file))
-                    with open(file, 'w') as f:
-                        f.write(str(self.parser))
-                    self.selected_file = file
+                    self.parser.write_file(file)
+                    self.file_watcher.remember(file)
+
+                    # The document now lives at the new path; close a stale tab of the overwritten file
+                    existing = self.documents.get(file)
+                    if existing is not None and existing is not self.active_document:
+                        self.close_document(existing)
+                    self.documents.rename(self.active_document, file)
+                    self.active_document.signature = ParseCache.file_signature(file)
                     self.update_modified_state(False)
+                    self.update_status_bar()
                     self.log_manager.log(f"File saved as: {file}", level="INFO")
                 except Exception as e:
                     self.log_manager.log(f"Error saving file as: {e}", level="ERROR")
@@ -532,12 +879,12 @@ class MainWindow(QMainWindow):
             self.show_error_message("Save As Error", "No data to save.")
 
     def add_file_menu(self):
-        current_path = self.file_tree.model.rootPath()
+        current_path = self.file_tree.root_path()
         if current_path:
             self.file_tree.add_file_action_handler(current_path)
 
     def add_folder_menu(self):
-        current_path = self.file_tree.model.rootPath()
+        current_path = self.file_tree.root_path()
         if current_path:
             self.file_tree.add_folder_action_handler(current_path)
 
@@ -553,21 +900,26 @@ class MainWindow(QMainWindow):
         for f in files:
             if f.endswith(".wnd"):
                 self.log_manager.log(f"File dropped: {f}", level="INFO")
-                self.load_wnd_file(f)
+                self.open_document(f)
             else:
                 self.log_manager.log(f"Invalid file type dropped: {f}", level="WARNING")
 
     def closeEvent(self, event):
-        """Warns the user if they try to close with unsaved changes."""
-        if self.is_modified:
+        """Warns the user if they try to close with unsaved changes in any open document."""
+        modified = self.documents.modified_documents()
+        if modified:
+            names = ", ".join(os.path.basename(d.file_path) for d in modified)
             reply = QMessageBox.question(
                 self, 'Unsaved Changes',
-                "You have unsaved changes. Do you want to save before closing?",
+                f"You have unsaved changes in {names}. Do you want to save before closing?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel
             )
             if reply == QMessageBox.StandardButton.Yes:
-                self.save_file()
-                event.accept()
+                saved = [self.save_document(d) for d in modified]
+                if all(saved):
+                    event.accept()
+                else:
+                    event.ignore()
             elif reply == QMessageBox.StandardButton.No:
                 event.accept()
             else:
@@ -575,9 +927,51 @@ class MainWindow(QMainWindow):
         else:
             event.accept()
 
+        if event.isAccepted():
+            self.project_indexer.stop()
+            self.parse_prefetcher.stop()
+            self.config.flush()
+            if self._usage_search_widget is not None:
+                self._usage_search_widget.close()
+
+
+def _command_line_value(option):
+    """Returns the value following an option on the command line (e.g. `--trace out.json`), or None."""
+    if option in sys.argv:
+        index = sys.argv.index(option)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return None
+
+
+def _report_startup_profile():
+    report = startup_profiler.finish()
+    print(report)
+    LogManager().log(report, level="INFO")
+
+
+def _report_memory(window):
+    report = memory_diagnostics.format_report(memory_diagnostics.collect(window))
+    print(report)
+    LogManager().log(report, level="INFO")
+
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
+    trace_path = _command_line_value("--trace")
+    if trace_path:
+        tracer.start()  # Exported when the application quits
+    if "--memory-report" in sys.argv:
+        memory_diagnostics.start()  # Reported when the application quits
+    with startup_profiler.section("QApplication"):
+        app = QApplication(sys.argv)
+    with startup_profiler.section("MainWindow"):
+        window = MainWindow()
+    with startup_profiler.section("Show"):
+        window.show()
+    if startup_profiler.enabled:
+        QTimer.singleShot(0, _report_startup_profile)
+    if trace_path:
+        app.aboutToQuit.connect(lambda: tracer.export_chrome_trace(trace_path))
+    if memory_diagnostics.tracing:
+        app.aboutToQuit.connect(lambda: _report_memory(window))
     sys.exit(app.exec())
\ No newline at end of file
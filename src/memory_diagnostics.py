@@ -0,0 +1,304 @@
+import gc
+import os
+import sys
+import tracemalloc
+import types
+import weakref
+
+from PyQt6.QtCore import Qt, QObject
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QLabel
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Allocations are attributed to the innermost frame inside src/ that made them
+CATEGORIES = ("window_model", "undo_stack", "canvas_items", "tree_items", "other")
+_CATEGORY_FILES = {
+    "commands.py": "undo_stack",
+    "visual_preview.py": "canvas_items",
+    "object_tree.py": "tree_items",
+}
+
+# Not followed when sizing a document: shared by every document (widgets, code) or owned by Qt
+_OPAQUE_TYPES = (type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType,
+                 types.CodeType, types.FrameType, QObject)
+
+
+class LeakTracker:
+    """
+    Remembers canvas items after they were taken off the canvas. Once nothing references them anymore
+    they are forgotten; the ones still alive after a garbage collection are reported as leaked.
+    """
+
+    def __init__(self):
+        self._removed = {}  # id(weakref) -> (weakref, label, removed by)
+
+    def track(self, item, removed_by):
+        window = getattr(item, 'window', None)
+        name = window.properties.get('NAME', '') if window is not None else ''
+        label = f"{type(item).__name__} {name or getattr(item, 'window_uuid', '')}".strip()
+
+        def _forget(ref):
+            self._removed.pop(id(ref), None)
+
+        ref = weakref.ref(item, _forget)
+        self._removed[id(ref)] = (ref, label, removed_by)
+
+    def track_all(self, items, removed_by):
+        for item in items:
+            self.track(item, removed_by)
+
+    def survivors(self):
+        """Items still alive after a full collection, as dicts with the item label and what removed it."""
+        gc.collect()
+        leaked = []
+        for ref, label, removed_by in list(self._removed.values()):
+            item = ref()
+            if item is not None:
+                leaked.append({"item": label, "removed_by": removed_by, "in_scene": _in_scene(item)})
+        return leaked
+
+
+def _in_scene(item):
+    try:
+        return item.scene() is not None
+    except RuntimeError:
+        return False  # The C++ item is gone, only the Python wrapper is kept alive
+
+
+# Process-wide tracker, fed by VisualPreview
+leak_tracker = LeakTracker()
+
+
+def _python_size(roots, seen):
+    """Sum of the shallow sizes of everything reachable from `roots` that was not counted yet."""
+    total = 0
+    pending = list(roots)
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _OPAQUE_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return total
+
+
+def _undo_commands(undo_stack):
+    commands = []
+    pending = [undo_stack.command(index) for index in range(undo_stack.count())]
+    while pending:
+        command = pending.pop()
+        commands.append(command)
+        pending.extend(command.child(index) for index in range(command.childCount()))
+    return commands
+
+
+def _tree_item_count(model):
+    count = 0
+    pending = [model.invisibleRootItem()]
+    while pending:
+        item = pending.pop()
+        for row in range(item.rowCount()):
+            for column in range(item.columnCount()):
+                child = item.child(row, column)
+                if child is not None:
+                    count += 1
+                    pending.append(child)
+    return count
+
+
+class MemoryDiagnostics:
+    """
+    Memory report of the open documents. Each document is split into its window model, undo stack,
+    canvas items and tree items by walking its objects (shared objects are counted once, in that order).
+    While tracemalloc runs, the process-wide traced memory is split into the same categories and
+    compared with the previous report, which shows whether a long session keeps growing.
+    Qt's own (C++) memory is invisible to both; Qt objects are counted instead.
+    """
+
+    def __init__(self, frames=25):
+        self.frames = frames
+        self._previous_snapshot = None
+
+    @property
+    def tracing(self):
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._previous_snapshot = None
+
+    def stop(self):
+        tracemalloc.stop()
+        self._previous_snapshot = None
+
+    def collect(self, main_window):
+        gc.collect()
+        report = {
+            "documents": [self._document_report(main_window, document)
+                          for document in main_window.documents.documents.values()],
+            "parse_cache": self._parse_cache_report(main_window.parse_cache),
+            "leaked_items": leak_tracker.survivors(),
+            "tracemalloc": self._tracemalloc_report() if self.tracing else None,
+        }
+        return report
+
+    def _document_report(self, main_window, document):
+        if document is main_window.active_document:
+            items_map = main_window.visual_preview.items_map
+            scene = main_window.visual_preview.scene
+            tree_model = main_window.object_tree.model
+        else:
+            items_map = document.canvas_state.items_map if document.canvas_state else {}
+            scene = document.canvas_state.scene if document.canvas_state else None
+            tree_model = document.tree_state['model'] if document.tree_state else None
+
+        seen = set()
+        commands = _undo_commands(document.undo_stack)
+        return {
+            "file": document.file_path,
+            "active": document is main_window.active_document,
+            "window_model": {"windows": document.window_count(),
+                             "bytes": _python_size([document.parser], seen) if document.parser else 0},
+            "undo_stack": {"commands": len(commands), "bytes": _python_size(commands, seen)},
+            "canvas_items": {"items": len(scene.items()) if scene is not None else 0,
+                             "bytes": _python_size(list(items_map.values()), seen)},
+            "tree_items": {"items": _tree_item_count(tree_model) if tree_model is not None else 0,
+                           "bytes": 0},  # Plain QStandardItems, their data is the window model
+        }
+
+    @staticmethod
+    def _parse_cache_report(parse_cache):
+        parsers = parse_cache.parsers()
+        return {"entries": len(parsers), "bytes": _python_size(parsers, set())}
+
+    def _tracemalloc_report(self, top=10):
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        by_category = dict.fromkeys(CATEGORIES, 0)
+        for trace in snapshot.traces:
+            by_category[self._category(trace.traceback)] += trace.size
+
+        growth = []
+        if self._previous_snapshot is not None:
+            for stat in snapshot.compare_to(self._previous_snapshot, 'lineno')[:top]:
+                frame = stat.traceback[0]
+                growth.append({"location": f"{os.path.relpath(frame.filename)}:{frame.lineno}",
+                               "size_diff": stat.size_diff, "count_diff": stat.count_diff})
+        self._previous_snapshot = snapshot
+
+        current, peak = tracemalloc.get_traced_memory()
+        return {"current_bytes": current, "peak_bytes": peak, "by_category": by_category, "growth": growth}
+
+    @staticmethod
+    def _category(traceback):
+        for frame in reversed(traceback):  # Most recent call first
+            if not frame.filename.startswith(SRC_DIR):
+                continue
+            relative = os.path.relpath(frame.filename, SRC_DIR)
+            if relative.startswith("window" + os.sep):
+                return "window_model"
+            return _CATEGORY_FILES.get(os.path.basename(relative), "other")
+        return "other"
+
+    @staticmethod
+    def format_report(report):
+        lines = ["=== GenWND memory report ==="]
+
+        lines.append("Open documents (Python objects reachable from each document, KB):")
+        lines.append(f"  {'model':>9} {'undo':>9} {'canvas':>9} {'tree':>6}  file")
+        for doc in report["documents"]:
+            lines.append(
+                f"  {doc['window_model']['bytes'] / 1024:9.1f} {doc['undo_stack']['bytes'] / 1024:9.1f} "
+                f"{doc['canvas_items']['bytes'] / 1024:9.1f} {doc['tree_items']['bytes'] / 1024:6.1f}  "
+                f"{os.path.basename(doc['file'])}{' (active)' if doc['active'] else ''}")
+            lines.append(
+                f"  {doc['window_model']['windows']:>9} {doc['undo_stack']['commands']:>9} "
+                f"{doc['canvas_items']['items']:>9} {doc['tree_items']['items']:>6}  "
+                f"windows / commands / scene items / tree items")
+
+        cache = report["parse_cache"]
+        lines.append(f"Parse cache: {cache['entries']} model(s), {cache['bytes'] / 1024:.1f} KB")
+
+        leaked = report["leaked_items"]
+        lines.append("")
+        lines.append(f"Canvas items alive after removal: {len(leaked)}")
+        for leak in leaked[:20]:
+            state = "still in a scene" if leak["in_scene"] else "detached"
+            lines.append(f"  {leak['item']} (removed by {leak['removed_by']}, {state})")
+        if len(leaked) > 20:
+            lines.append(f"  ... {len(leaked) - 20} more")
+
+        traced = report["tracemalloc"]
+        lines.append("")
+        if traced is None:
+            lines.append("tracemalloc is not running; start it to split process memory by category.")
+            return "\n".join(lines)
+
+        lines.append(f"tracemalloc: {traced['current_bytes'] / 1024:.1f} KB traced, "
+                     f"peak {traced['peak_bytes'] / 1024:.1f} KB")
+        for category, size in traced["by_category"].items():
+            lines.append(f"  {size / 1024:10.1f} KB  {category}")
+        if traced["growth"]:
+            lines.append("Largest changes since the previous report:")
+            for stat in traced["growth"]:
+                lines.append(f"  {stat['size_diff'] / 1024:+10.1f} KB {stat['count_diff']:+7d}  {stat['location']}")
+        return "\n".join(lines)
+
+
+# Process-wide diagnostics, started with --memory-report or from the Diagnostics menu
+memory_diagnostics = MemoryDiagnostics()
+
+
+class MemoryDiagnosticsWidget(QWidget):
+    """Tool window showing the memory report of the open documents."""
+
+    def __init__(self, main_window, parent=None):
+        super().__init__(parent)
+        self.main_window = main_window
+        self.setWindowTitle("Memory Diagnostics")
+        self.setWindowFlag(Qt.WindowType.Tool)
+        self.resize(700, 500)
+
+        layout = QVBoxLayout(self)
+
+        self.report_view = QPlainTextEdit()
+        self.report_view.setReadOnly(True)
+        self.report_view.setFont(QFont("Courier New", 9))
+        layout.addWidget(self.report_view)
+
+        button_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        self.tracing_button = QPushButton()
+        self.refresh_button = QPushButton("Refresh")
+        button_layout.addWidget(self.status_label)
+        button_layout.addStretch()
+        button_layout.addWidget(self.tracing_button)
+        button_layout.addWidget(self.refresh_button)
+        layout.addLayout(button_layout)
+
+        self.tracing_button.clicked.connect(self.toggle_tracing)
+        self.refresh_button.clicked.connect(self.refresh)
+        self._update_tracing_button()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def toggle_tracing(self):
+        if memory_diagnostics.tracing:
+            memory_diagnostics.stop()
+        else:
+            memory_diagnostics.start()  # Only allocations made from now on are traced
+        self._update_tracing_button()
+        self.refresh()
+
+    def _update_tracing_button(self):
+        self.tracing_button.setText("Stop tracemalloc" if memory_diagnostics.tracing else "Start tracemalloc")
+
+    def refresh(self):
+        report = memory_diagnostics.collect(self.main_window)
+        self.report_view.setPlainText(memory_diagnostics.format_report(report))
+        leaked = len(report["leaked_items"])
+        self.status_label.setText(f"{leaked} leaked canvas item(s)" if leaked else "No leaked canvas items")
@@ -1,5 +1,4 @@
 import os
-import uuid
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeView, QLabel, QPushButton, QMenu, QSizePolicy
@@ -7,8 +6,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QStandardItemModel, QStandardItem, QColor, QCursor
 from PyQt6.QtCore import Qt, pyqtSignal, QMimeData, QByteArray, QDataStream, QIODevice, QItemSelectionModel, QTimer, QEvent
 
-from src.window.window_properties import ObjectFactory
 from commands import CommandAddObject, CommandDeleteObject, CommandMoveObject
+from src.tracing import traced
+from src.window.window_ids import window_ids, new_window_id
 
 class ObjectTreeModel(QStandardItemModel):
     """Custom model handling hierarchical WND objects and drag/drop reordering."""
@@ -25,7 +25,7 @@ class ObjectTreeModel(QStandardItemModel):
         return ['application/x-window-object']
 
     def mimeData(self, indexes):
-        """Serializes all selected dragged windows' UUIDs into MIME data."""
+        """Serializes the ids of all selected dragged windows into MIME data."""
         if not indexes:
             return None
 
@@ -39,8 +39,7 @@ class ObjectTreeModel(QStandardItemModel):
         data = QByteArray()
         stream = QDataStream(data, QDataStream.OpenModeFlag.WriteOnly)
 
-        uuid_str = ",".join(uuids)
-        stream.writeBytes(uuid_str.encode('utf-8'))
+        stream.writeBytes(window_ids.encode(uuids).encode('utf-8'))
         mime_data.setData('application/x-window-object', data)
 
         return mime_data
@@ -57,8 +56,7 @@ class ObjectTreeModel(QStandardItemModel):
             return False
 
         stream = QDataStream(data.data('application/x-window-object'), QIODevice.OpenModeFlag.ReadOnly)
-        uuid_str = stream.readBytes().decode('utf-8')
-        source_uuids = uuid_str.split(',') if uuid_str else []
+        source_uuids = window_ids.decode(stream.readBytes().decode('utf-8'))
         if not source_uuids: return False
 
         # Determine target drop window
@@ -162,8 +160,7 @@ class ObjectTreeModel(QStandardItemModel):
             if drop_window:
                 data = event.mimeData().data('application/x-window-object')
                 stream = QDataStream(data, QIODevice.OpenModeFlag.ReadOnly)
-                uuid_str = stream.readBytes().decode('utf-8')
-                source_uuids = uuid_str.split(',') if uuid_str else []
+                source_uuids = window_ids.decode(stream.readBytes().decode('utf-8'))
 
                 # Prevent dragging containers into themselves
                 for source_uuid in source_uuids:
@@ -177,14 +174,13 @@ class ObjectTreeModel(QStandardItemModel):
 class ObjectTree(QWidget):
     """The visual hierarchical representation of WND elements."""
     objects_selected_signal = pyqtSignal(list)  # Emits list of selected window objects
-    visibility_changed_signal = pyqtSignal(str, bool)
+    visibility_changed_signal = pyqtSignal(int, bool)
 
     def __init__(self, parent=None, main_window=None):
         super().__init__(parent)
         self.main_window = main_window
 
-        self.model = ObjectTreeModel(main_window)
-        self.model.setHorizontalHeaderLabels(["Object Tree"])
+        self.model = self._create_model()
 
         self._is_updating_checks = False  # Guard for checkbox recursion
         self._is_syncing = False          # Guard for selection loop recursion
@@ -192,13 +188,47 @@ class ObjectTree(QWidget):
         self._setup_ui()
 
         # Connect signals
-        self.model.itemChanged.connect(self.on_item_changed)
         self.tree_view.selectionModel().selectionChanged.connect(self.on_item_selected)
         self.tree_view.customContextMenuRequested.connect(self.show_context_menu)
 
         self.save_button.clicked.connect(lambda: self.main_window.save_file())
         self.reset_button.clicked.connect(lambda: self.main_window.load_wnd_file(self.main_window.selected_file))
 
+    def _create_model(self):
+        model = ObjectTreeModel(self.main_window)
+        model.setHorizontalHeaderLabels(["Object Tree"])
+        model.itemChanged.connect(self.on_item_changed)
+        return model
+
+    def swap_model(self, state=None):
+        """
+        Detaches the current tree model and shows another one, so every open document keeps its own tree.
+        :param state: A state returned by a previous swap, or None for a fresh, empty tree.
+        :return: The detached model together with its expansion, scroll and selection state.
+        """
+        old_state = {
+            'model': self.model,
+            'view': self._get_tree_state(),
+            'tree_visible': not self.tree_view.isHidden(),
+            'buttons_visible': not self.save_button.isHidden(),
+        }
+        old_selection_model = self.tree_view.selectionModel()
+
+        self.model = state['model'] if state else self._create_model()
+        self.tree_view.setModel(self.model)
+        self.tree_view.selectionModel().selectionChanged.connect(self.on_item_selected)
+        old_selection_model.deleteLater()
+
+        if state and state['tree_visible']:
+            self.empty_label.setVisible(False)
+            self.tree_view.setVisible(True)
+            self.save_button.setVisible(state['buttons_visible'])
+            self.reset_button.setVisible(state['buttons_visible'])
+            self._restore_tree_state(state['view'])
+        else:
+            self.clear()
+        return old_state
+
     def _setup_ui(self):
         """Initializes the Tree View, status labels, and buttons."""
         self.layout = QVBoxLayout(self)
@@ -259,6 +289,21 @@ class ObjectTree(QWidget):
         search_item(self.model.invisibleRootItem())
         self._is_syncing = False
 
+    def update_item_labels(self, windows):
+        """Refreshes the labels of the tree items showing `windows` after they were renamed."""
+        renamed = {id(window) for window in windows}
+        self._is_updating_checks = True  # setText emits itemChanged
+        pending = [self.model.invisibleRootItem()]
+        while pending:
+            parent_item = pending.pop()
+            for row in range(parent_item.rowCount()):
+                child = parent_item.child(row)
+                window = child.data()
+                if id(window) in renamed:
+                    child.setText(f"{window.properties.get('WINDOWTYPE')} - {window.properties.get('NAME', 'Unnamed')}")
+                pending.append(child)
+        self._is_updating_checks = False
+
     def load_objects(self, windows):
         """Load the parsed WND data into the tree view."""
         if not windows:
@@ -407,8 +452,8 @@ class ObjectTree(QWidget):
         add_menu = menu.addMenu("Add New")
 
         # Dynamically load control types from factory
-        factory = ObjectFactory()
-        for object_type in factory.control_classes:
+        from src.window.window_properties import object_factory
+        for object_type in object_factory.control_classes:
             add_menu.addAction(object_type)
 
         selected_indexes = self.tree_view.selectionModel().selectedIndexes()
@@ -428,11 +473,11 @@ class ObjectTree(QWidget):
 
     def add_new_control(self, parent_item, new_object_type):
         """Creates a new WND element and queues an undoable command."""
-        factory = ObjectFactory()
+        from src.window.window_properties import object_factory
         file_name = os.path.basename(self.main_window.selected_file) if self.main_window.selected_file else "Unknown"
-        new_object = factory.create_object(
+        new_object = object_factory.create_object(
             new_object_type,
-            window_uuid=str(uuid.uuid4()),
+            window_uuid=new_window_id(),
             file_name=file_name
         )
 
@@ -531,6 +576,7 @@ class ObjectTree(QWidget):
         self._refresh_pending = True
         QTimer.singleShot(0, self._do_refresh_tree_state)
 
+    @traced(category="tree")
     def _do_refresh_tree_state(self):
         self._refresh_pending = False
         state = self._get_tree_state()
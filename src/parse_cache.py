@@ -0,0 +1,157 @@
+import os
+import threading
+from collections import OrderedDict, deque
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.error_handler import ErrorHandler
+from log_manager import LogManager
+
+
+class ParseCache:
+    """
+    Small LRU cache of parsed WND models (WndParser instances), keyed by file path.
+
+    Entries are validated against the file's modification time and size, so a file
+    that changed on disk is never served from the cache.
+    A cached parser is handed out with `take`, after which the caller owns (and may mutate) it.
+    Non-critical errors found while parsing in the background are kept with the entry and reported by `take`,
+    so opening a prefetched file warns the user like a normal open.
+    The cache is shared with the ParsePrefetcher thread, so every access is locked.
+    """
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # path -> (signature, parser, errors), most recently used last
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(path):
+        return os.path.normpath(os.path.abspath(path))
+
+    @staticmethod
+    def file_signature(path):
+        """Returns (mtime_ns, size) of a file, or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def put(self, path, parser, signature=None, errors=()):
+        """
+        Stores a parsed model for a file.
+        :param signature: The file signature the model corresponds to, defaults to the current one on disk.
+        :param errors: Errors recorded while parsing (see ErrorHandler.collecting), reported again by `take`.
+        """
+        signature = signature or self.file_signature(path)
+        if signature is None or parser is None:
+            return
+        key = self.normalize(path)
+        with self._lock:
+            self._entries[key] = (signature, parser, tuple(errors))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def take(self, path):
+        """
+        Removes and returns the cached parser for a file, or None if missing or stale.
+        Reports the errors recorded with it through the ErrorHandler first, so a non-critical error can still
+        be aborted (ValueError) like when the file is parsed.
+        """
+        with self._lock:
+            entry = self._entries.pop(self.normalize(path), None)
+        if entry is None:
+            return None
+        signature, parser, errors = entry
+        if signature != self.file_signature(path):
+            return None
+        for error in errors:
+            ErrorHandler.raise_error(*error)
+        return parser
+
+    def discard(self, path):
+        with self._lock:
+            self._entries.pop(self.normalize(path), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def parsers(self):
+        """Returns the cached parsers, least recently used first."""
+        with self._lock:
+            return [parser for signature, parser, errors in self._entries.values()]
+
+    def __contains__(self, path):
+        with self._lock:
+            return self.normalize(path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ParsePrefetcher(QThread):
+    """
+    Background thread that speculatively parses WND files the user is likely to open next
+    (hovered or neighbouring files in the file tree) into the ParseCache.
+    """
+    file_prefetched_signal = pyqtSignal(str)
+
+    def __init__(self, parse_cache, parent=None):
+        super().__init__(parent)
+        self.parse_cache = parse_cache
+        self.log_manager = LogManager()
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._stopping = False
+
+    def request(self, paths):
+        """Replaces the pending work with the given files, most likely first. Cached files are skipped."""
+        with self._condition:
+            self._pending.clear()
+            self._pending.extend(p for p in paths if p not in self.parse_cache)
+            self._condition.notify()
+        if self._pending and not self.isRunning():
+            self._stopping = False
+            self.start(QThread.Priority.LowPriority)
+
+    def stop(self):
+        if self.isRunning():
+            with self._condition:
+                self._stopping = True
+                self._pending.clear()
+                self._condition.notify()
+            self.wait()
+
+    def run(self):
+        from src.window.wnd_parser import WndParser
+
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                path = self._pending.popleft()
+
+            if path in self.parse_cache:
+                continue
+            signature = ParseCache.file_signature(path)
+            if signature is None:
+                continue
+
+            parser = WndParser()
+            errors = []
+            try:
+                # No prompts on this thread: non-critical errors are recorded and reported when the file is opened
+                with ErrorHandler.collecting(errors):
+                    parser.parse_file(path, lossless=True)
+            except Exception as e:
+                # Critical: not cached, the real open reports the error to the user
+                self.log_manager.log(f"Skipping prefetch of {path}: {e}", level="DEBUG")
+                continue
+
+            self.parse_cache.put(path, parser, signature, errors)
+            self.file_prefetched_signal.emit(path)
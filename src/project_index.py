@@ -0,0 +1,269 @@
+import os
+import sqlite3
+import threading
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.error_handler import ErrorHandler
+from log_manager import LogManager
+
+
+class ProjectIndex:
+    """
+    Persistent symbol index for every WND file in a project folder.
+
+    Maps window names, callbacks, images and text labels to the file/window locations that use them.
+    The index lives in a local SQLite file and is updated incrementally by file modification time.
+    """
+
+    # Window properties that are indexed as symbols, plus IMAGE entries from the draw data
+    indexed_properties = ["NAME", "SYSTEMCALLBACK", "INPUTCALLBACK", "DRAWCALLBACK", "TEXT", "TOOLTIPTEXT"]
+    ignored_values = {"", "[None]", "[NONE]", "NoImage"}
+
+    def __init__(self, db_path='resources/project_index.db'):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._lock, self._connection:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    mtime REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS symbols (
+                    kind TEXT NOT NULL,
+                    value TEXT NOT NULL COLLATE NOCASE,
+                    path TEXT NOT NULL,
+                    window TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_symbols_value ON symbols (value);
+                CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols (path);
+            """)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def get_file_mtimes(self, root_path):
+        """Returns {path: mtime} for every indexed file below root_path."""
+        root_path = os.path.normpath(os.path.abspath(root_path))
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT path, mtime FROM files WHERE path = ? OR path LIKE ?",
+                (root_path, os.path.join(root_path, '%'))
+            ).fetchall()
+        return dict(rows)
+
+    def update_file(self, path, mtime, symbols):
+        """Replaces all symbols of a file in one transaction."""
+        path = os.path.normpath(os.path.abspath(path))
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM symbols WHERE path = ?", (path,))
+            self._connection.executemany(
+                "INSERT INTO symbols (kind, value, path, window) VALUES (?, ?, ?, ?)",
+                [(kind, value, path, window) for kind, value, window in symbols]
+            )
+            self._connection.execute("INSERT OR REPLACE INTO files (path, mtime) VALUES (?, ?)", (path, mtime))
+
+    def remove_file(self, path):
+        path = os.path.normpath(os.path.abspath(path))
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM symbols WHERE path = ?", (path,))
+            self._connection.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def find_usages(self, value, kind=None):
+        """
+        Looks up every location of a symbol (case-insensitive).
+        :param value: The symbol to find, e.g. an image or callback name.
+        :param kind: Optional property filter, e.g. 'IMAGE' or 'SYSTEMCALLBACK'.
+        :return: List of (kind, value, path, window) tuples.
+        """
+        query = "SELECT kind, value, path, window FROM symbols WHERE value = ?"
+        params = [value]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " ORDER BY path, window"
+        with self._lock:
+            return self._connection.execute(query, params).fetchall()
+
+    @classmethod
+    def collect_symbols(cls, windows):
+        """Walks a parsed window hierarchy and returns a list of (kind, value, window_name) tuples."""
+        symbols = []
+
+        def _walk(window_list):
+            for window in window_list:
+                props = window.properties
+                window_name = props.get('NAME', '')
+                for key in cls.indexed_properties:
+                    value = props.get(key)
+                    if isinstance(value, str) and value not in cls.ignored_values:
+                        symbols.append((key, value, window_name))
+
+                images = set()
+                for draw_data in (props.get('textures') or {}).values():
+                    for entry in draw_data:
+                        image = entry.get('IMAGE')
+                        if image and image not in cls.ignored_values:
+                            images.add(image)
+                symbols.extend(('IMAGE', image, window_name) for image in sorted(images))
+
+                if window.children:
+                    _walk(window.children)
+
+        _walk(windows)
+        return symbols
+
+
+class ProjectIndexer(QThread):
+    """
+    Background thread that brings the ProjectIndex up to date for a project folder: a full scan when the
+    folder is opened, then only the files that were saved or changed on disk.
+    Work is queued and the thread is never waited on from the GUI, except by `stop`.
+    """
+    file_indexed_signal = pyqtSignal(str)
+    index_finished_signal = pyqtSignal(str, int)  # root path, number of reindexed files
+
+    def __init__(self, project_index, parent=None):
+        super().__init__(parent)
+        self.project_index = project_index
+        self.root_path = None
+        self.log_manager = LogManager()
+        self._pending_root = None  # Folder to scan next
+        self._pending_paths = {}  # Files to reindex, in the order they were queued
+        self._condition = threading.Condition()
+        self._stopping = False
+
+    def start_indexing(self, root_path):
+        """Queues a full scan of root_path. A scan of another folder that is still running stops at its next file."""
+        with self._condition:
+            self.root_path = root_path
+            self._pending_root = root_path
+            self._condition.notify()
+        self._ensure_running()
+
+    def index_files(self, paths):
+        """Queues the reindexing of single files of the project folder; files that no longer exist are removed."""
+        with self._condition:
+            for path in paths:
+                self._pending_paths[os.path.normpath(os.path.abspath(path))] = None
+            self._condition.notify()
+        self._ensure_running()
+
+    def _ensure_running(self):
+        if not self.isRunning():
+            self._stopping = False
+            self.start(QThread.Priority.LowPriority)
+
+    def stop(self):
+        if self.isRunning():
+            with self._condition:
+                self._stopping = True
+                self._pending_root = None
+                self._pending_paths.clear()
+                self._condition.notify()
+            self.wait()
+
+    def _cancelled(self):
+        # A newer folder to scan replaces the current scan
+        return self._stopping or self._pending_root is not None
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._pending_root is None and not self._pending_paths and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                if self._pending_root is not None:
+                    root_path, paths = self._pending_root, None
+                    self._pending_root = None
+                    self._pending_paths.clear()  # The scan reindexes every file whose mtime changed
+                else:
+                    root_path, paths = self.root_path, list(self._pending_paths)
+                    self._pending_paths.clear()
+
+            if paths is None:
+                self._scan(root_path)
+            else:
+                self._index_paths(root_path, paths)
+
+    def _scan(self, root_path):
+        if not root_path or not os.path.isdir(root_path):
+            return
+
+        known_mtimes = self.project_index.get_file_mtimes(root_path)
+        seen = set()
+        reindexed = 0
+
+        for dir_path, _, file_names in os.walk(root_path):
+            for file_name in file_names:
+                if self._cancelled():
+                    return
+                if not file_name.lower().endswith('.wnd'):
+                    continue
+
+                path = os.path.normpath(os.path.abspath(os.path.join(dir_path, file_name)))
+                seen.add(path)
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                if known_mtimes.get(path) == mtime:
+                    continue
+
+                if self.index_file(path, mtime):
+                    reindexed += 1
+
+        # Drop files that were deleted since the last scan
+        for path in set(known_mtimes) - seen:
+            self.project_index.remove_file(path)
+
+        self.log_manager.log(f"Project index updated for {root_path}: {reindexed} file(s) reindexed", level="INFO")
+        self.index_finished_signal.emit(root_path, reindexed)
+
+    def _index_paths(self, root_path, paths):
+        """Reindexes the given files of root_path, or removes them from the index if they were deleted."""
+        if not root_path:
+            return
+        root_path = os.path.normpath(os.path.abspath(root_path))
+        reindexed = 0
+        for path in paths:
+            if self._stopping:
+                return
+            if not path.lower().endswith('.wnd') or not path.startswith(os.path.join(root_path, '')):
+                continue  # Not part of the project, a full scan would not index it either
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                self.project_index.remove_file(path)  # Deleted
+                continue
+            if self.index_file(path, mtime):
+                reindexed += 1
+
+        self.log_manager.log(f"Project index updated for {len(paths)} changed file(s)", level="INFO")
+        self.index_finished_signal.emit(root_path, reindexed)
+
+    def index_file(self, path, mtime=None):
+        """Parses a single file headlessly and stores its symbols. Returns True on success."""
+        from src.window.wnd_parser import WndParser
+
+        if mtime is None:
+            mtime = os.path.getmtime(path)
+        parser = WndParser()
+        try:
+            with ErrorHandler.headless():
+                parser.parse_file(path, validate=False)  # Only names and callbacks are indexed
+        except Exception as e:
+            self.log_manager.log(f"Skipping {path} while indexing: {e}", level="WARNING")
+            # Remember the mtime so a broken file is not re-parsed on every scan
+            self.project_index.update_file(path, mtime, [])
+            return False
+
+        self.project_index.update_file(path, mtime, ProjectIndex.collect_symbols(parser.get_windows()))
+        self.file_indexed_signal.emit(path)
+        return True
@@ -45,6 +45,9 @@ class CollapsibleSection(QFrame):
     def addWidget(self, widget):
         self._content_layout.addWidget(widget)
 
+    def setTitle(self, title):
+        self._title_frame.setTitle(title)
+
     def setMaximumWidth(self, width):
         super().setMaximumWidth(width)
         self._content_group.setMaximumWidth(width)
@@ -90,6 +93,9 @@ class CollapsibleSection(QFrame):
         def setArrow(self, collapsed):
             self._arrow.setArrow(collapsed)
 
+        def setTitle(self, title):
+            self._title.setText(title)
+
         class Arrow(QFrame):
             def __init__(self, collapsed, parent=None):
                 super().__init__(parent)
@@ -7,12 +7,82 @@ from src.properties.collapsible_section import CollapsibleSection, SectionManage
 from src.properties.text_color import ColorPickerApp
 
 
+DEFAULT_TEXTURE_KEYS = ['ENABLEDDRAWDATA', 'DISABLEDDRAWDATA', 'HILITEDRAWDATA']
+
+LISTBOX_TEXTURE_KEYS = DEFAULT_TEXTURE_KEYS + [
+    'LISTBOXENABLEDUPBUTTONDRAWDATA', 'LISTBOXDISABLEDUPBUTTONDRAWDATA', 'LISTBOXHILITEUPBUTTONDRAWDATA',
+    'LISTBOXENABLEDDOWNBUTTONDRAWDATA', 'LISTBOXDISABLEDDOWNBUTTONDRAWDATA', 'LISTBOXHILITEDOWNBUTTONDRAWDATA',
+    'LISTBOXENABLEDSLIDERDRAWDATA', 'LISTBOXDISABLEDSLIDERDRAWDATA', 'LISTBOXHILITESLIDERDRAWDATA',
+    'SLIDERTHUMBENABLEDDRAWDATA', 'SLIDERTHUMBDISABLEDDRAWDATA', 'SLIDERTHUMBHILITEDRAWDATA'
+]
+
+COMBOBOX_TEXTURE_KEYS = DEFAULT_TEXTURE_KEYS + [
+    'COMBOBOXDROPDOWNBUTTONENABLEDDRAWDATA', 'COMBOBOXDROPDOWNBUTTONDISABLEDDRAWDATA',
+    'COMBOBOXDROPDOWNBUTTONHILITEDRAWDATA',
+    'COMBOBOXEDITBOXENABLEDDRAWDATA', 'COMBOBOXEDITBOXDISABLEDDRAWDATA', 'COMBOBOXEDITBOXHILITEDRAWDATA'
+] + LISTBOX_TEXTURE_KEYS[3:]
+
+SLIDER_TEXTURE_KEYS = DEFAULT_TEXTURE_KEYS + [
+    'SLIDERTHUMBENABLEDDRAWDATA', 'SLIDERTHUMBDISABLEDDRAWDATA', 'SLIDERTHUMBHILITEDRAWDATA'
+]
+
+# Control type -> (attribute data key, boolean-like attributes, texture keys) shown in the Control tab.
+# No data key: the control has no attribute group. No boolean list: the first data entry is shown as is.
+CONTROL_FORM_LAYOUTS = {
+    "USER": (None, [], DEFAULT_TEXTURE_KEYS),
+    "PUSHBUTTON": (None, [], DEFAULT_TEXTURE_KEYS),
+    "RADIOBUTTON": ('RADIOBUTTONDATA', None, DEFAULT_TEXTURE_KEYS),
+    "ENTRYFIELD": ('TEXTENTRYDATA', ['SECRETTEXT', 'NUMERICALONLY', 'ALPHANUMERICALONLY', 'ASCIIONLY'],
+                   DEFAULT_TEXTURE_KEYS),
+    "STATICTEXT": ('STATICTEXTDATA', ['CENTERED'], DEFAULT_TEXTURE_KEYS),
+    "PROGRESSBAR": (None, [], DEFAULT_TEXTURE_KEYS),
+    "SCROLLLISTBOX": ('LISTBOXDATA', ['AUTOSCROLL', 'SCROLLIFATEND', 'AUTOPURGE', 'SCROLLBAR', 'MULTISELECT',
+                                      'FORCESELECT'], LISTBOX_TEXTURE_KEYS),
+    "COMBOBOX": ('COMBOBOXDATA', ['ISEDITABLE', 'ASCIIONLY', 'LETTERSANDNUMBERS'], COMBOBOX_TEXTURE_KEYS),
+    "CHECKBOX": (None, [], DEFAULT_TEXTURE_KEYS),
+    "HORZSLIDER": ('SLIDERDATA', [], SLIDER_TEXTURE_KEYS),
+    "VERTSLIDER": ('SLIDERDATA', [], SLIDER_TEXTURE_KEYS),
+}
+
+
+def control_form_data(properties):
+    """
+    Returns (attributes, textures) shown in the Control tab for a window: the attribute values
+    (None if the type has no attribute group) and the non-empty texture entries per texture key.
+    """
+    control_type = properties.get('WINDOWTYPE', 'No Type')
+    if control_type not in CONTROL_FORM_LAYOUTS:
+        raise ValueError(f"Unknown type: {control_type}")
+
+    data_key, boolean_keys, texture_keys = CONTROL_FORM_LAYOUTS[control_type]
+    attributes = None
+    if data_key and boolean_keys is None:
+        attributes = dict([next(properties['attributes'][data_key].items())])
+    elif data_key:
+        attributes = normalize_boolean_values(properties['attributes'][data_key], boolean_keys)
+
+    textures = {key: filter_empty_properties(properties['textures'][key]) for key in texture_keys}
+    return attributes, textures
+
+
+def control_form_layout_key(properties):
+    """Windows with the same key get the same Control tab widgets; only their values differ."""
+    attributes, textures = control_form_data(properties)
+    attribute_kinds = tuple((prop, type(value).__name__) for prop, value in (attributes or {}).items())
+    texture_counts = tuple((key, len(entries)) for key, entries in textures.items())
+    return properties.get('WINDOWTYPE'), attributes is not None, attribute_kinds, texture_counts
+
+
 class ControlForm(QWidget):
     def __init__(self, parent=None, control_attributes=None):
         super().__init__(parent)
         self.control_attributes = control_attributes
         self.update_modified_state = None
 
+        # Widgets refilled by `bind` when the form is reused for another window
+        self._attribute_widgets = {}  # attribute -> editor widget
+        self._texture_pickers = []  # (inner section, color picker) per texture entry, in display order
+
         # Layout for the control-specific attributes
         self.layout = QVBoxLayout(self)
 
@@ -24,103 +94,39 @@ class ControlForm(QWidget):
         self.type_label.setAlignment(Qt.AlignmentFlag.AlignTop)
 
         # Dynamically create fields based on control type
-        self.create_attributes_for_control_type(self.type)
-
-    def create_attributes_for_control_type(self, control_type):
-        """Dynamically create attributes based on control type. USER is default"""
-        control_creation_map = {
-            "USER": self.create_user_attributes,
-            "PUSHBUTTON": self.create_pushbutton_attributes,
-            "RADIOBUTTON": self.create_radiobutton_attributes,
-            "ENTRYFIELD": self.create_entryfield_attributes,
-            "STATICTEXT": self.create_statictext_attributes,
-            "PROGRESSBAR": self.create_progressbar_attributes,
-            "SCROLLLISTBOX": self.create_scrolllistbox_attributes,
-            "COMBOBOX": self.create_combobox_attributes,
-            "CHECKBOX": self.create_checkbox_attributes,
-            "HORZSLIDER": self.create_slider_attributes,
-            "VERTSLIDER": self.create_slider_attributes
-        }
-
-        if control_type in control_creation_map:
-            control_creation_map[control_type](self.control_attributes)
-        else:
-            raise ValueError(f"Unknown type: {control_type}")
-
-    def create_user_attributes(self, properties):
-        self.create_default_textures(properties)
-
-    def create_pushbutton_attributes(self, properties):
-        self.create_default_textures(properties)
-
-    def create_radiobutton_attributes(self, properties):
-        self.create_attributes_for_control(properties['attributes']['RADIOBUTTONDATA'][0])
-        self.create_default_textures(properties)
-
-    def create_entryfield_attributes(self, properties):
-        entryfield_data = normalize_boolean_values(properties['attributes']['TEXTENTRYDATA'],
-                                                   ['SECRETTEXT', 'NUMERICALONLY', 'ALPHANUMERICALONLY', 'ASCIIONLY'])
-        self.create_attributes_for_control(entryfield_data)
-        self.create_default_textures(properties)
-
-    def create_statictext_attributes(self, properties):
-        statictext_data = normalize_boolean_values(properties['attributes']['STATICTEXTDATA'], ['CENTERED'])
-        self.create_attributes_for_control(statictext_data)
-        self.create_default_textures(properties)
-
-    def create_progressbar_attributes(self, properties):
-        self.create_default_textures(properties)
-
-    def create_scrolllistbox_attributes(self, properties):
-        listbox_data = normalize_boolean_values(properties['attributes']['LISTBOXDATA'],
-                                                ['AUTOSCROLL', 'SCROLLIFATEND', 'AUTOPURGE', 'SCROLLBAR', 'MULTISELECT', 'FORCESELECT'])
-
-        self.create_attributes_for_control(listbox_data)
-        texture_keys = [
-            'ENABLEDDRAWDATA', 'DISABLEDDRAWDATA', 'HILITEDRAWDATA',
-            'LISTBOXENABLEDUPBUTTONDRAWDATA', 'LISTBOXDISABLEDUPBUTTONDRAWDATA', 'LISTBOXHILITEUPBUTTONDRAWDATA',
-            'LISTBOXENABLEDDOWNBUTTONDRAWDATA', 'LISTBOXDISABLEDDOWNBUTTONDRAWDATA', 'LISTBOXHILITEDOWNBUTTONDRAWDATA',
-            'LISTBOXENABLEDSLIDERDRAWDATA', 'LISTBOXDISABLEDSLIDERDRAWDATA', 'LISTBOXHILITESLIDERDRAWDATA',
-            'SLIDERTHUMBENABLEDDRAWDATA', 'SLIDERTHUMBDISABLEDDRAWDATA', 'SLIDERTHUMBHILITEDRAWDATA'
-        ]
-        textures = {key: filter_empty_properties(properties['textures'][key]) for key in texture_keys}
-        self.create_textures_for_control(textures)
-
-    def create_combobox_attributes(self, properties):
-        combobox_data = normalize_boolean_values(properties['attributes']['COMBOBOXDATA'],
-                                                 ['ISEDITABLE', 'ASCIIONLY', 'LETTERSANDNUMBERS'])
-        self.create_attributes_for_control(combobox_data)
-
-        texture_keys = [
-            'ENABLEDDRAWDATA', 'DISABLEDDRAWDATA', 'HILITEDRAWDATA',
-            'COMBOBOXDROPDOWNBUTTONENABLEDDRAWDATA', 'COMBOBOXDROPDOWNBUTTONDISABLEDDRAWDATA',
-            'COMBOBOXDROPDOWNBUTTONHILITEDRAWDATA',
-            'COMBOBOXEDITBOXENABLEDDRAWDATA', 'COMBOBOXEDITBOXDISABLEDDRAWDATA', 'COMBOBOXEDITBOXHILITEDRAWDATA',
-            'LISTBOXENABLEDUPBUTTONDRAWDATA', 'LISTBOXDISABLEDUPBUTTONDRAWDATA', 'LISTBOXHILITEUPBUTTONDRAWDATA',
-            'LISTBOXENABLEDDOWNBUTTONDRAWDATA', 'LISTBOXDISABLEDDOWNBUTTONDRAWDATA', 'LISTBOXHILITEDOWNBUTTONDRAWDATA',
-            'LISTBOXENABLEDSLIDERDRAWDATA', 'LISTBOXDISABLEDSLIDERDRAWDATA', 'LISTBOXHILITESLIDERDRAWDATA',
-            'SLIDERTHUMBENABLEDDRAWDATA', 'SLIDERTHUMBDISABLEDDRAWDATA', 'SLIDERTHUMBHILITEDRAWDATA'
-        ]
-
-        textures = {key: filter_empty_properties(properties['textures'][key]) for key in texture_keys}
-        self.create_textures_for_control(textures)
-
-    def create_checkbox_attributes(self, properties):
-        self.create_default_textures(properties)
-
-    def create_slider_attributes(self, properties):
-        slider_data = normalize_boolean_values(properties['attributes']['SLIDERDATA'], [])
-        self.create_attributes_for_control(slider_data)
-        texture_keys = ['ENABLEDDRAWDATA', 'DISABLEDDRAWDATA', 'HILITEDRAWDATA', 'SLIDERTHUMBENABLEDDRAWDATA',
-                        'SLIDERTHUMBDISABLEDDRAWDATA', 'SLIDERTHUMBHILITEDRAWDATA']
-        textures = {key: filter_empty_properties(properties['textures'][key]) for key in texture_keys}
+        attributes, textures = control_form_data(self.control_attributes)
+        if attributes is not None:
+            self.create_attributes_for_control(attributes)
         self.create_textures_for_control(textures)
 
+    def bind(self, control_attributes):
+        """
+        Shows another window with the same layout key (see `control_form_layout_key`) by refilling
+        the existing widgets instead of building new ones.
+        """
+        self.control_attributes = control_attributes
+        attributes, textures = control_form_data(control_attributes)
+
+        for prop, value in (attributes or {}).items():
+            widget = self._attribute_widgets.get(prop)
+            if widget is None:
+                continue  # Shown as a label only
+            widget.blockSignals(True)  # Refilling is not an edit
+            if isinstance(widget, QComboBox):
+                widget.clear()
+                widget.addItems([str(item) for item in value])
+            elif isinstance(widget, QCheckBox):
+                widget.setChecked(value)
+            else:
+                widget.setValue(value)
+            widget.blockSignals(False)
 
-    def create_default_textures(self, properties):
-        texture_keys = ['ENABLEDDRAWDATA', 'DISABLEDDRAWDATA', 'HILITEDRAWDATA']
-        textures = {key: filter_empty_properties(properties['textures'][key]) for key in texture_keys}
-        self.create_textures_for_control(textures)
+        entries = [texture for texture_data in textures.values() for texture in texture_data]
+        for texture, (inner_section, color_picker_app) in zip(entries, self._texture_pickers):
+            color_picker_app.texture_image = texture.get('IMAGE', 'No Image')
+            inner_section.setTitle(color_picker_app.texture_image)
+            color_picker_app.set_colors('texture_layout', QColor(*texture.get('COLOR')),
+                                        QColor(*texture.get('BORDERCOLOR')))
 
     def create_attributes_for_control(self, attributes):
         """Creates controls for each property of the window depending on the control type
@@ -142,6 +148,7 @@ class ControlForm(QWidget):
                     lambda text, p=prop: self.update_sub_property(f'{self.type}DATA', p, text)
                 )
                 attributes_grid.addWidget(prop_combobox, row, 1)
+                self._attribute_widgets[prop] = prop_combobox
             elif isinstance(value, bool):
                 # If the property is a boolean, create a QCheckBox
                 prop_checkbox = QCheckBox(self)
@@ -150,6 +157,7 @@ class ControlForm(QWidget):
                     lambda checked, p=prop: self.update_sub_property(f'{self.type}DATA', p, int(checked))
                 )
                 attributes_grid.addWidget(prop_checkbox, row, 1)
+                self._attribute_widgets[prop] = prop_checkbox
             elif isinstance(value, int):
                 # If the property is an integer, create a QSpinBox
                 prop_spinbox = QSpinBox(self)
@@ -163,6 +171,7 @@ class ControlForm(QWidget):
                     lambda val, p=prop: self.update_sub_property(f'{self.type}DATA', p, val)
                 )
                 attributes_grid.addWidget(prop_spinbox, row, 1)
+                self._attribute_widgets[prop] = prop_spinbox
             attributes_grid.addWidget(prop_label, row, 0)
             row += 1
         group_box.setLayout(attributes_grid)
@@ -201,25 +210,26 @@ class ControlForm(QWidget):
                         }}
                     )
 
+                    color_picker_app.texture_image = inner_section_title  # Changes when the form is rebound
+
                     color_label = color_picker_app.findChild(QLabel, "colorLabel")
                     color_label.setText("Color:")
                     shadow_label = color_picker_app.findChild(QLabel, "shadowLabel")
                     shadow_label.setText("Border Color:")
 
                     color_picker_app.color_data['texture_layout']['color_button'].clicked.connect(
-                        lambda _, t=texture_type, i=inner_section_title, c=color_picker_app: update_texture_color(t, i, c))
+                        lambda _, t=texture_type, c=color_picker_app: update_texture_color(t, c.texture_image, c))
                     color_picker_app.color_data['texture_layout']['shadow_button'].clicked.connect(
-                        lambda _, t=texture_type, i=inner_section_title, c=color_picker_app: update_texture_color(t, i, c))
+                        lambda _, t=texture_type, c=color_picker_app: update_texture_color(t, c.texture_image, c))
 
                     inner_section.addWidget(color_picker_app)
+                    self._texture_pickers.append((inner_section, color_picker_app))
                     section.addWidget(inner_section)
 
                 self.layout.addWidget(section)
 
     def update_sub_property(self, main_key, sub_key, value=None):
-        list_dict = self.control_attributes['textures'] \
-            if main_key in self.control_attributes['textures'] \
-            else self.control_attributes['attributes']
+        container_key = 'textures' if main_key in self.control_attributes['textures'] else 'attributes'
 
         if main_key.endswith("SLIDERDATA"):
             main_key = "SLIDERDATA"
@@ -228,19 +238,41 @@ class ControlForm(QWidget):
         if main_key == 'SCROLLLISTBOXDATA':
             main_key = "LISTBOXDATA"
 
-        for d in list_dict[main_key]:
-            if sub_key in d and d[sub_key] != value:
-                d[sub_key] = value
-                self.update_modified_state(True)
-
+        if container_key == 'attributes':
+            self._replace_attribute(main_key, sub_key, value)
+        else:
+            self._replace_entries(container_key, main_key, sub_key, value,
+                                  lambda d: sub_key in d and d[sub_key] != value)
 
     def update_texture_property(self, main_key, sub_key, image, value=None):
-        list_dict = self.control_attributes['textures']
+        self._replace_entries('textures', main_key, sub_key, value,
+                              lambda d: 'IMAGE' in d and d['IMAGE'] == image and sub_key in d and d[sub_key] != value)
+
+    def _replace_attribute(self, main_key, sub_key, value):
+        """Sets every `sub_key` field of an attribute statement. The AttributeData and its container are replaced."""
+        data = self.control_attributes['attributes'][main_key]
+        new_data = data.replace(sub_key, value)
+        if new_data is data:
+            return
+
+        container = dict(self.control_attributes['attributes'])
+        container[main_key] = new_data
+        self.control_attributes['attributes'] = container
+        self.update_modified_state(True)
+
+    def _replace_entries(self, container_key, main_key, sub_key, value, matches):
+        """
+        Sets `sub_key` on the matching entries of a texture list. The entries, the list and its
+        container are copied rather than edited in place, since the Reset snapshot of the property editor shares them.
+        """
+        entries = self.control_attributes[container_key][main_key]
+        if not any(matches(d) for d in entries):
+            return
 
-        for d in list_dict[main_key]:
-            if 'IMAGE' in d and d['IMAGE'] == image and sub_key in d and d[sub_key] != value:
-                d[sub_key] = value
-                self.update_modified_state(True)
+        container = dict(self.control_attributes[container_key])
+        container[main_key] = [dict(d, **{sub_key: value}) if matches(d) else d for d in entries]
+        self.control_attributes[container_key] = container
+        self.update_modified_state(True)
 
     def clear(self):
         """Clear all widgets from the layout."""
@@ -317,13 +349,12 @@ def normalize_boolean_values(attributes, boolean_keys):
     MAXCHARS: 16, # integer field
     """
     normalized_data = {}
-    for item in attributes:
-        for key, value in item.items():
-            if key in boolean_keys:
-                if value == 0:
-                    normalized_data[key] = False
-                elif value == 1:
-                    normalized_data[key] = True
-            else:
-                normalized_data[key] = value
+    for key, value in attributes.items():
+        if key in boolean_keys:
+            if value == 0:
+                normalized_data[key] = False
+            elif value == 1:
+                normalized_data[key] = True
+        else:
+            normalized_data[key] = value
     return normalized_data
\ No newline at end of file
@@ -0,0 +1,192 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QCheckBox, QComboBox, QGroupBox, QLabel, QLineEdit, QWidget, QVBoxLayout, QGridLayout, QHBoxLayout
+)
+
+from src.commands import CommandChangeProperties
+
+STATUS_FLAGS = [
+    ("Enabled", "ENABLED"), ("Hidden", "HIDDEN"), ("See Thru", "SEE_THRU"), ("Image", "IMAGE"),
+    ("Border", "BORDER"), ("No Input", "NOINPUT"), ("No Focus", "NOFOCUS"), ("Draggable", "DRAGABLE"),
+    ("Wrap Centered", "WRAP_CENTERED"), ("On Mouse Down", "ON_MOUSE_DOWN"), ("Hotkey Text", "HOTKEY_TEXT"),
+    ("Right Click", "RIGHT_CLICK"), ("Check Like", "CHECK_LIKE"), ("Tab Stop", "TABSTOP"),
+]
+
+MIXED_TEXT = "(mixed)"
+
+
+class MultiObjectForm(QWidget):
+    """
+    Property form for several selected windows. Shows the values they share; differing values are shown
+    as mixed (partially checked boxes, empty fields). Every edit is applied to all of them as one Undo command.
+    """
+
+    def __init__(self, parent=None, main_window=None):
+        super().__init__(parent)
+        self.main_window = main_window
+        self.windows = []
+
+        self.layout = QVBoxLayout(self)
+        self.selection_label = QLabel(self)
+        self.selection_label.setWordWrap(True)
+        self.layout.addWidget(self.selection_label)
+
+        self._setup_status_group()
+        self._setup_text_group()
+        self._setup_font_group()
+        self.layout.addStretch()
+
+    def _setup_status_group(self):
+        self.status_group = QGroupBox("Status", self)
+        status_layout = QGridLayout(self.status_group)
+
+        self.checkboxes = {}
+        for index, (label, flag) in enumerate(STATUS_FLAGS):
+            cb = QCheckBox(label)
+            # clicked is only emitted for user clicks, refreshing the form does not commit anything
+            cb.clicked.connect(lambda checked, status_flag=flag: self.commit_status_change(status_flag, checked))
+            status_layout.addWidget(cb, index // 2, index % 2)
+            self.checkboxes[flag] = cb
+
+        self.layout.addWidget(self.status_group)
+
+    def _setup_text_group(self):
+        self.text_group = QGroupBox("Text Data", self)
+        grid_layout = QGridLayout(self.text_group)
+
+        self.text_entry = QLineEdit()
+        self.tooltip_entry = QLineEdit()
+
+        grid_layout.addWidget(QLabel("Text"), 0, 0)
+        grid_layout.addWidget(self.text_entry, 0, 1)
+        grid_layout.addWidget(QLabel("Tooltip"), 1, 0)
+        grid_layout.addWidget(self.tooltip_entry, 1, 1)
+
+        self.text_entry.editingFinished.connect(lambda: self.commit_text_change('TEXT', self.text_entry))
+        self.tooltip_entry.editingFinished.connect(lambda: self.commit_text_change('TOOLTIPTEXT', self.tooltip_entry))
+
+        self.layout.addWidget(self.text_group)
+
+    def _setup_font_group(self):
+        self.font_group = QGroupBox("Font Style", self)
+        font_layout = QVBoxLayout(self.font_group)
+
+        font_h = QHBoxLayout()
+        self.bold_checkbox = QCheckBox("Bold")
+        self.font_list = QComboBox()
+        self.font_list.addItems(["Arial", "Times New Roman", "Courier New", "Verdana"])
+        font_h.addWidget(self.bold_checkbox)
+        font_h.addWidget(self.font_list)
+
+        template_h = QHBoxLayout()
+        self.template_list = QComboBox()
+        self.template_list.addItems(["Template 1", "Template 2", "Template 3"])
+        template_h.addWidget(QLabel("Template"))
+        template_h.addWidget(self.template_list)
+
+        font_layout.addLayout(font_h)
+        font_layout.addLayout(template_h)
+
+        # clicked / activated are user-only signals, see _setup_status_group
+        self.bold_checkbox.clicked.connect(
+            lambda checked: self.commit_sub_property_change('FONT', 'bold', int(checked))
+        )
+        self.font_list.activated.connect(
+            lambda index: self.commit_sub_property_change('FONT', 'name', self.font_list.itemText(index))
+        )
+        self.template_list.activated.connect(
+            lambda index: self.commit_property_change('HEADERTEMPLATE', self.template_list.itemText(index))
+        )
+
+        self.layout.addWidget(self.font_group)
+
+    # --- DISPLAY ---
+    def load_windows(self, windows):
+        self.windows = list(windows)
+        types = sorted({window.properties.get('WINDOWTYPE', 'USER') for window in self.windows})
+        self.selection_label.setText(f"{len(self.windows)} objects selected ({', '.join(types)}). "
+                                     f"Changes apply to all of them.")
+        self.refresh()
+
+    def refresh(self):
+        """Shows the shared values of the selected windows, differing ones as mixed."""
+        for flag, cb in self.checkboxes.items():
+            count = sum(1 for window in self.windows if flag in window.properties.get('STATUS', []))
+            self._show_check_state(cb, count)
+
+        self._show_line_edit(self.text_entry, 'TEXT')
+        self._show_line_edit(self.tooltip_entry, 'TOOLTIPTEXT')
+
+        fonts = [window.properties.get('FONT', {}) for window in self.windows]
+        self._show_check_state(self.bold_checkbox, sum(1 for font in fonts if font.get('bold') == 1))
+        self._show_combo_box(self.font_list, {font.get('name') for font in fonts})
+        self._show_combo_box(self.template_list,
+                             {window.properties.get('HEADERTEMPLATE', '') for window in self.windows})
+
+    def _show_check_state(self, cb, count):
+        if 0 < count < len(self.windows):
+            cb.setCheckState(Qt.CheckState.PartiallyChecked)  # Turns tristate on; a click then checks it
+        else:
+            cb.setTristate(False)
+            cb.setChecked(count > 0)
+
+    def _show_line_edit(self, line_edit, prop_key):
+        values = {window.properties.get(prop_key, '') for window in self.windows}
+        mixed = len(values) > 1
+        line_edit.setText('' if mixed else next(iter(values), ''))
+        line_edit.setPlaceholderText(MIXED_TEXT if mixed else '')
+
+    @staticmethod
+    def _show_combo_box(combo_box, values):
+        if len(values) != 1:
+            combo_box.setCurrentIndex(-1)
+            return
+        value = values.pop()
+        if combo_box.findText(value) < 0:
+            combo_box.addItem(value)
+        combo_box.setCurrentText(value)
+
+    # --- UNDO STACK COMMAND WRAPPERS ---
+    def commit_status_change(self, flag, checked):
+        def set_flag(status):
+            flags = status or []
+            if checked == (flag in flags):
+                return status
+            return flags + [flag] if checked else [f for f in flags if f != flag]
+
+        self._commit('STATUS', set_flag, f"{'Set' if checked else 'Clear'} {flag} on {len(self.windows)} Objects")
+
+    def commit_text_change(self, prop_key, line_edit):
+        if not line_edit.isModified():
+            return  # Leaving an untouched (possibly mixed) field must not overwrite the values
+        line_edit.setModified(False)
+        self.commit_property_change(prop_key, line_edit.text())
+
+    def commit_property_change(self, prop_key, new_value):
+        self._commit(prop_key, lambda old_value: new_value, f"Change {prop_key} of {len(self.windows)} Objects")
+
+    def commit_sub_property_change(self, dict_key, sub_key, new_value):
+        def set_sub_value(old_dict):
+            new_dict = dict(old_dict or {})
+            new_dict[sub_key] = new_value
+            return new_dict
+
+        self._commit(dict_key, set_sub_value, f"Change {dict_key} of {len(self.windows)} Objects")
+
+    def _commit(self, prop_key, make_value, description):
+        """Pushes one command changing `prop_key` of every selected window that does not have the new value yet."""
+        if getattr(self.main_window, '_is_undoing', False) or getattr(self.main_window, '_is_syncing', False):
+            return
+
+        changes = []
+        for window in self.windows:
+            old_value = window.properties.get(prop_key)
+            new_value = make_value(old_value)
+            if new_value != old_value:
+                changes.append((window.window_uuid, old_value, new_value))
+
+        if changes:
+            self.main_window.undo_stack.push(
+                CommandChangeProperties(self.main_window, prop_key, changes, description))
+        else:
+            self.refresh()  # Nothing changed; drop the partial state of the clicked widget
@@ -135,6 +135,21 @@ class ColorPickerApp(QWidget):
             self.color_data[tab_name]["shadow_button"].setStyleSheet(f"background-color: {shadow.name()}; color: {text_shadow_color.name()};")
             self.color_data[tab_name]["shadow_button"].setText(f"RGB: {shadow.red()}, {shadow.green()}, {shadow.blue()}")
 
+    def set_colors(self, tab_name, color, shadow):
+        """
+        Shows other colors in an existing tab, e.g. when the widget is reused for another control.
+
+        Args:
+            tab_name (str): The name of the tab.
+            color (QColor): The main color.
+            shadow (QColor): The shadow color.
+        """
+        self.color_data[tab_name]["color"] = color
+        self.color_data[tab_name]["shadow"] = shadow
+        self.color_data[tab_name]["color_alpha_spinbox"].setValue(color.alpha())
+        self.color_data[tab_name]["shadow_alpha_spinbox"].setValue(shadow.alpha())
+        self.update_buttons_from_color_data()
+
     def get_contrasting_text_color(self, background_color):
         brightness = self.calculate_brightness(background_color)
         return QColor(255, 255, 255) if brightness < 128 else QColor(0, 0, 0)
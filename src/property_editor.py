@@ -1,23 +1,48 @@
 from PyQt6.QtWidgets import QTabWidget, QTextEdit, QVBoxLayout, QWidget, QLabel, QHBoxLayout, QPushButton, QSizePolicy
 from PyQt6.QtGui import QColor
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 import copy
+from collections import OrderedDict
+
+from src.tracing import traced
+
+
+class RawValidationJob(QThread):
+    """Runs the validation rules on the window a Raw tab edit would produce, off the GUI thread."""
+    validated_signal = pyqtSignal(object)  # List of ValidationIssue
+
+    def __init__(self, rules, candidate, parent=None):
+        super().__init__(parent)
+        self.rules = rules
+        self.candidate = candidate  # Copy of the window with the edit applied; nothing else refers to it
+
+    def run(self):
+        from src.window.validation import Validator
+        self.validated_signal.emit(Validator(self.rules).validate_window(self.candidate))
 
-from src.properties.control_properties import ControlForm
-from src.window.line_iterator import LineIterator
-from src.window.window_properties import parse_window_properties
-from src.properties.general_properties import GeneralForm
 
 class PropertyEditor(QWidget):
     """
     A widget that provides a tabbed interface for viewing and editing object properties.
     """
 
+    # Control tab forms kept alive for reuse
+    max_control_forms = 12
+    # Pause in typing after which the Raw tab edit is applied
+    raw_apply_delay_ms = 500
+
+    GENERAL_TAB, CONTROL_TAB, RAW_TAB = range(3)
+
     def __init__(self, parent=None, main_window=None):
         super().__init__(parent)
         self.main_window = main_window
         self.properties = {}
         self.control_object = None
+        self._general_form = None  # Built on first use
+        self._multi_form = None  # Built on the first multi-selection
+        self._control_forms = OrderedDict()  # Control tab forms by layout key, see load_control_properties
+        self.control_properties = None
+        self._dirty_tabs = set()  # Tabs not showing the selected object yet, filled when they become visible
 
         # Create tabs
         self.tabs = QTabWidget(self)
@@ -44,14 +69,31 @@ class PropertyEditor(QWidget):
         self.setLayout(layout)
         self.original_properties = ''
 
+    @property
+    def multi_properties(self):
+        """Form shown instead of the tabs while several objects are selected."""
+        if self._multi_form is None:
+            from src.properties.multi_properties import MultiObjectForm
+            self._multi_form = MultiObjectForm(self, main_window=self.main_window)
+            self._multi_form.setVisible(False)
+            self.layout().insertWidget(0, self._multi_form)
+        return self._multi_form
+
     def create_general_tab(self):
-        """Creates the General tab and its components."""
+        """Creates the General tab. Its form is built when first needed, see `general_properties`."""
         self.general_tab = QWidget()
-        self.general_properties = GeneralForm(self, general_data=self.properties, main_window=self.main_window)
-        general_layout = QVBoxLayout(self.general_tab)
-        general_layout.addWidget(self.general_properties)
+        QVBoxLayout(self.general_tab)
         self.tabs.addTab(self.general_tab, "General Properties")
 
+    @property
+    def general_properties(self):
+        """The General tab form, built on first access to keep it out of application startup."""
+        if self._general_form is None:
+            from src.properties.general_properties import GeneralForm
+            self._general_form = GeneralForm(self, general_data=self.properties, main_window=self.main_window)
+            self.general_tab.layout().addWidget(self._general_form)
+        return self._general_form
+
     def create_control_tab(self):
         """Creates the Control tab and its components."""
         self.control_tab = QWidget()
@@ -84,6 +126,16 @@ class PropertyEditor(QWidget):
         self.save_button.clicked.connect(self.save_raw_properties)
         self.reset_button.clicked.connect(self.reset)
 
+        # Live editing: once typing pauses, the statements changed since the text was loaded are applied
+        self._raw_statements = {}  # tag -> statement text, as the model currently is
+        self._raw_job = None  # Validation of the pending edit
+        self._applying_raw = False
+        self._raw_timer = QTimer(self)
+        self._raw_timer.setSingleShot(True)
+        self._raw_timer.setInterval(self.raw_apply_delay_ms)
+        self._raw_timer.timeout.connect(self.apply_raw_edit)
+        self.raw_edit.textChanged.connect(self._raw_text_edited)
+
         # Add buttons and error label to layout
         self.buttons_layout.addWidget(self.save_button)
         self.buttons_layout.addWidget(self.reset_button)
@@ -99,6 +151,7 @@ class PropertyEditor(QWidget):
         # Set layout for raw_tab
         self.raw_tab.setLayout(raw_layout)
 
+    @traced(category="properties")
     def load_property(self, control):
         """Loads the properties of a selected object into the editor."""
         self.main_window._is_syncing = True  # GUARD: Block UI updates from triggering Undo commands
@@ -110,21 +163,92 @@ class PropertyEditor(QWidget):
                 self.empty_label.setVisible(True)  # Show the empty label if no properties
                 return
 
-            self.original_properties = copy.deepcopy(properties)
+            # Copy-on-write snapshot for Reset: only the top level is copied, the nested values are shared.
+            # Model writers replace nested values instead of changing them in place, so they stay intact.
+            self.original_properties = dict(properties)
             self.properties = control.properties
             self.control_object = control
             self.empty_label.setVisible(False)
             self.tabs.setVisible(True)
 
-            # Load the tabs
-            self.load_general_properties()
-            self.load_control_properties()
-            self.load_raw_properties()
+            # Only the visible tab is filled now, the others when they are shown
+            self.mark_dirty()
 
             self.main_window.update_modified_state(status)
         finally:
             self.main_window._is_syncing = False
 
+    @traced(category="properties")
+    def load_properties(self, windows):
+        """Shows the properties shared by several selected objects."""
+        self.clear()
+        self.control_object = None
+        self.empty_label.setVisible(False)
+        self.multi_properties.load_windows(windows)
+        self.multi_properties.setVisible(True)
+
+    def mark_dirty(self, *tabs):
+        """Marks tabs (default: all) as out of date with the selected object. The visible one is refilled right away."""
+        self._dirty_tabs.update(tabs or (self.GENERAL_TAB, self.CONTROL_TAB, self.RAW_TAB))
+        self._refresh_current_tab()
+
+    def _refresh_current_tab(self):
+        index = self.tabs.currentIndex()
+        if index not in self._dirty_tabs or self.control_object is None:
+            return
+        self._dirty_tabs.discard(index)
+
+        loaders = {
+            self.GENERAL_TAB: self.load_general_properties,
+            self.CONTROL_TAB: self.load_control_properties,
+            self.RAW_TAB: self.load_raw_properties,
+        }
+        self._run_synced(loaders[index])
+
+    def _run_synced(self, loader, *args):
+        was_syncing = getattr(self.main_window, '_is_syncing', False)
+        self.main_window._is_syncing = True  # GUARD: filling widgets must not push Undo commands
+        try:
+            loader(*args)
+        finally:
+            self.main_window._is_syncing = was_syncing
+
+    def property_changed(self, prop_key):
+        """
+        Reflects a change of one property of the selected object (property Undo/Redo).
+        Only the widget showing `prop_key` is refilled; the Raw tab is regenerated when it is shown.
+        """
+        show_property = self._general_property_loaders().get(prop_key)
+        if show_property is None:
+            self.mark_dirty(self.GENERAL_TAB, self.RAW_TAB)
+            return
+        if self._general_form is not None and self.GENERAL_TAB not in self._dirty_tabs:
+            self._run_synced(show_property, self.properties)
+        self.mark_dirty(self.RAW_TAB)
+
+    def show_geometry(self, ul, br):
+        """Reflects a geometry change of the selected object (canvas drag, undo/redo) without firing Undo commands."""
+        if self._general_form is not None and self.GENERAL_TAB not in self._dirty_tabs:
+            gp = self.general_properties
+            for spinbox, value in [
+                (gp.upper_left_x_spinbox, ul[0]),
+                (gp.upper_left_y_spinbox, ul[1]),
+                (gp.bottom_right_x_spinbox, br[0]),
+                (gp.bottom_right_y_spinbox, br[1]),
+                (gp.width_spinbox, max(0, br[0] - ul[0])),
+                (gp.height_spinbox, max(0, br[1] - ul[1]))
+            ]:
+                spinbox.blockSignals(True)
+                spinbox.setValue(value)
+                spinbox.blockSignals(False)
+        self.mark_dirty(self.RAW_TAB)
+
+    def _control_form_changed(self, status):
+        """A Control tab edit changed the model directly; the Raw tab has to be regenerated."""
+        self.main_window.update_modified_state(status)
+        self.main_window.invalidate_validation([self.main_window.selected_object])
+        self.mark_dirty(self.RAW_TAB)
+
     def load_control_properties(self, properties=None):
         """Loads the control properties into the editor."""
         if not properties:
@@ -134,15 +258,26 @@ class PropertyEditor(QWidget):
         if self.control_tab.layout() is None:
             self.control_tab.setLayout(QVBoxLayout())
 
-        # Clear the layout of the control tab
-        for i in reversed(range(self.control_tab.layout().count())):
-            widget = self.control_tab.layout().itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
-
-        self.control_properties = ControlForm(self, control_attributes=properties)
-        self.control_tab.layout().addWidget(self.control_properties)
-        self.control_properties.update_modified_state = self.main_window.update_modified_state
+        # Reuse a form built for a control with the same layout, only its values are refilled
+        from src.properties.control_properties import ControlForm, control_form_layout_key
+        key = control_form_layout_key(properties)
+        form = self._control_forms.pop(key, None)
+        if form is None:
+            form = ControlForm(self, control_attributes=properties)
+            form.update_modified_state = self._control_form_changed
+            self.control_tab.layout().addWidget(form)
+        else:
+            form.bind(properties)
+        self._control_forms[key] = form  # Most recently used last
+
+        while len(self._control_forms) > self.max_control_forms:
+            _, evicted = self._control_forms.popitem(last=False)
+            evicted.setParent(None)
+            evicted.deleteLater()
+
+        for pooled in self._control_forms.values():
+            pooled.setVisible(pooled is form)
+        self.control_properties = form
 
         # self.control_properties.type = properties.get('WINDOWTYPE', 'No type')
         # self.control_properties.type_label.setText(f"Type: {self.control_properties.type}")
@@ -156,9 +291,6 @@ class PropertyEditor(QWidget):
         self.general_properties.general_data = properties
         self.general_properties.type = properties.get('WINDOWTYPE', 'USER')
 
-        # Set NAME value
-        self.general_properties.name_entry.setText(properties.get('NAME', ''))
-
         # Set SCREENRECT values
         screen_rect = properties.get('SCREENRECT', [])
 
@@ -179,7 +311,26 @@ class PropertyEditor(QWidget):
         self.general_properties.width_spinbox.setValue(max(0, width))
         self.general_properties.height_spinbox.setValue(max(0, height))
 
-        # Set STATUS values (checkboxes for each status)
+        # The remaining widgets each show one property, see property_changed
+        for show_property in self._general_property_loaders().values():
+            show_property(properties)
+
+    def _general_property_loaders(self):
+        """General tab widget loaders by the property key they show."""
+        return {
+            'NAME': self._show_name,
+            'STATUS': self._show_status,
+            'FONT': self._show_font,
+            'HEADERTEMPLATE': self._show_template,
+            'TEXT': self._show_text,
+            'TOOLTIPTEXT': self._show_tooltip,
+            'TEXTCOLOR': self._show_text_color,
+        }
+
+    def _show_name(self, properties):
+        self.general_properties.name_entry.setText(properties.get('NAME', ''))
+
+    def _show_status(self, properties):
         status_values = properties.get('STATUS', [])
         status_dict = {
             self.general_properties.status_enable: "ENABLED",
@@ -205,7 +356,7 @@ class PropertyEditor(QWidget):
             else:
                 checkbox.setChecked(False)
 
-        # Set FONT values and TEMPLATE
+    def _show_font(self, properties):
         font_data = properties.get('FONT', [])
         font_name = font_data.get('name')
         if font_name not in [self.general_properties.font_list.itemText(i) for i in range(self.general_properties.font_list.count())]:
@@ -213,16 +364,19 @@ class PropertyEditor(QWidget):
         self.general_properties.font_list.setCurrentText(font_name)
         self.general_properties.bold_checkbox.setChecked(font_data['bold'] == 1)
 
+    def _show_template(self, properties):
         template_name = properties.get('HEADERTEMPLATE', '')
         if template_name not in [self.general_properties.template_list.itemText(i) for i in range(self.general_properties.template_list.count())]:
             self.general_properties.template_list.addItem(template_name)
         self.general_properties.template_list.setCurrentText(template_name)
 
-        # Set TEXT and TOOLTIP value
+    def _show_text(self, properties):
         self.general_properties.text_entry.setText(properties.get('TEXT', ''))
+
+    def _show_tooltip(self, properties):
         self.general_properties.tooltip_entry.setText(properties.get('TOOLTIPTEXT', ''))
 
-        # Set TEXTCOLOR values
+    def _show_text_color(self, properties):
         text_color_data = properties.get('TEXTCOLOR', {})
         enable_color = text_color_data.get('ENABLED', "#ff0000")
         enable_shadow = text_color_data.get('ENABLEDBORDER', "#000000")
@@ -248,11 +402,32 @@ class PropertyEditor(QWidget):
 
     def load_raw_properties(self):
         """Loads the raw properties into the raw editor."""
-        self.raw_edit.setPlainText(repr(self.control_object))
+        if self._applying_raw:
+            # The model now matches the text being edited; replacing it would move the cursor
+            self._raw_statements = self._read_raw_statements()
+            return
+        self._set_raw_text(repr(self.control_object))
+        self._raw_statements = self._read_raw_statements()
+
+    def _set_raw_text(self, text):
+        self._raw_timer.stop()
+        self._raw_job = None  # A pending result is for the replaced text
+        self.raw_edit.blockSignals(True)  # Not an edit
+        self.raw_edit.setPlainText(text)
+        self.raw_edit.blockSignals(False)
+
+    def _read_raw_statements(self):
+        from src.window.source_text import iter_statements
+
+        text = self.raw_edit.toPlainText()
+        statements = {}
+        for tag, line_start, start, end in iter_statements(text, 0, len(text)):
+            statements.setdefault(tag, text[start:end])
+        return statements
 
     def display_error(self, error_message):
         """Displays an error message in the property editor."""
-        self.raw_edit.setPlainText(f"Error: {error_message}")
+        self._set_raw_text(f"Error: {error_message}")
         self.tabs.setVisible(False)
         self.empty_label.setVisible(True)
         self.empty_label.setText(f"Error: {error_message}")
@@ -262,46 +437,133 @@ class PropertyEditor(QWidget):
 
     def clear(self):
         """Clears all content in the editor."""
-        self.raw_edit.clear()
+        self._set_raw_text("")
+        self._raw_statements = {}
         self.tabs.setVisible(False)
+        if self._multi_form is not None:
+            self._multi_form.setVisible(False)
         self.empty_label.setVisible(True)
         self.error_label.clear()  # Clear the error label text and styling
 
     def save_raw_properties(self):
-        """Saves the current raw into the properties object."""
-        raw = self.raw_edit.toPlainText()
-
+        """Applies the Raw tab right away (Load button), validating on the GUI thread."""
+        self.apply_raw_edit(background=False)
+
+    def _raw_text_edited(self):
+        if self.control_object is not None:
+            self._raw_timer.start()  # Restarted by every keystroke
+
+    def apply_raw_edit(self, background=True):
+        """
+        Applies the Raw tab to the selected window. Only the statements that differ from the text the model
+        was last shown or applied as are parsed; the window with those changes is validated, on a worker
+        thread unless `background` is False, and the changes are pushed as one Undo command.
+        """
+        from src.error_handler import ErrorHandler
+        from src.window.source_text import set_statement_value, statement_values
+        from src.window.window_properties import parse_statements
+
+        self._raw_timer.stop()
+        window = self.control_object
+        if window is None:
+            return
+
+        statements = self._read_raw_statements()
+        changed = [tag for tag in dict.fromkeys([*self._raw_statements, *statements])
+                   if statements.get(tag) != self._raw_statements.get(tag)]
+        new_tags = tuple(statements)
+        if not changed and new_tags == tuple(self._raw_statements):
+            self._raw_job = None
+            self._show_raw_result("Loaded successfully!", "green")
+            return
+
+        errors = []
+        try:
+            with ErrorHandler.collecting(errors):
+                parsed = parse_statements([statements[tag] for tag in changed if tag in statements],
+                                          window.properties['WINDOWTYPE'], window.file_name)
+        except ValueError:
+            pass  # Recorded in `errors`
+        if errors:
+            self._raw_job = None
+            self._show_raw_result(f"Save failed: {errors[0][3]}", "red")
+            return
+
+        current = statement_values(window.properties, window.file_name)
+        changes = []
+        candidate_properties = dict(window.properties)
+        for tag in changed:
+            # Removed statements get the value of a missing tag; removed textures / attributes go away
+            new_value = parsed.get(tag)
+            if new_value != current.get(tag):
+                changes.append((tag, current.get(tag), new_value))
+                set_statement_value(candidate_properties, tag, new_value)
+
+        candidate = copy.copy(window)
+        candidate.properties = candidate_properties
+        candidate.source_tags = new_tags
+
+        rules = self.main_window.parser.validator.rules
+        if not background:
+            from src.window.validation import Validator
+            self._raw_job = None
+            self._finish_raw_edit(None, window, changes, new_tags, statements,
+                                  Validator(rules).validate_window(candidate))
+            return
+
+        job = RawValidationJob(rules, candidate, self)
+        self._raw_job = job
+        job.validated_signal.connect(
+            lambda issues: self._finish_raw_edit(job, window, changes, new_tags, statements, issues))
+        job.finished.connect(job.deleteLater)
+        job.start()
+
+    def _finish_raw_edit(self, job, window, changes, new_tags, statements, issues):
+        """Pushes a validated Raw tab edit, unless the text or the model changed in the meantime."""
+        from src.commands import CommandChangeStatements
+        from src.window.source_text import statement_values
+
+        if job is not self._raw_job or window is not self.control_object:
+            return
+        self._raw_job = None
+        current = statement_values(window.properties, window.file_name)
+        if any(current.get(tag) != old_value for tag, old_value, new_value in changes):
+            return  # Edited elsewhere (e.g. Undo) while validating
+
+        critical = [issue for issue in issues if issue.error_level == 1]
+        if critical:
+            self._show_raw_result(f"Save failed: {critical[0].message}", "red")
+            return
+
+        self._applying_raw = True
         try:
-            self.control_object = parse_window_properties(LineIterator(raw.splitlines()),
-                                                      window_uuid=self.control_object.window_uuid,
-                                                      file_name=self.control_object.file_name)
-
-            # If no error occurs, update the properties
-            self.properties = self.control_object.properties
-            self.error_label.setText("")
-            self.main_window.selected_object.properties = self.properties
-            self.load_general_properties()
-            self.main_window.update_modified_state(True)
-            self.error_label.setText("Loaded successfully!")
-            self.error_label.setStyleSheet("color: green;")
-        except Exception as e:
-            self.error_label.setStyleSheet("color: red;")
-            self.error_label.setText(f"Save failed: {str(e)}")
+            self.main_window.undo_stack.push(CommandChangeStatements(
+                self.main_window, window.window_uuid, changes, window.source_tags, new_tags,
+                f"Edit {', '.join(tag for tag, old_value, new_value in changes) or 'Tag Order'} (Raw)"))
+        finally:
+            self._applying_raw = False
+        self._raw_statements = statements
+        self.properties = window.properties
+
+        warnings = "\n".join(issue.message for issue in issues)
+        self._show_raw_result(f"Loaded successfully!\n{warnings}" if warnings else "Loaded successfully!",
+                              "orange" if warnings else "green")
+
+    def _show_raw_result(self, text, color):
+        self.error_label.setText(text)
+        self.error_label.setStyleSheet(f"color: {color};")
 
     def reset(self):
         """Resets the raw to its original state."""
         self.main_window.selected_object.properties = copy.deepcopy(self.original_properties)
         self.properties = self.main_window.selected_object.properties
-        self.load_raw_properties()
-        self.load_general_properties()
-        self.load_control_properties()
+        self.main_window.invalidate_validation([self.main_window.selected_object])
+        self.mark_dirty()  # Refilling is guarded, it must not write back into the restored data
+        self.main_window.visual_preview.update_item_geometry_from_data(self.main_window.selected_object)
         self.error_label.clear()
         self.error_label.setObjectName("")
         self.error_label.setText("Reset successfully!")
         self.error_label.setStyleSheet("color: green;")
 
     def tab_changed(self, index):
-        if index == 2:
-            self.load_raw_properties()
-        elif index == 1:
-            self.load_control_properties()
\ No newline at end of file
+        self._refresh_current_tab()
\ No newline at end of file
@@ -70,8 +70,7 @@ class SettingsWidget(QWidget):
 
     def load_settings(self):
         """Load settings from JSON file and populate the fields."""
-        env_manager = EnvironmentManager(f'resources/user_config.json')
-        settings = env_manager.load_data()
+        settings = self.config.load_data()
 
         # Check if the settings exist, and if so, populate the fields
         if settings:
@@ -90,12 +89,6 @@ class SettingsWidget(QWidget):
         theme = self.theme_combo.currentText()
         language = self.language_combo.currentText()
 
-        # Save the settings
-        self.config.set('username', username)
-        self.config.set('game_directory', game_directory)
-        self.config.set('theme', theme)
-        self.config.set('language', language)
-
         settings = {
             "username": username,
             "game_directory": game_directory,
@@ -103,8 +96,8 @@ class SettingsWidget(QWidget):
             "language": language,
         }
 
-        # Save the merged settings back to JSON
-        EnvironmentManager(f'resources/user_config.json').save_data(settings)
+        # Merge the settings into the config (written back in the background)
+        self.config.save_data(settings)
 
         print("Settings saved successfully.")
 
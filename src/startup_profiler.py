@@ -0,0 +1,148 @@
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class _TimedLoader:
+    """Wraps a module loader to time module creation and execution."""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        start = time.perf_counter()
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            # Extension modules are loaded here; count it as part of the importing module's children
+            elapsed = time.perf_counter() - start
+            if self._profiler._import_stack:
+                self._profiler._import_stack[-1] += elapsed
+            self._profiler._add_module_time(spec.name, elapsed, elapsed)
+
+    def exec_module(self, module):
+        # Hide the wrapper from the module afterwards, some libraries inspect their own loader
+        module.__loader__ = self._loader
+        if getattr(module, '__spec__', None) is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._profiler._import_stack.pop()
+            if self._profiler._import_stack:
+                self._profiler._import_stack[-1] += elapsed
+            self._profiler._add_module_time(module.__name__, elapsed - children, elapsed)
+
+
+class _ImportTimer:
+    """Meta path hook that hands out timed loaders for every module imported while profiling."""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self.profiler)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Collects the time spent importing modules and building widgets until the main window is first painted.
+    Enabled with `--profile-startup`; while disabled, `section` is a shared no-op context.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.start_time = None
+        self.module_times = {}  # module -> [self seconds, cumulative seconds]
+        self.sections = []  # (depth, name, seconds) in completion order
+        self._import_stack = []
+        self._section_depth = 0
+        self._import_timer = None
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.start_time = time.perf_counter()
+        self._import_timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self._import_timer)
+
+    def _add_module_time(self, name, self_seconds, cumulative_seconds=0.0):
+        times = self.module_times.setdefault(name, [0.0, 0.0])
+        times[0] += self_seconds
+        times[1] += cumulative_seconds
+
+    def section(self, name):
+        """Times a startup step, e.g. the construction of a panel. Nested sections are indented in the report."""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed_section(name)
+
+    @contextmanager
+    def _timed_section(self, name):
+        depth = self._section_depth
+        self._section_depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._section_depth -= 1
+            self.sections.append((depth, name, time.perf_counter() - start))
+
+    def finish(self, top_modules=25):
+        """Stops profiling and returns the report text."""
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+        total = time.perf_counter() - self.start_time if self.start_time else 0.0
+        self.enabled = False
+        return self.report(total, top_modules)
+
+    def report(self, total, top_modules=25):
+        lines = ["=== GenWND startup profile ===", f"Until first paint: {total * 1000:8.1f} ms", ""]
+
+        import_total = sum(times[0] for times in self.module_times.values())
+        lines.append(f"Imports: {import_total * 1000:.1f} ms in {len(self.module_times)} modules "
+                     f"(slowest {top_modules}, self / cumulative ms)")
+        slowest = sorted(self.module_times.items(), key=lambda item: item[1][0], reverse=True)[:top_modules]
+        for name, (self_seconds, cumulative_seconds) in slowest:
+            lines.append(f"  {self_seconds * 1000:8.1f} {cumulative_seconds * 1000:8.1f}  {name}")
+
+        lines.append("")
+        lines.append("Startup steps (ms):")
+        # Sections complete children-first; print them parents-first
+        for depth, name, seconds in self._ordered_sections():
+            lines.append(f"  {seconds * 1000:8.1f}  {'  ' * depth}{name}")
+        return "\n".join(lines)
+
+    def _ordered_sections(self):
+        ordered = []
+        pending = []  # Children waiting for their parent, per depth
+        for depth, name, seconds in self.sections:
+            children = []
+            while pending and pending[-1][0] > depth:
+                children.insert(0, pending.pop()[1])
+            entry = [(depth, name, seconds)] + [line for child in children for line in child]
+            if depth == 0:
+                ordered.extend(entry)
+            else:
+                pending.append((depth, entry))
+        return ordered
+
+
+# Process-wide profiler, enabled by main.py before the heavy imports
+startup_profiler = StartupProfiler()
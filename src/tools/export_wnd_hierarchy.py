@@ -27,17 +27,9 @@ def generate_visual_tree(windows, prefix=""):
         is_last = (i == len(windows) - 1)
         connector = "└── " if is_last else "├── "
 
-        # Safely extract properties
-        props = getattr(window, 'properties', {})
-        name = 'Unnamed'
-        wtype = 'UnknownType'
-
-        if isinstance(props, dict):
-            name = props.get('Name', props.get('NAME', props.get('name', 'Unnamed')))
-            wtype = props.get('WINDOWTYPE', props.get('WindowType', props.get('Type', 'UnknownType')))
-        else:
-            name = getattr(props, 'Name', getattr(props, 'NAME', getattr(props, 'name', 'Unnamed')))
-            wtype = getattr(props, 'WINDOWTYPE', getattr(props, 'WindowType', getattr(props, 'Type', 'UnknownType')))
+        # Type and name are known from the structural scan, the rest of the window is never decoded
+        name = window.peek_property('NAME', 'Unnamed')
+        wtype = window.peek_property('WINDOWTYPE', 'UnknownType')
 
         name = name.replace('"', '')
 
@@ -85,9 +77,9 @@ def main():
         print(f"Error: file not found: {wnd_file_path}")
         return
 
-    # 2) Run parser (correct method is parse_file, not parse)
+    # 2) Run parser; the hierarchy only needs the structural scan
     my_parser = WndParser()
-    my_parser.parse_file(wnd_file_path)
+    my_parser.parse_file(wnd_file_path, lazy=True)
 
     # 3) Get windows (via attribute or get_windows())
     real_root_windows = my_parser.get_windows()
@@ -0,0 +1,254 @@
+import argparse
+import copy
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the project root to Python's path dynamically
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+src_folder = os.path.join(project_root, 'src')
+sys.path.insert(0, src_folder)
+
+# Must be set before the QApplication is created
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PyQt6.QtCore import Qt, QPoint, QT_VERSION_STR, PYQT_VERSION_STR
+    from PyQt6.QtTest import QTest
+    from PyQt6.QtWidgets import QApplication
+
+    from src.window.wnd_parser import WndParser
+    from src.window.controls.pushbutton import PushButtonControl
+    from src.error_handler import ErrorHandler
+except ImportError as e:
+    print(f"Import Error: {e}")
+    print("Please ensure you are running this script from the project root.")
+    sys.exit(1)
+
+
+DEFAULT_SIZES = [100, 500, 2000]
+TEMPLATE_FILE = os.path.join(project_root, 'resources', 'example.wnd')
+
+
+# =====================================================================
+# GENERATED DOCUMENTS
+# =====================================================================
+def generate_document(path, window_count):
+    """
+    Writes a WND file with `window_count` push buttons laid out in a non-overlapping grid
+    inside the root window of resources/example.wnd.
+    """
+    template = WndParser()
+    template.parse_file(TEMPLATE_FILE)
+    root = copy.deepcopy(template.windows[0])
+    button = _find_window(template.windows, PushButtonControl)
+
+    width, height = root.properties['SCREENRECT']['BOTTOMRIGHT']
+    columns = max(1, math.ceil(math.sqrt(window_count * width / height)))
+    rows = math.ceil(window_count / columns)
+    cell_width, cell_height = width / columns, height / rows
+
+    root.children = []
+    for index in range(window_count):
+        child = copy.deepcopy(button)
+        left = int((index % columns) * cell_width)
+        top = int((index // columns) * cell_height)
+        child.properties['NAME'] = f"Button{index}"
+        child.properties['SCREENRECT']['UPPERLEFT'] = (left, top)
+        child.properties['SCREENRECT']['BOTTOMRIGHT'] = (left + max(2, int(cell_width) - 2),
+                                                         top + max(2, int(cell_height) - 2))
+        root.children.append(child)
+
+    template.windows = [root]
+    template.enforce_file_names(os.path.basename(path))
+    with open(path, 'w') as f:
+        f.write(repr(template))
+        f.write("\n")
+
+
+def _find_window(windows, control_class):
+    for window in windows:
+        if isinstance(window, control_class):
+            return window
+        found = _find_window(window.children or [], control_class)
+        if found is not None:
+            return found
+    return None
+
+
+# =====================================================================
+# MEASUREMENT
+# =====================================================================
+def summarize(samples):
+    """Median / p95 (nearest rank) of a list of millisecond samples."""
+    ordered = sorted(samples)
+    p95_index = max(0, math.ceil(len(ordered) * 0.95) - 1)
+    return {
+        "samples": len(ordered),
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[p95_index], 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+class GuiBenchmark:
+    """Drives a MainWindow under the offscreen platform and times interactive operations on it."""
+
+    def __init__(self, app, window, repeat):
+        self.app = app
+        self.window = window
+        self.repeat = repeat
+
+    def measure(self, action, setup=None, repeat=None):
+        """
+        Runs `action` once untimed (warm-up), then `repeat` times, each including the event processing
+        (repaints, deferred refreshes) it triggers. Returns the samples in milliseconds.
+        """
+        samples = []
+        for iteration in range((repeat or self.repeat) + 1):
+            if setup:
+                setup(iteration)
+                self.app.processEvents()
+            start = time.perf_counter()
+            action(iteration)
+            self.app.processEvents()
+            if iteration:
+                samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+    def run_document(self, file_path, drag_counts, undo_steps):
+        window = self.window
+        preview = window.visual_preview
+        results = {}
+
+        window.open_document(file_path)
+        self.app.processEvents()
+        results["load"] = self.measure(lambda i: window.load_wnd_file(file_path))
+
+        buttons = window.parser.get_windows()[0].children
+        uuids = [button.window_uuid for button in buttons]
+
+        results["select_1"] = self.measure(lambda i: preview.select_items([uuids[i % len(uuids)]]))
+        results["select_all"] = self.measure(
+            lambda i: preview.select_items(uuids),
+            setup=lambda i: preview.select_items([]))
+
+        for count in drag_counts:
+            if count > len(uuids):
+                continue
+            selection = uuids[:count]
+            results[f"drag_{count}"] = self.measure(
+                lambda i: self.drag(selection[0], 12 if i % 2 == 0 else -12),
+                setup=lambda i: preview.select_items(selection))
+
+        preview.select_items(uuids)
+        self.app.processEvents()
+        results["align"] = self.measure(lambda i: preview.align_items('left' if i % 2 == 0 else 'right'))
+        results["nudge"] = self.measure(lambda i: preview.nudge_selection(1 if i % 2 == 0 else -1, 0))
+
+        # Undo history of single-item nudges, replayed one step at a time
+        preview.select_items(uuids[:1])
+        window.undo_stack.clear()
+        for step in range(undo_steps):
+            preview.nudge_selection(1, 0)
+        self.app.processEvents()
+        results["undo"] = self.measure(lambda i: window.undo_stack.undo(), repeat=undo_steps - 1)
+        results["redo"] = self.measure(lambda i: window.undo_stack.redo(), repeat=undo_steps - 1)
+
+        document = window.active_document
+        results["save"] = self.measure(lambda i: window.save_document(document))
+
+        return {operation: summarize(samples) for operation, samples in results.items()}
+
+    def drag(self, window_uuid, distance, steps=5):
+        """Drags the selection by grabbing one of its items with real mouse events on the canvas viewport."""
+        view = self.window.visual_preview.view
+        item = self.window.visual_preview.items_map[window_uuid]
+        view.centerOn(item)
+        viewport = view.viewport()
+        grab = view.mapFromScene(item.sceneBoundingRect().center())
+
+        undo_count = self.window.undo_stack.count()
+        QTest.mousePress(viewport, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier, grab)
+        for step in range(1, steps + 1):
+            offset = distance * step // steps
+            QTest.mouseMove(viewport, grab + QPoint(offset, offset))
+        QTest.mouseRelease(viewport, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier,
+                           grab + QPoint(distance, distance))
+
+        if self.window.undo_stack.count() == undo_count:
+            raise RuntimeError("Drag did not move the selection; is the grabbed item covered by another one?")
+
+
+def run_benchmarks(sizes, repeat, drag_counts, undo_steps):
+    app = QApplication.instance() or QApplication(sys.argv)
+    import main
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa_platform": os.environ.get('QT_QPA_PLATFORM'),
+        },
+        "settings": {"repeat": repeat, "drag_counts": drag_counts, "undo_steps": undo_steps},
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="genwnd_bench_") as work_dir, ErrorHandler.headless():
+        window = main.MainWindow()
+        # Background indexing competes for the GIL and would make the timings noisy
+        window.project_indexer.start_indexing = lambda folder: None
+        window.default_directory = work_dir
+        window.resize(1600, 1000)
+        window.show()
+        app.processEvents()
+
+        benchmark = GuiBenchmark(app, window, repeat)
+        for size in sizes:
+            file_path = os.path.join(work_dir, f"bench_{size}.wnd")
+            generate_document(file_path, size)
+            print(f"[*] Benchmarking {size} windows...", file=sys.stderr)
+            operations = benchmark.run_document(file_path, drag_counts, undo_steps)
+            report["results"].append({"windows": size, "operations": operations})
+
+            window.active_document.is_modified = False
+            window.close_document(window.active_document)
+            app.processEvents()
+
+        window.close()
+
+    return report
+
+
+if __name__ == "__main__":
+    cli_parser = argparse.ArgumentParser(
+        description="Times interactive editor operations (load, select, drag, align, nudge, undo/redo, save) "
+                    "on generated documents under the offscreen Qt platform")
+    cli_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                            help="Number of windows of each generated document")
+    cli_parser.add_argument("--repeat", type=int, default=10, help="Timed runs per operation")
+    cli_parser.add_argument("--drag", type=int, nargs="+", default=[1, 500], dest="drag_counts",
+                            help="Number of items dragged at once")
+    cli_parser.add_argument("--undo-steps", type=int, default=1000, help="Length of the undo/redo history replayed")
+    cli_parser.add_argument("-o", "--output", help="Write the JSON report to this file instead of stdout")
+
+    args = cli_parser.parse_args()
+    result = run_benchmarks(args.sizes, args.repeat, args.drag_counts, args.undo_steps)
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+            f.write("\n")
+        print(f"[+] Benchmark report written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
@@ -53,9 +53,10 @@ ErrorHandler.raise_error = cli_raise_error
 
 # =====================================================================
 
-def format_wnd_file(input_path: str, output_path: str = None) -> None:
+def format_wnd_file(input_path: str, output_path: str = None, validate: bool = True) -> None:
     """
     Parses a WND file into an AST and writes it back formatted.
+    Without `validate`, only the syntax is checked (for trusted files that are reformatted in bulk).
     """
     if not os.path.exists(input_path):
         print(f"[!] Error: Could not find file '{input_path}'")
@@ -69,10 +70,10 @@ def format_wnd_file(input_path: str, output_path: str = None) -> None:
     parser = WndParser()
 
     try:
-        parser.parse_file(input_path)
+        parser.parse_file(input_path, validate=validate)
         formatted_text = repr(parser)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding=WndParser.encoding) as f:
             f.write(formatted_text)
             f.write("\n")
 
@@ -87,6 +88,8 @@ if __name__ == "__main__":
     cli_parser = argparse.ArgumentParser(description="Standalone WND formatter tool")
     cli_parser.add_argument("input_file", help="Path to the input .wnd file")
     cli_parser.add_argument("-o", "--output", help="Path to output file", default=None)
+    cli_parser.add_argument("--no-validate", action="store_false", dest="validate",
+                            help="Skip the validation rules, only check the syntax (trusted files)")
 
     args = cli_parser.parse_args()
-    format_wnd_file(args.input_file, args.output)
\ No newline at end of file
+    format_wnd_file(args.input_file, args.output, args.validate)
\ No newline at end of file
@@ -0,0 +1,330 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the project root to Python's path dynamically
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+src_folder = os.path.join(project_root, 'src')
+sys.path.insert(0, src_folder)
+
+try:
+    from src.window.wnd_parser import WndParser
+    from src.window.validation import RULES, Validator
+    from src.error_handler import ErrorHandler
+except ImportError as e:
+    print(f"Import Error: {e}")
+    print("Please ensure you are running this script from the project root.")
+    sys.exit(1)
+
+
+DEFAULT_CACHE = os.path.join(project_root, 'resources', 'wnd_lint_cache.json')
+# Bump when a rule or the parser diagnostics change, so cached diagnostics of unchanged files are recomputed
+CACHE_VERSION = 2
+
+LEVELS = {1: "error", 2: "warning", 3: "note"}
+# Line content of the errors about a whole window block, followed by the line of its WINDOW keyword
+BLOCK_ERROR_PREFIX = "Window block that start in "
+
+# Rule id -> description. The window rules are the editor's validation rules (src/window/validation.py).
+RULE_CATALOG = {name: rule.__doc__ for name, rule in RULES}
+RULE_CATALOG.update({
+    "syntax": "The file can be parsed: block structure, property format and known tags.",
+    "duplicate_name": "Window names are unique within a file.",
+    "name_prefix": "The file name prefix of window names matches the file (GenWND repairs it on save).",
+    "foreign_name_prefix": "Window names are not prefixed with another file of the mod (copied windows).",
+    "duplicate_file_name": "File names are unique within the mod, since window names are keyed by file name.",
+})
+
+
+# =====================================================================
+# PER-FILE CHECKS (run in the worker processes, results are cached)
+# =====================================================================
+def _walk(windows):
+    for window in windows:
+        yield window
+        yield from _walk(window.children)
+
+
+def lint_file(path):
+    """
+    Parses one file and checks every window against the validation rules. A window that cannot be decoded
+    only skips that window; the rest of the file is still checked.
+    :return: {"diagnostics": [{"rule", "level", "line", "message"}], "prefixes": [[prefix, line, name]]}
+             where prefixes lists the windows whose name is not prefixed with the file name.
+    """
+    diagnostics = []
+    prefixes = []
+    errors = []
+    validator = Validator()
+    names = {}  # name -> line of the first window with it
+    own_name = os.path.basename(path).lower()
+
+    def add_errors(window_line):
+        for _, line_number, content, message, error_level in errors:
+            if line_number >= 0:
+                line = line_number + 1
+            elif str(content).startswith(BLOCK_ERROR_PREFIX):  # Raised for a whole window block
+                line = int(str(content)[len(BLOCK_ERROR_PREFIX):])
+            else:
+                line = window_line
+            diagnostics.append({"rule": "syntax", "level": error_level, "line": line, "message": message})
+        errors.clear()
+
+    parser = WndParser()
+    with ErrorHandler.collecting(errors):
+        try:
+            # The structural scan gives the line of every window, and a broken window does not stop the others
+            parser.parse_file(path, lazy=True, validate=False)
+        except (ValueError, OSError) as e:
+            if not errors:
+                errors.append((path, 0, '', str(e), 1))
+        add_errors(1)
+
+        for window in _walk(parser.get_windows()):
+            line = window.source_line or 1
+            try:
+                properties = window.properties
+            except ValueError:
+                add_errors(line)
+                continue
+            add_errors(line)
+
+            for issue in validator.validate_window(window):
+                diagnostics.append({"rule": issue.rule, "level": issue.error_level, "line": line,
+                                    "message": issue.message})
+
+            name = properties.get('NAME', '')
+            if name in names:
+                diagnostics.append({"rule": "duplicate_name", "level": 2, "line": line,
+                                    "message": f"Duplicate window name '{name}', first used at line {names[name]}"})
+            elif name:
+                names[name] = line
+            if window.file_name and window.file_name.lower() != own_name:
+                prefixes.append([window.file_name, line, name])
+
+    return {"diagnostics": diagnostics, "prefixes": prefixes}
+
+
+# =====================================================================
+# CACHE
+# =====================================================================
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class LintCache:
+    """Per-file lint results keyed by path and validated by the SHA-256 of the file content."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}  # normalized path -> {"hash", "result"}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.entries = data.get("files", {})
+            except (OSError, ValueError):
+                pass  # A broken cache is rebuilt
+
+    def get(self, file_path, digest):
+        entry = self.entries.get(file_path)
+        return entry["result"] if entry and entry["hash"] == digest else None
+
+    def put(self, file_path, digest, result):
+        self.entries[file_path] = {"hash": digest, "result": result}
+
+    def save(self):
+        if not self.path:
+            return
+        # Forget deleted files, then replace the cache file atomically
+        self.entries = {path: entry for path, entry in self.entries.items() if os.path.exists(path)}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_VERSION, "files": self.entries}, f)
+        os.replace(temp_path, self.path)
+
+
+# =====================================================================
+# RUN
+# =====================================================================
+def collect_files(paths):
+    """The .wnd files given directly or found below the given directories, sorted."""
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, names in os.walk(path):
+                files.update(os.path.join(folder, name) for name in names if name.lower().endswith('.wnd'))
+        elif os.path.isfile(path):
+            files.add(path)
+        else:
+            print(f"[!] Not found: {path}", file=sys.stderr)
+    return sorted(os.path.normpath(os.path.abspath(f)) for f in files)
+
+
+def run_lint(files, jobs=None, cache=None):
+    """
+    Lints the files, parsing the ones without a cached result in a process pool.
+    :return: (diagnostics as dicts with a "file" key, number of files that were parsed)
+    """
+    results = {}
+    misses = []
+    for path in files:
+        digest = file_digest(path)
+        cached = cache.get(path, digest) if cache else None
+        if cached is not None:
+            results[path] = cached
+        else:
+            misses.append((path, digest))
+
+    jobs = jobs or os.cpu_count() or 1
+    paths = [path for path, digest in misses]
+    if jobs == 1 or len(paths) < 2:
+        fresh = [lint_file(path) for path in paths]
+    else:
+        workers = min(jobs, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            fresh = list(executor.map(lint_file, paths, chunksize=max(1, len(paths) // (workers * 4))))
+    for (path, digest), result in zip(misses, fresh):
+        results[path] = result
+        if cache:
+            cache.put(path, digest, result)
+
+    diagnostics = [dict(diagnostic, file=path) for path in files for diagnostic in results[path]["diagnostics"]]
+    diagnostics.extend(cross_file_diagnostics(files, results))
+    diagnostics.sort(key=lambda d: (d["file"], d["line"]))
+    return diagnostics, len(misses)
+
+
+def cross_file_diagnostics(files, results):
+    """Checks that need the whole mod: file name clashes and windows named after other files."""
+    diagnostics = []
+    by_name = {}
+    for path in files:
+        by_name.setdefault(os.path.basename(path).lower(), []).append(path)
+
+    for name, paths in by_name.items():
+        if len(paths) > 1:
+            for path in paths:
+                others = ", ".join(os.path.relpath(other, os.path.dirname(path)) for other in paths if other != path)
+                diagnostics.append({"file": path, "rule": "duplicate_file_name", "level": 2, "line": 1,
+                                    "message": f"File name also used by {others}; window names of these files collide"})
+
+    for path in files:
+        # One diagnostic per foreign prefix and file, at its first window
+        by_prefix = {}
+        for prefix, line, window_name in results[path]["prefixes"]:
+            by_prefix.setdefault(prefix, []).append(line)
+        for prefix, lines in by_prefix.items():
+            count = f"{len(lines)} window(s)"
+            if prefix.lower() in by_name:
+                diagnostics.append({"file": path, "rule": "foreign_name_prefix", "level": 2, "line": lines[0],
+                                    "message": f"{count} named after {prefix}, another file of the mod "
+                                               f"(copied from it?), first at line {lines[0]}"})
+            else:
+                diagnostics.append({"file": path, "rule": "name_prefix", "level": 3, "line": lines[0],
+                                    "message": f"{count} prefixed with '{prefix}' instead of "
+                                               f"{os.path.basename(path)}, first at line {lines[0]}"})
+    return diagnostics
+
+
+# =====================================================================
+# REPORTS
+# =====================================================================
+def format_text(diagnostics, root):
+    lines = [f"{os.path.relpath(d['file'], root)}:{d['line']}: {LEVELS[d['level']]} [{d['rule']}] "
+             f"{d['message']}".replace("\n", " ") for d in diagnostics]
+    counts = {level: sum(1 for d in diagnostics if d["level"] == level) for level in LEVELS}
+    lines.append(f"{counts[1]} error(s), {counts[2]} warning(s), {counts[3]} note(s)")
+    return "\n".join(lines)
+
+
+def format_json(diagnostics, root):
+    return json.dumps([dict(d, file=os.path.relpath(d["file"], root), level=LEVELS[d["level"]])
+                       for d in diagnostics], indent=2)
+
+
+def format_sarif(diagnostics, root):
+    """SARIF 2.1.0 log, with file locations relative to `root` (SRCROOT)."""
+    results = [{
+        "ruleId": d["rule"],
+        "level": LEVELS[d["level"]],
+        "message": {"text": d["message"]},
+        "locations": [{"physicalLocation": {
+            "artifactLocation": {"uri": os.path.relpath(d["file"], root).replace(os.sep, "/"),
+                                 "uriBaseId": "SRCROOT"},
+            "region": {"startLine": d["line"]},
+        }}],
+    } for d in diagnostics]
+
+    sarif = {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {
+                "name": "wnd-lint",
+                "rules": [{"id": rule_id, "shortDescription": {"text": description}}
+                          for rule_id, description in RULE_CATALOG.items()],
+            }},
+            "originalUriBaseIds": {"SRCROOT": {"uri": "file:///" + root.replace(os.sep, "/").lstrip("/") + "/"}},
+            "results": results,
+        }],
+    }
+    return json.dumps(sarif, indent=2)
+
+
+FORMATTERS = {"text": format_text, "json": format_json, "sarif": format_sarif}
+
+
+if __name__ == "__main__":
+    cli_parser = argparse.ArgumentParser(
+        description="Lints WND files (a whole mod folder at once) with the editor's validation rules "
+                    "and cross-file checks")
+    cli_parser.add_argument("paths", nargs="*", help="WND files or folders searched for .wnd files")
+    cli_parser.add_argument("-f", "--format", choices=FORMATTERS, default="text", help="Report format")
+    cli_parser.add_argument("-o", "--output", help="Write the report to this file instead of stdout")
+    cli_parser.add_argument("-j", "--jobs", type=int, default=None,
+                            help="Worker processes (default: one per CPU, 1 parses in this process)")
+    cli_parser.add_argument("--cache", default=DEFAULT_CACHE, help="Cache of per-file results")
+    cli_parser.add_argument("--no-cache", action="store_const", const=None, dest="cache",
+                            help="Parse every file, without reading or writing the cache")
+    cli_parser.add_argument("--ignore", nargs="+", default=[], metavar="RULE", help="Rule ids to leave out")
+    cli_parser.add_argument("--list-rules", action="store_true", help="Print the rule catalog and exit")
+
+    args = cli_parser.parse_args()
+    if args.list_rules:
+        for rule_id, description in RULE_CATALOG.items():
+            print(f"{rule_id:22} {description}")
+        sys.exit(0)
+    if not args.paths:
+        cli_parser.error("no files or folders given")
+
+    wnd_files = collect_files(args.paths)
+    lint_cache = LintCache(args.cache) if args.cache else None
+    found, parsed_count = run_lint(wnd_files, args.jobs, lint_cache)
+    if lint_cache:
+        lint_cache.save()
+    found = [d for d in found if d["rule"] not in args.ignore]
+
+    report_root = os.path.commonpath(wnd_files) if wnd_files else os.getcwd()
+    if len(wnd_files) == 1:
+        report_root = os.path.dirname(report_root)
+    text = FORMATTERS[args.format](found, report_root)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.write("\n")
+    else:
+        print(text)
+    print(f"[*] {len(wnd_files)} file(s), {parsed_count} parsed, {len(wnd_files) - parsed_count} from cache",
+          file=sys.stderr)
+
+    sys.exit(1 if any(d["level"] == 1 for d in found) else 0)
@@ -0,0 +1,95 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+
+class Tracer:
+    """
+    Records nested timing spans into a ring buffer and exports them as Chrome trace JSON
+    (open in chrome://tracing or https://ui.perfetto.dev).
+
+    While disabled, `span` returns a shared no-op context and `traced` functions only pay one attribute check.
+    """
+
+    def __init__(self, capacity=100000):
+        self.enabled = False
+        self.events = deque(maxlen=capacity)  # Oldest spans are dropped once full
+        self._origin = time.perf_counter()
+        self._thread_names = {}
+
+    def start(self, clear=True):
+        if clear:
+            self.events.clear()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def span(self, name, category="app", **args):
+        """Times the enclosed block. Extra keyword arguments are shown with the span in the trace viewer."""
+        if not self.enabled:
+            return nullcontext()
+        return self._span(name, category, args)
+
+    @contextmanager
+    def _span(self, name, category, args):
+        thread = threading.current_thread()
+        self._thread_names.setdefault(thread.ident, thread.name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": thread.ident,
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            self.events.append(event)
+
+    def to_chrome_trace(self):
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": ident, "args": {"name": name}}
+            for ident, name in self._thread_names.items()
+        ]
+        return {"traceEvents": metadata + list(self.events), "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        """Writes the recorded spans to a JSON file. Returns the number of spans written."""
+        trace = self.to_chrome_trace()
+        with open(path, 'w') as f:
+            json.dump(trace, f)
+        return len(trace["traceEvents"]) - len(self._thread_names)
+
+
+# Process-wide tracer, enabled with --trace or from the Diagnostics menu
+tracer = Tracer()
+
+
+def traced(name=None, category="app"):
+    """
+    Decorator recording a span for every call of the function, named after its qualified name by default.
+    Only for methods called directly from Python or as Qt virtual overrides: Qt signal connections
+    pass arguments by the slot's signature, which the wrapper hides.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer._span(span_name, category, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
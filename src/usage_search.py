@@ -0,0 +1,75 @@
+import os
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QPushButton, QTreeWidget, \
+    QTreeWidgetItem, QLabel
+
+from src.project_index import ProjectIndex
+
+
+class UsageSearchWidget(QWidget):
+    """Tool window answering "where is this name/callback/image/text used" from the project index."""
+    file_requested_signal = pyqtSignal(str)
+
+    def __init__(self, project_index, parent=None):
+        super().__init__(parent)
+        self.project_index = project_index
+        self.setWindowTitle("Find Usages")
+        self.setWindowFlag(Qt.WindowType.Tool)
+        self.resize(700, 400)
+
+        layout = QVBoxLayout(self)
+
+        # Search row
+        search_layout = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Window name, callback, image or text label...")
+        self.kind_combo = QComboBox()
+        self.kind_combo.addItem("All")
+        self.kind_combo.addItems(ProjectIndex.indexed_properties + ["IMAGE"])
+        self.search_button = QPushButton("Find")
+
+        search_layout.addWidget(self.search_edit)
+        search_layout.addWidget(self.kind_combo)
+        search_layout.addWidget(self.search_button)
+        layout.addLayout(search_layout)
+
+        # Results
+        self.results_tree = QTreeWidget()
+        self.results_tree.setHeaderLabels(["Kind", "Symbol", "File", "Window"])
+        self.results_tree.setRootIsDecorated(False)
+        layout.addWidget(self.results_tree)
+
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
+
+        self.search_edit.returnPressed.connect(self.search)
+        self.search_button.clicked.connect(self.search)
+        self.results_tree.itemDoubleClicked.connect(self.open_result)
+
+    def search(self, value=None):
+        """Runs a lookup for the current (or given) symbol and lists every location."""
+        if isinstance(value, str):
+            self.search_edit.setText(value)
+        value = self.search_edit.text().strip()
+        self.results_tree.clear()
+        if not value:
+            self.summary_label.setText("")
+            return
+
+        kind = self.kind_combo.currentText()
+        results = self.project_index.find_usages(value, None if kind == "All" else kind)
+        for kind, symbol, path, window in results:
+            item = QTreeWidgetItem([kind, symbol, os.path.basename(path), window])
+            item.setData(0, Qt.ItemDataRole.UserRole, path)
+            item.setToolTip(2, path)
+            self.results_tree.addTopLevelItem(item)
+
+        for column in range(self.results_tree.columnCount()):
+            self.results_tree.resizeColumnToContents(column)
+        self.summary_label.setText(f"{len(results)} usage(s) found")
+
+    def open_result(self, item, column):
+        path = item.data(0, Qt.ItemDataRole.UserRole)
+        if path:
+            self.file_requested_signal.emit(path)
@@ -9,6 +9,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QColor, QPen, QBrush, QFont, QPainter, QAction, QImage
 from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRectF, QLineF, QEvent
 
+from src.memory_diagnostics import leak_tracker
+from src.tracing import traced
+
 
 class GroupResizeOverlay(QGraphicsRectItem):
     """An overlay bounding box for scaling multiple selected items proportionally."""
@@ -528,11 +531,27 @@ class PreviewGraphicsView(QGraphicsView):
         else:
             super().keyPressEvent(event)
 
+class CanvasState:
+    """A detached canvas scene, kept alive while its document is not the active one."""
+
+    def __init__(self, scene, items_map, group_overlay, is_loaded):
+        self.scene = scene
+        self.items_map = items_map
+        self.group_overlay = group_overlay
+        self.is_loaded = is_loaded
+
+    def release(self):
+        leak_tracker.track_all(self.items_map.values(), "CanvasState.release")
+        self.items_map.clear()
+        self.scene.clear()
+        self.scene.deleteLater()
+
+
 class VisualPreview(QWidget):
     """Main Canvas container combining the Toolbar, the View, and the Control Bar."""
-    selection_changed_signal = pyqtSignal(list)  # Unified signal emitting UUID strings
+    selection_changed_signal = pyqtSignal(list)  # Unified signal emitting window ids
     item_moved_signal = pyqtSignal(object, tuple, tuple)
-    item_drag_finished_signal = pyqtSignal(str, tuple, tuple, tuple, tuple)
+    item_drag_finished_signal = pyqtSignal(int, tuple, tuple, tuple, tuple)
     bulk_geometry_change_signal = pyqtSignal(str, list)
 
     def __init__(self, parent=None):
@@ -542,7 +561,6 @@ class VisualPreview(QWidget):
         self.layout.setSpacing(0)
 
         # State Variables
-        self.items_map = {}
         self._is_syncing = False
         self.align_actions = []
 
@@ -582,8 +600,7 @@ class VisualPreview(QWidget):
         add_action("Extend Bottom", 'ext_bottom', True)
 
     def _setup_view(self):
-        self.scene = QGraphicsScene(self)
-        self.scene.selectionChanged.connect(self.handle_selection_changed)
+        self._create_scene()
 
         self.view = PreviewGraphicsView(self)
         self.view.setScene(self.scene)
@@ -601,10 +618,36 @@ class VisualPreview(QWidget):
 
         self.layout.addLayout(self.view_stack, stretch=1)
 
+    def _create_scene(self):
+        """Creates a new, empty scene (with its group overlay) and makes it the current one."""
+        scene = QGraphicsScene(self)
+        # Bind the scene so selection changes of a detached (inactive document) scene are ignored
+        scene.selectionChanged.connect(lambda: self.handle_selection_changed() if scene is self.scene else None)
+        self.scene = scene
+        self.items_map = {}
+
         # Inject the group bounding box overlay
         self.group_overlay = GroupResizeOverlay(self)
         self.scene.addItem(self.group_overlay)
 
+    def swap_canvas_state(self, state=None):
+        """
+        Detaches the current scene and shows another one, so every open document keeps its own canvas.
+        :param state: A CanvasState returned by a previous swap, or None for a fresh, empty canvas.
+        :return: The detached CanvasState of the previously shown scene.
+        """
+        old_state = CanvasState(self.scene, self.items_map, self.group_overlay,
+                                self.view_stack.currentWidget() is self.view)
+        if state is None:
+            self._create_scene()
+        else:
+            self.scene, self.items_map, self.group_overlay = state.scene, state.items_map, state.group_overlay
+
+        self.view.setScene(self.scene)
+        self.view_stack.setCurrentWidget(self.view if state and state.is_loaded else self.empty_label)
+        self.update_toolbar_state(len([i for i in self.scene.selectedItems() if isinstance(i, WndGraphicsItem)]))
+        return old_state
+
     def _setup_bottom_bar(self):
         self.bottom_bar = QWidget(self)
         self.bottom_layout = QHBoxLayout(self.bottom_bar)
@@ -697,6 +740,7 @@ class VisualPreview(QWidget):
 
     def clear(self):
         self._is_clearing = True
+        leak_tracker.track_all(self.items_map.values(), "VisualPreview.clear")
         self.scene.clear()
         self.items_map.clear()
         self.update_toolbar_state(0)
@@ -725,6 +769,9 @@ class VisualPreview(QWidget):
             uuids = [item.window_uuid for item in wnd_items]
             self.selection_changed_signal.emit(uuids)
 
+    def selected_uuids(self):
+        return [i.window_uuid for i in self.scene.selectedItems() if isinstance(i, WndGraphicsItem)]
+
     def update_toolbar_state(self, selected_count):
         is_enabled = selected_count >= 2
         for action in self.align_actions:
@@ -928,6 +975,13 @@ class VisualPreview(QWidget):
             item.setRect(0, 0, w, h)
         self._is_syncing = False
 
+    def update_item_label(self, window):
+        item = self.items_map.get(window.window_uuid)
+        if item is not None and getattr(item, "name_label", None):
+            props = window.properties
+            item.name_label.setPlainText(f"{props.get('WINDOWTYPE', 'UNKNOWN')}: {props.get('NAME', 'Unnamed')}")
+
+    @traced(category="canvas")
     def load_hierarchy(self, windows):
         self.clear()
         if not windows:
@@ -1013,10 +1067,12 @@ class VisualPreview(QWidget):
         if window_uuid in self.items_map:
             item = self.items_map.pop(window_uuid)
             self.scene.removeItem(item)
+            leak_tracker.track(item, "remove_item_from_canvas")
 
             # Note: Do not manually 'del item', let Python GC handle it once removed from scene
             # to prevent segfaults with Qt's underlying C++ management.
 
+    @traced(category="canvas")
     def _render_windows(self, windows, depth):
         for window in windows:
             props = window.properties
@@ -0,0 +1,79 @@
+class AttributeData:
+    """
+    The fields of an attribute statement (LISTBOXDATA, COMBOBOXDATA, SLIDERDATA...), in the order they are written,
+    with keyed access: `data['COLUMNS']`, `'SCROLLIFATEND' in data`. A key can have several values
+    (one COLUMNSWIDTH per column); indexing returns the first, `get_all` all of them.
+
+    Immutable: `replace` / `append` return a new instance, like every other property value is replaced
+    rather than changed in place (see commands.set_screen_rect), so copies of a window can share it.
+    """
+
+    __slots__ = ('_fields', '_index')
+
+    def __init__(self, fields=()):
+        self._fields = tuple(fields)  # (key, value) pairs
+        index = {}
+        for position, (key, _) in enumerate(self._fields):
+            index.setdefault(key, []).append(position)
+        self._index = index  # key -> positions of its values
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self  # Immutable, and the values are ints
+
+    def __reduce__(self):
+        return AttributeData, (self._fields,)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __getitem__(self, key):
+        return self._fields[self._index[key][0]][1]
+
+    def __eq__(self, other):
+        if isinstance(other, AttributeData):
+            return self._fields == other._fields
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._fields)
+
+    def __repr__(self):
+        return f"AttributeData({list(self._fields)!r})"
+
+    def get(self, key, default=None):
+        positions = self._index.get(key)
+        return self._fields[positions[0]][1] if positions else default
+
+    def get_all(self, key):
+        return [self._fields[position][1] for position in self._index.get(key, ())]
+
+    def count(self, key):
+        return len(self._index.get(key, ()))
+
+    def keys(self):
+        """The distinct keys, in the order of their first field."""
+        return self._index.keys()
+
+    def items(self):
+        """All (key, value) fields in written order, repeated keys included."""
+        return iter(self._fields)
+
+    def replace(self, key, value):
+        """A copy with every value of `key` set to `value`; self when there is nothing to change."""
+        positions = self._index.get(key, ())
+        if all(self._fields[position][1] == value for position in positions):
+            return self
+        fields = list(self._fields)
+        for position in positions:
+            fields[position] = (key, value)
+        return AttributeData(fields)
+
+    def append(self, key, value):
+        """A copy with one more field at the end."""
+        return AttributeData(self._fields + ((key, value),))
@@ -1,10 +1,19 @@
-from src.error_handler import ErrorHandler, InvalidValuesError
+import pickle
+
+from src.window.attribute_data import AttributeData
+
 
 class Window:
+    # Tags of the parsed window block in the order they appeared, checked by the tag order validation rule.
+    # None for windows that were not parsed from text.
+    source_tags = None
+    # Span of the window in the text of its file (WndParser.parse_file(lossless=True)), None otherwise
+    source_span = None
+
     def __init__(self, window_uuid, window_properties=None, children=None, file_name=None):
         """
         Initializes a new window object.
-        :param window_uuid: A unique identifier for the window (UUID).
+        :param window_uuid: A unique identifier for the window, see window_ids.
         :param window_properties: Configuration properties for the window.
         :param children: A list of child windows, defaults to an empty list if no children are provided.
         """
@@ -13,172 +22,123 @@ class Window:
         self.children = children if children is not None else []
         self.file_name = file_name
 
+    # --- LAZY DECODING ---
+    # A window found by a structural scan (WndParser.parse_file(lazy=True)) only knows its type and name
+    # and keeps the raw bytes of its block. The rest is decoded on the first access to `properties`.
+    _source = None
+
+    @property
+    def properties(self):
+        if self._source is not None:
+            self._properties = self._source.decode(self)
+            self._source = None
+        return self._properties
+
+    @properties.setter
+    def properties(self, value):
+        self._source = None
+        self._properties = value
+
+    @property
+    def is_decoded(self):
+        return self._source is None
+
+    @property
+    def source_line(self):
+        """Line (1-based) of the WINDOW keyword of a lazily parsed window, None once it is decoded."""
+        return self._source.line_number if self._source is not None else None
+
+    def peek_property(self, key, default=None):
+        """Reads WINDOWTYPE or NAME without decoding a lazily parsed window; other keys decode it."""
+        if self._source is not None and key in self._properties:
+            return self._properties[key]
+        return self.properties.get(key, default)
+
 
 class UserControl(Window):
+    # Properties of a new control. Subclasses list the ones they override, see new_properties
+    DEFAULT_PROPERTIES = {
+        'WINDOWTYPE': 'USER',
+        'NAME': 'user',
+        'SCREENRECT': {
+            'UPPERLEFT': [10, 10],
+            'BOTTOMRIGHT': [200, 100],
+            'CREATIONRESOLUTION': [800, 600]
+        },
+        'STATUS': ['ENABLED'],
+        'STYLE': ['USER'],
+        'SYSTEMCALLBACK': '[None]',
+        'INPUTCALLBACK': '[None]',
+        'TOOLTIPCALLBACK': '[None]',
+        'DRAWCALLBACK': '[None]',
+        'FONT': {
+            'name': "Times New Roman",
+            'size': 14,
+            'bold': 0
+        },
+        'HEADERTEMPLATE': '[NONE]',
+        'TOOLTIPTEXT': '',
+        'TOOLTIPDELAY': -1,
+        'TEXT': '',
+        'TEXTCOLOR': {
+            'ENABLED': (255, 255, 255, 255), 'ENABLEDBORDER': (255, 255, 255, 255),
+            'DISABLED': (255, 255, 255, 255), 'DISABLEDBORDER': (255, 255, 255, 255),
+            'HILITE': (255, 255, 255, 255), 'HILITEBORDER': (255, 255, 255, 255)
+        },
+        'attributes': {},
+        'textures': {
+            'ENABLEDDRAWDATA':  [
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)}],
+            'DISABLEDDRAWDATA': [
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)}],
+            'HILITEDRAWDATA': [
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
+                {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)}],
+        },
+    }
+
     def __init__(self, window_uuid, properties=None, children=None, file_name=None):
         super().__init__(window_uuid, properties, children, file_name)
-        # Assign default values for UserControl
-        if properties:
-           self.properties.update(properties)
-        else:
-            self.properties['WINDOWTYPE'] = 'USER'
-            self.properties['NAME'] = 'user'
-            self.properties['SCREENRECT'] = {
-                'UPPERLEFT': [10, 10],
-                'BOTTOMRIGHT': [200, 100],
-                'CREATIONRESOLUTION': [800, 600]
-            }
-            self.properties['STATUS'] = ['ENABLED']
-            self.properties['STYLE'] = ['USER']
-            self.properties['SYSTEMCALLBACK'] = '[None]'
-            self.properties['INPUTCALLBACK'] = '[None]'
-            self.properties['TOOLTIPCALLBACK'] = '[None]'
-            self.properties['DRAWCALLBACK'] = '[None]'
-            self.properties['FONT'] = {
-                'name': "Times New Roman",
-                'size': 14,
-                'bold': 0
-            }
-            self.properties['HEADERTEMPLATE'] = '[NONE]'
-            self.properties['TOOLTIPTEXT'] = ''
-            self.properties['TOOLTIPDELAY'] = -1
-            self.properties['TEXT'] = ''
-            self.properties['TEXTCOLOR'] = {
-                'ENABLED': (255, 255, 255, 255), 'ENABLEDBORDER': (255, 255, 255, 255),
-                'DISABLED': (255, 255, 255, 255), 'DISABLEDBORDER': (255, 255, 255, 255),
-                'HILITE': (255, 255, 255, 255), 'HILITEBORDER': (255, 255, 255, 255)
-            }
-            self.properties['attributes'] = {}
-            self.properties['textures'] = {
-                'ENABLEDDRAWDATA':  [
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)}],
-                'DISABLEDDRAWDATA': [
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)}],
-                'HILITEDRAWDATA': [
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)},
-                    {'IMAGE': 'NoImage', 'COLOR': (255, 255, 255, 0), 'BORDERCOLOR': (255, 255, 255, 0)}],
-            }
-
-    def _set_FONT(self, value):
-         # Font name must be one of the valid properties
-        valid_fonts = ["Times New Roman", "Arial", "Courier New", "Placard MT Condensed", "Generals", "Courier"]
-        if value["name"] not in valid_fonts:
-            ErrorHandler.raise_error(self.file_name, 0, '',
-                                     f"Window name: {self.properties.get('NAME', 'Unknown')}:\n"
-                                     f"Invalid font name: {value['name']}. Valid properties: {valid_fonts}",
-                                      error_level=3)
-        # Font size must be between 8 and 72
-        if not (8 <= value["size"] <= 72):
-            raise InvalidValuesError("Font size must be between 8 and 72.")
-        # Bold value must be either 0 or 1
-        if value["bold"] not in [0, 1]:
-            raise InvalidValuesError("Font bold must be either 0 or 1.")
-
-        self.properties['FONT'] = value
-
-    def _set_STATUS(self, value):
-        valid_status = ["ENABLED", "DISABLED", "IMAGE", "HIDDEN"]
-        # Status must be one of the predefined properties
-        if not any(status in value for status in valid_status):
-            raise InvalidValuesError(f"Invalid status: {value}. Valid properties: {valid_status}")
-        self.properties['STATUS'] = value
-
-    def _set_SCREENRECT(self, value):
-        upper_left, bottom_right = value["UPPERLEFT"], value["BOTTOMRIGHT"]
-        creation_resolution = value["CREATIONRESOLUTION"]
-
-        # Check that upper_left coordinates are within the bounds of creation_resolution
-        if not (0 <= upper_left[0] <= creation_resolution[0] and 0 <= upper_left[1] <= creation_resolution[1]):
-            ErrorHandler.raise_error( self.file_name, 0, '',
-                f"Window name: {self.properties['NAME']}:\n"
-                f"Upper left {upper_left} coordinates must be within screen bounds\n"
-                f"defined by creation_resolution {creation_resolution}.", error_level=2)
-        # Check that bottom_right coordinates are within the bounds of creation_resolution
-        if not (0 <= bottom_right[0] <= creation_resolution[0] and 0 <= bottom_right[1] <= creation_resolution[1]):
-            ErrorHandler.raise_error( self.file_name, 0, '',
-                f"Window name: {self.properties['NAME']}:\n"
-                f"Bottom right {bottom_right} coordinates must be within screen bounds\n"
-                f"defined by creation_resolution {creation_resolution}.", error_level=2)
-
-        # Ensure the rectangle size is at least 1x1 pixel
-        if not (bottom_right[0] > upper_left[0] and bottom_right[1] > upper_left[1]):
-            ErrorHandler.raise_error(self.file_name, 0, '',
-                                     f"Window name: {self.properties.get('NAME', 'Unknown')}:\n"
-                                     f"Rectangle size must be at least 1x1 pixel.", error_level=1)
-
-        # If all validations pass, store the value
-        self.properties['SCREENRECT'] = value
-
-    def _is_valid_color(self, color):
-        # Check if the color is a tuple of 4 integers (RGBA format)
-        if isinstance(color, tuple) and len(color) == 4:
-            # Ensure each component is in the range 0-255
-            return all(0 <= component <= 255 for component in color)
-        return False
-
-    def _set_TEXTCOLOR(self, value):
-        # Every color must be in RGBA format with values between 0 and 255
-        for color_name, color in value.items():
-            if not self._is_valid_color(color):
-                raise InvalidValuesError(
-                    f"Invalid color for {color_name}: {color}. Colors must be in RGBA format with values between 0 and 255.")
-
-        self.properties['TEXTCOLOR'] = value
-
-    # Utility function to validate RGBA color format
-    def _validate_rgba(self, color):
-        if len(color) != 4:
-            raise InvalidValuesError("Color must have exactly 4 values (R, G, B, A).")
-        for value in color:
-            if not (0 <= value <= 255):
-                raise InvalidValuesError("Color values must be between 0 and 255.")
-
-    # Utility function to validate IMAGE field
-    def _validate_image(self, image):
-        if image != "NoImage" and not isinstance(image, str):
-            raise InvalidValuesError("Image must be a string or 'NoImage'.")
-
-    # General draw data validation
-    def _validate_draw_data(self, draw_data):
-        # Validate the format for each entry
-        if not isinstance(draw_data, list) or len(draw_data) != 9:
-            raise InvalidValuesError(f"Draw data must be a list with exactly 9 items, len: {len(draw_data)}")
-
-        for entry in draw_data:
-            if 'IMAGE' not in entry or 'COLOR' not in entry or "BORDERCOLOR" not in entry:
-                raise InvalidValuesError("Each draw data entry must contain IMAGE, COLOR, and BORDERCOLOR.")
-            self._validate_image(entry['IMAGE'])
-            self._validate_rgba(entry['COLOR'])
-            self._validate_rgba(entry["BORDERCOLOR"])
-
-    # Use internal variables for drawing data
-    def _set_textures(self, value):
-        for key, draw_data in value.items():
-            self._validate_draw_data(draw_data)
-        self.properties['textures'] = value
+        if not properties:
+            self.properties = self.new_properties()
+
+    @classmethod
+    def new_properties(cls):
+        """
+        Properties of a new control, e.g. one added in the editor; parsed windows never build them.
+        A copy of the template of the type: DEFAULT_PROPERTIES of the class and its bases, merged once and kept
+        pickled, so no control made from it can edit it and loading a copy is as fast as building the literals.
+        """
+        template = cls.__dict__.get('_default_template')
+        if template is None:
+            merged = {}
+            for klass in reversed(cls.__mro__):
+                merged.update(klass.__dict__.get('DEFAULT_PROPERTIES', {}))
+            template = cls._default_template = pickle.dumps(merged, protocol=pickle.HIGHEST_PROTOCOL)
+        return pickle.loads(template)
 
     def _format_screenrect(self):
         """
@@ -265,22 +225,20 @@ class UserControl(Window):
                         draw_data_str = self._format_draw_data(value, key)
                         if draw_data_str:
                             output.append(f"{key} = " + draw_data_str)
-                    else:
-                        formatted_lines = [f"{key} ="]
-                        indent = " " * (len(key + ' = '))
-                        first = True
-                        for item in value:
-                            # Process each dictionary in the list
-                            for k, v in item.items():
-                                if first:
-                                    formatted_lines[0] += f" {k}: {v},"  # Add to the key line
-                                    first = False
-                                else:
-                                    formatted_lines.append(f"{indent}{k}: {v},")  # Subsequent values indented
-
-                        # Remove the last comma and add semicolon
-                        formatted_lines[-1] = formatted_lines[-1].rstrip(",") + ";"
-                        output.extend(formatted_lines)
+                elif isinstance(value, AttributeData):
+                    formatted_lines = [f"{key} ="]
+                    indent = " " * (len(key + ' = '))
+                    first = True
+                    for k, v in value.items():
+                        if first:
+                            formatted_lines[0] += f" {k}: {v},"  # Add to the key line
+                            first = False
+                        else:
+                            formatted_lines.append(f"{indent}{k}: {v},")  # Subsequent values indented
+
+                    # Remove the last comma and add semicolon
+                    formatted_lines[-1] = formatted_lines[-1].rstrip(",") + ";"
+                    output.extend(formatted_lines)
 
         return "\n".join(output)
 
@@ -42,6 +42,15 @@ class LineIterator:
             return self.lines[self.index].strip()
         raise StopIteration
 
+    def skip(self, count):
+        """
+        Advances the iterator by `count` lines without returning them.
+
+        :param count: Number of lines to skip.
+        """
+        self.index += count
+        self.line_number += count
+
     def push_back(self):
         """
         Pushes back the last returned line to the iterator.
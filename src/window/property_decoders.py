@@ -0,0 +1,201 @@
+import re
+
+from src.window.attribute_data import AttributeData
+
+# Lines ending the properties of a window block
+BLOCK_END_LINES = frozenset(["END", "CHILD", "ENDALLCHILDREN"])
+
+_STATEMENT_START = re.compile(r'\w+\s*=')
+_SCREENRECT = re.compile(r"UPPERLEFT: (\d+) (\d+),\s*BOTTOMRIGHT: (\d+) (\d+),\s*CREATIONRESOLUTION: (\d+) (\d+)$")
+_FONT = re.compile(r'NAME: "(.+)", SIZE: (\d+), BOLD: (\d+)')
+_TEXT_COLOR = re.compile(r'(\w+):\s*(\d+)\s*(\d+)\s*(\d+)\s*(\d+)')
+_DRAW_DATA = re.compile(r'IMAGE: (\S+), COLOR: (\d+ \d+ \d+ \d+), BORDERCOLOR: (\d+ \d+ \d+ \d+)')
+_SUBFIELD = re.compile(r'(\w+):\s*([^,;]+)$')
+
+
+class PropertyDecoder:
+    """
+    Decodes the value of one statement of a window block (see parse_window_properties).
+
+    :param tag: Tag of the statement, or the tag suffix for a suffix decoder (see register_decoder).
+    :param decode: Value text (after the '=', without the final ';', stripped) -> property value.
+                   Raises ValueError if the value is malformed.
+    :param rank: Position of the tag in the order the game expects (tag order validation rule), None if any.
+    :param multiline: The statement runs up to the line ending with ';' instead of being one line.
+    :param key: Property the value is stored under: the tag itself, or 'textures' / 'attributes' for their entries.
+    """
+
+    __slots__ = ('tag', 'decode', 'rank', 'multiline', 'key')
+
+    def __init__(self, tag, decode, rank=None, multiline=False, key=None):
+        self.tag = tag
+        self.decode = decode
+        self.rank = rank
+        self.multiline = multiline
+        self.key = key or tag
+
+
+# --- VALUE DECODERS ---
+
+def decode_string(value):
+    return value.strip('"')
+
+
+def decode_flags(value):
+    """STATUS / STYLE, e.g. ENABLED+IMAGE."""
+    return [flag.strip() for flag in value.split("+")]
+
+
+def decode_name(value):
+    """NAME = "file.wnd:Name" -> (file name, name), like statement_values."""
+    parts = value.strip('"').split(":")
+    return parts[0], parts[-1]
+
+
+def decode_font(value):
+    match = _FONT.match(value)
+    if not match:
+        return {}  # Reported by the font validation rule
+    return {"name": match.group(1), "size": int(match.group(2)), "bold": int(match.group(3))}
+
+
+def decode_screenrect(value):
+    match = _SCREENRECT.match(value)
+    if not match:
+        raise ValueError("Invalid SCREENRECT format")
+    x1, y1, x2, y2, width, height = map(int, match.groups())
+    return {"UPPERLEFT": (x1, y1), "BOTTOMRIGHT": (x2, y2), "CREATIONRESOLUTION": (width, height)}
+
+
+def decode_text_colors(value):
+    matches = _TEXT_COLOR.findall(value)
+    if not matches:
+        raise ValueError("Invalid text color format")
+    return {key: (int(r), int(g), int(b), int(a)) for key, r, g, b, a in matches}
+
+
+_colors = {}  # "R G B A" -> (R, G, B, A). Colors are tuples, so every window shares the parsed ones
+
+
+def _color(text):
+    color = _colors.get(text)
+    if color is None:
+        if len(_colors) >= 4096:
+            _colors.clear()
+        color = _colors[text] = tuple(map(int, text.split()))
+    return color
+
+
+def decode_draw_data(value):
+    """Draw data entries of IMAGE, COLOR and BORDERCOLOR."""
+    matches = _DRAW_DATA.findall(value)
+    if not matches:
+        raise ValueError("Invalid draw data format")
+    return [{"IMAGE": image, "COLOR": _color(color), "BORDERCOLOR": _color(border_color)}
+            for image, color, border_color in matches]
+
+
+def decode_attributes(value):
+    """Integer fields of an attribute statement, e.g. LISTBOXDATA = LENGTH: 100, AUTOSCROLL: 0, ..."""
+    fields = []
+    for subfield in value.split(','):
+        subfield = subfield.strip()
+        if not subfield:
+            continue
+        match = _SUBFIELD.match(subfield)
+        if not match:
+            raise ValueError(f"Invalid subfield format: '{subfield}'")
+        fields.append((match.group(1), int(match.group(2))))
+    if not fields:
+        raise ValueError("Invalid data")
+    return AttributeData(fields)
+
+
+# --- REGISTRY ---
+
+DECODERS = {}  # tag -> PropertyDecoder
+SUFFIX_DECODERS = []  # PropertyDecoder of the tags ending with its `tag`, longest suffix first
+_resolved = {}  # tag -> PropertyDecoder found by find_decoder
+
+
+def register_decoder(decoder, suffix=False):
+    """
+    Adds the decoder of a tag, replacing the previous one. With `suffix`, it decodes every tag ending with
+    decoder.tag that has no decoder of its own. Custom tags are stored in the window properties under decoder.key;
+    one stored under its own key is only written back to the file by a control whose __repr__ writes it.
+    """
+    if suffix:
+        SUFFIX_DECODERS[:] = [known for known in SUFFIX_DECODERS if known.tag != decoder.tag] + [decoder]
+        SUFFIX_DECODERS.sort(key=lambda known: -len(known.tag))  # DRAWDATA before DATA
+    else:
+        DECODERS[decoder.tag] = decoder
+    _resolved.clear()
+
+
+def find_decoder(tag):
+    """The decoder of `tag`, None if the tag is unknown."""
+    decoder = _resolved.get(tag)
+    if decoder is None:
+        decoder = DECODERS.get(tag) or next((known for known in SUFFIX_DECODERS if tag.endswith(known.tag)), None)
+        if decoder is not None:
+            _resolved[tag] = decoder
+    return decoder
+
+
+def tag_rank(tag):
+    """Position of `tag` in the order the game expects the properties of a window block in, None if any."""
+    decoder = find_decoder(tag)
+    return decoder.rank if decoder is not None else None
+
+
+def read_statement(lines_iter):
+    """
+    Joins the lines of the statement starting at the current line of `lines_iter`, up to the line ending with ';',
+    which is left as the current line.
+    :return: The statement without the final ';', or None if it is not terminated before the end of the block,
+             the next statement or the end of the lines (the line that ended it is left as the current line).
+    """
+    lines, start = lines_iter.lines, lines_iter.index
+    parts = [lines_iter.peek()]
+    index = start
+    statement = None
+    while True:
+        if parts[-1].endswith(';'):
+            statement = "".join(parts)[:-1]
+            break
+        index += 1
+        if index >= len(lines):
+            break
+        line = lines[index].strip()
+        if line in BLOCK_END_LINES or _STATEMENT_START.match(line):
+            break
+        parts.append(line)
+    lines_iter.skip(index - start)
+    return statement
+
+
+# Ranks follow the order of UserControl.__repr__
+for _rank, (_tag, _decode, _multiline) in enumerate([
+    ("WINDOWTYPE", str, False),
+    ("SCREENRECT", decode_screenrect, True),
+    ("NAME", decode_name, False),
+    ("STATUS", decode_flags, False),
+    ("STYLE", decode_flags, False),
+    ("SYSTEMCALLBACK", decode_string, False),
+    ("INPUTCALLBACK", decode_string, False),
+    ("TOOLTIPCALLBACK", decode_string, False),
+    ("DRAWCALLBACK", decode_string, False),
+    ("FONT", decode_font, False),
+    ("HEADERTEMPLATE", decode_string, False),
+    ("TOOLTIPTEXT", decode_string, False),
+    ("TOOLTIPDELAY", int, False),
+    ("TEXT", decode_string, False),
+    ("TEXTCOLOR", decode_text_colors, True),
+]):
+    register_decoder(PropertyDecoder(_tag, _decode, rank=_rank, multiline=_multiline))
+for _rank, _tag in enumerate(["ENABLEDDRAWDATA", "DISABLEDDRAWDATA", "HILITEDRAWDATA"], start=len(DECODERS)):
+    register_decoder(PropertyDecoder(_tag, decode_draw_data, rank=_rank, multiline=True, key='textures'))
+
+# Other draw data (list box buttons, slider thumbs...) and the attribute statements (LISTBOXDATA...)
+register_decoder(PropertyDecoder("DRAWDATA", decode_draw_data, multiline=True, key='textures'), suffix=True)
+register_decoder(PropertyDecoder("DATA", decode_attributes, multiline=True, key='attributes'), suffix=True)
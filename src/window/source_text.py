@@ -0,0 +1,255 @@
+import copy
+
+# The tags of a window block that are not plain property keys: NAME also holds the file name prefix,
+# the textures / attributes entries are written as top-level tags of their own.
+_NESTED_KEYS = ('NAME', 'attributes', 'textures')
+
+
+def statement_values(properties, file_name):
+    """The values of a window keyed by the tag of the statement they are written in."""
+    values = {key: value for key, value in properties.items() if key not in _NESTED_KEYS}
+    values['NAME'] = (file_name, properties.get('NAME'))
+    values.update(properties.get('textures') or {})
+    values.update(properties.get('attributes') or {})
+    return values
+
+
+def statement_key(tag):
+    """The property key holding the value of a statement: 'textures' / 'attributes' for their entries."""
+    if tag.endswith("DRAWDATA"):
+        return 'textures'
+    if tag.endswith("DATA"):
+        return 'attributes'
+    return tag
+
+
+def set_statement_value(properties, tag, value):
+    """
+    Stores a value of statement_values back into `properties`. Containers are replaced, not changed in place.
+    None removes the property (or the texture / attribute entry).
+    """
+    key = statement_key(tag)
+    if key != tag:
+        entries = dict(properties.get(key) or {})
+        if value is None:
+            entries.pop(tag, None)
+        else:
+            entries[tag] = value
+        properties[key] = entries
+    elif value is None:
+        properties.pop(tag, None)
+    elif tag == 'NAME':
+        properties['NAME'] = value[1]  # The file name prefix follows the file, see WndParser.enforce_file_names
+    else:
+        properties[tag] = value
+
+
+def iter_statements(text, start, end):
+    """
+    Splits the properties of a window block into statements, skipping blank and comment lines.
+    Yields (tag, line start, statement start, statement end) offsets; a statement runs from its tag to the ';'
+    ending its last line, like in parse_window_properties.
+    """
+    position = start
+    while position < end:
+        line_end = text.find('\n', position, end)
+        if line_end < 0:
+            line_end = end
+        line = text[position:line_end]
+        stripped = line.strip()
+        if not stripped or stripped.startswith(';'):
+            position = line_end + 1
+            continue
+
+        line_start = position
+        statement_start = position + len(line) - len(line.lstrip())
+        while not text[position:line_end].rstrip().endswith(';') and line_end < end:
+            position = line_end + 1
+            line_end = text.find('\n', position, end)
+            if line_end < 0:
+                line_end = end
+        statement_end = position + len(text[position:line_end].rstrip())
+        yield stripped.split('=')[0].strip(), line_start, statement_start, statement_end
+        position = line_end + 1
+
+
+class WindowSpan:
+    """
+    Where a window came from in the text of its file (see SourceText): the offsets of its WINDOW line,
+    of its properties and of the end of its END line, the windows that were its children and, once the
+    window is decoded, the values of its statements as they were parsed.
+    """
+
+    def __init__(self, source, start, props_start, props_end, file_name):
+        self.source = source
+        self.start = start
+        self.props_start = props_start
+        self.props_end = props_end
+        self.end = None  # Set by the END line; a window that was never closed is written canonically
+        self.child_uuids = ()
+        self.file_name = file_name
+        self.values = None  # statement_values of the parsed properties, None until decoded
+
+    def __deepcopy__(self, memo):
+        # The text is shared by every copy; the parsed values are copied along with the window properties
+        # (through `memo`), so an unchanged copy still compares identical
+        clone = copy.copy(self)
+        clone.values = copy.deepcopy(self.values, memo)
+        return clone
+
+    def remember(self, properties):
+        self.values = statement_values(properties, self.file_name)
+
+
+class SourceText:
+    """
+    Lossless view of a parsed WND file: its text as it was read, with the comments, blank lines and
+    formatting, and the span of every window (WndParser.parse_file(lossless=True)).
+
+    `render` writes the current windows back into that text. Property values are replaced rather than
+    edited in place (see commands.set_screen_rect), so a statement whose value is still the parsed object,
+    or an equal one, is kept byte for byte; only the statements of modified properties are regenerated,
+    in the indentation of the block. Windows that were added are written canonically, and so are the
+    CHILD / ENDALLCHILDREN lines of a window whose children were added, removed or reordered.
+    """
+
+    def __init__(self, text, metadata):
+        self.text = text
+        self.metadata = copy.deepcopy(metadata)
+        self.newline = "\r\n" if "\r\n" in text else "\n"
+        self.root_uuids = ()
+        self.windows_start = len(text)  # Start of the first window, end of the metadata section
+        self.windows_end = len(text)
+
+    def __deepcopy__(self, memo):
+        return self  # Immutable
+
+    def set_windows(self, windows):
+        """Remembers the root windows of the scan."""
+        self.root_uuids = tuple(window.window_uuid for window in windows)
+        spans = [window.source_span for window in windows]
+        if spans and spans[0] is not None and spans[-1] is not None and spans[-1].end is not None:
+            self.windows_start, self.windows_end = spans[0].start, spans[-1].end
+
+    def render(self, parser):
+        """The text of the file with the changes made to `parser` since it was parsed."""
+        out = []
+        if parser.file_metadata == self.metadata:
+            out.append(self.text[:self.windows_start])
+        else:
+            out.append(self.newline.join(parser._repr_metadata()) + self.newline)
+
+        windows = parser.windows
+        if self._same_windows(windows, self.root_uuids):
+            position = None
+            for window in windows:
+                if position is not None:
+                    out.append(self.text[position:window.source_span.start])
+                self._render_window(parser, window, out, "")
+                position = window.source_span.end
+        else:
+            if out[-1] and not out[-1].endswith("\n"):
+                out.append(self.newline)
+            for index, window in enumerate(windows):
+                if index:
+                    out.append(self.newline)
+                self._render_window(parser, window, out, "")
+        out.append(self.text[self.windows_end:])
+        return "".join(out)
+
+    def _same_windows(self, windows, uuids):
+        return (len(windows) == len(uuids)
+                and all(window.window_uuid == window_uuid and window.source_span is not None
+                        and window.source_span.source is self and window.source_span.end is not None
+                        for window, window_uuid in zip(windows, uuids)))
+
+    def _render_window(self, parser, window, out, indent):
+        span = window.source_span
+        if span is None or span.end is None:
+            lines = []
+            parser._repr_window(window, lines, indent_level=0)
+            out.append(self.newline.join(indent + line for line in lines))
+            return
+
+        source = span.source  # Windows pasted from another document keep the text of their own file
+        text = source.text
+        out.append(text[span.start:span.props_start])
+        out.append(source._properties_text(window, span))
+
+        if source._same_windows(window.children, span.child_uuids):
+            position = span.props_end
+            for child in window.children:
+                out.append(text[position:child.source_span.start])
+                source._render_window(parser, child, out, indent)
+                position = child.source_span.end
+            out.append(text[position:span.end])
+            return
+
+        # Children added, removed or moved: the structure lines of this window are regenerated
+        window_line = text[span.start:span.props_start]
+        indent = window_line[:len(window_line) - len(window_line.lstrip())]
+        for child in window.children:
+            out.append(f"{indent}  CHILD{self.newline}")
+            source._render_window(parser, child, out, indent + "  ")
+            out.append(self.newline)
+        if window.children:
+            out.append(f"{indent}  ENDALLCHILDREN{self.newline}")
+        out.append(f"{indent}END")
+
+    def _properties_text(self, window, span):
+        """The properties of a window, with only the statements whose value changed regenerated."""
+        original = self.text[span.props_start:span.props_end]
+        if not window.is_decoded and window.file_name == span.file_name:
+            return original  # Never decoded (lazy parse), so never edited
+
+        current = statement_values(window.properties, window.file_name)
+        parsed = span.values or {}  # Replaced before it was decoded: every statement is regenerated
+        changed = {tag for tag in current.keys() | parsed.keys()
+                   if current.get(tag) is not parsed.get(tag) and current.get(tag) != parsed.get(tag)}
+        if not changed:
+            return original
+
+        statements = {}
+        for tag, line_start, start, end in iter_statements(self.text, span.props_start, span.props_end):
+            statements.setdefault(tag, (line_start, start, end))
+        canonical_text = repr(window)
+        canonical = {}
+        for tag, line_start, start, end in iter_statements(canonical_text, 0, len(canonical_text)):
+            canonical.setdefault(tag, canonical_text[start:end])
+
+        edits = []  # (start, order, end, replacement), applied in text order
+        previous = None  # Last tag of the canonical order that is in the original text
+        for order, tag in enumerate(canonical):
+            if tag in statements:
+                if tag in changed:
+                    line_start, start, end = statements[tag]
+                    edits.append((start, order, end, self._indent(canonical[tag], self.text[line_start:start])))
+                previous = tag
+            elif tag in changed:
+                if previous is not None:
+                    line_start, start, end = statements[previous]
+                    indent = self.text[line_start:start]
+                    edits.append((end, order, end, self.newline + indent + self._indent(canonical[tag], indent)))
+                else:
+                    line_start, start, end = min(statements.values(), default=(span.props_start,) * 3)
+                    indent = self.text[line_start:start] or "  "
+                    edits.append((line_start, order, line_start,
+                                  indent + self._indent(canonical[tag], indent) + self.newline))
+        for tag in changed:
+            if tag in statements and tag not in canonical:
+                # Written only when set (TEXT, TOOLTIPTEXT...): the whole line goes
+                line_start, start, end = statements[tag]
+                line_end = self.text.find("\n", end, span.props_end)
+                edits.append((line_start, -1, line_end + 1 if line_end >= 0 else end, ""))
+
+        out = []
+        position = span.props_start
+        for start, order, end, replacement in sorted(edits):
+            out.append(self.text[position:start])
+            out.append(replacement)
+            position = end
+        out.append(self.text[position:span.props_end])
+        return "".join(out)
+
+    def _indent(self, statement, indent):
+        return (self.newline + indent).join(statement.split("\n"))
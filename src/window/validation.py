@@ -0,0 +1,200 @@
+from src.error_handler import ErrorHandler
+from src.window.property_decoders import tag_rank
+
+VALID_FONTS = ["Times New Roman", "Arial", "Courier New", "Placard MT Condensed", "Generals", "Courier"]
+VALID_STATUS = ["ENABLED", "DISABLED", "IMAGE", "HIDDEN"]
+MAX_NAME_LENGTH = 64
+
+
+class ValidationIssue:
+    """A rule violation of one window. `error_level` follows ErrorHandler (1: critical, 2: non-critical, 3: log)."""
+
+    def __init__(self, rule, window, message, error_level):
+        self.rule = rule
+        self.window_uuid = window.window_uuid
+        self.window_name = window.properties.get('NAME', 'Unknown')
+        self.message = message
+        self.error_level = error_level
+
+    def __repr__(self):
+        return f"{self.window_name}: {self.message}"
+
+
+# --- RULES ---
+# Each rule checks one aspect of a window model and yields (message, error_level) pairs.
+
+def check_tag_order(window):
+    """Properties in the order the game expects (the rank of their decoder), as they appeared in the parsed text."""
+    last_tag, last_index = None, -1
+    for tag in window.source_tags or ():
+        index = tag_rank(tag)
+        if index is None:
+            continue
+        if index < last_index:
+            yield f"Tag '{tag}' appeared out of order. Expected after '{last_tag}'", 1
+        else:
+            last_tag, last_index = tag, index
+
+
+def check_name_length(window):
+    """Window names the game can store (at most 64 characters, without the file name prefix)."""
+    name = window.properties.get('NAME', '')
+    if len(name) > MAX_NAME_LENGTH:
+        yield f"Name is {len(name)} characters long, the limit is {MAX_NAME_LENGTH}", 2
+
+
+def check_screenrect(window):
+    """SCREENRECT inside the creation resolution and at least 1x1 pixel."""
+    value = window.properties.get('SCREENRECT')
+    if not value:
+        yield "SCREENRECT is missing", 1
+        return
+    upper_left, bottom_right = value["UPPERLEFT"], value["BOTTOMRIGHT"]
+    creation_resolution = value["CREATIONRESOLUTION"]
+
+    # Both corners must be within the bounds of creation_resolution
+    if not (0 <= upper_left[0] <= creation_resolution[0] and 0 <= upper_left[1] <= creation_resolution[1]):
+        yield (f"Upper left {upper_left} coordinates must be within screen bounds\n"
+               f"defined by creation_resolution {creation_resolution}"), 2
+    if not (0 <= bottom_right[0] <= creation_resolution[0] and 0 <= bottom_right[1] <= creation_resolution[1]):
+        yield (f"Bottom right {bottom_right} coordinates must be within screen bounds\n"
+               f"defined by creation_resolution {creation_resolution}"), 2
+
+    # The rectangle must be at least 1x1 pixel
+    if not (bottom_right[0] > upper_left[0] and bottom_right[1] > upper_left[1]):
+        yield "Rectangle size must be at least 1x1 pixel", 1
+
+
+def check_status(window):
+    """STATUS contains one of ENABLED, DISABLED, IMAGE or HIDDEN."""
+    value = window.properties.get('STATUS', [])
+    if not any(status in value for status in VALID_STATUS):
+        yield f"Invalid status: {value}. Valid properties: {VALID_STATUS}", 1
+
+
+def check_font(window):
+    """FONT is a known font, 8 to 72 points, bold 0 or 1."""
+    value = window.properties.get('FONT')
+    if not value:
+        yield "FONT is missing or formatted incorrectly", 1
+        return
+    if value["name"] not in VALID_FONTS:
+        yield f"Invalid font name: {value['name']}. Valid properties: {VALID_FONTS}", 3
+    if not (8 <= value["size"] <= 72):
+        yield "Font size must be between 8 and 72", 1
+    if value["bold"] not in [0, 1]:
+        yield "Font bold must be either 0 or 1", 1
+
+
+def _is_valid_color(color):
+    # 4 integers (RGBA format), each in the range 0-255
+    return len(color) == 4 and min(color) >= 0 and max(color) <= 255
+
+
+def check_text_color(window):
+    """TEXTCOLOR entries are RGBA colors with components between 0 and 255."""
+    for color_name, color in window.properties.get('TEXTCOLOR', {}).items():
+        if not (isinstance(color, tuple) and _is_valid_color(color)):
+            yield (f"Invalid color for {color_name}: {color}. "
+                   f"Colors must be in RGBA format with values between 0 and 255"), 1
+
+
+def check_textures(window):
+    """Draw data lists have 9 entries of IMAGE, COLOR and BORDERCOLOR."""
+    for key, draw_data in window.properties.get('textures', {}).items():
+        if not isinstance(draw_data, list) or len(draw_data) != 9:
+            yield f"{key}: Draw data must be a list with exactly 9 items, len: {len(draw_data)}", 1
+            continue
+        for entry in draw_data:
+            if 'IMAGE' not in entry or 'COLOR' not in entry or 'BORDERCOLOR' not in entry:
+                yield f"{key}: Each draw data entry must contain IMAGE, COLOR, and BORDERCOLOR", 1
+            elif not isinstance(entry['IMAGE'], str):
+                yield f"{key}: Image must be a string or 'NoImage'", 1
+            elif not (_is_valid_color(entry['COLOR']) and _is_valid_color(entry['BORDERCOLOR'])):
+                yield f"{key}: Color must have exactly 4 values (R, G, B, A) between 0 and 255", 1
+            else:
+                continue
+            break  # One issue per draw data is enough
+
+
+def check_columns_width(window):
+    """Controls with several columns (list boxes) need one COLUMNSWIDTH per column."""
+    for tag, subfields in window.properties.get('attributes', {}).items():
+        columns, widths = subfields.get('COLUMNS'), subfields.count('COLUMNSWIDTH')
+        if columns is not None and columns > 1 and widths != columns:
+            yield f"{tag}: Number of COLUMNSWIDTH ({widths}) does not match COLUMNS number({columns})", 2
+
+
+# Run in this order, which is also the order the issues of a window are reported in
+RULES = [
+    ("tag_order", check_tag_order),
+    ("name_length", check_name_length),
+    ("columns_width", check_columns_width),
+    ("screenrect", check_screenrect),
+    ("status", check_status),
+    ("font", check_font),
+    ("text_color", check_text_color),
+    ("textures", check_textures),
+]
+
+
+class Validator:
+    """
+    Checks window models against the RULES, separately from parsing.
+
+    Remembers the issues of every window it checked, so `revalidate` only re-checks the windows that were
+    invalidated (edited) or added since the last run. Windows of a file parsed with `validate=False` are
+    unchecked until the first run.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = rules if rules is not None else RULES
+        self.results = {}  # window uuid -> list of ValidationIssue, for every window checked so far
+        self._dirty = set()
+
+    def validate_window(self, window):
+        """Checks one window and remembers its issues."""
+        issues = [ValidationIssue(rule_name, window, message, error_level)
+                  for rule_name, rule in self.rules
+                  for message, error_level in rule(window)]
+        self.results[window.window_uuid] = issues
+        self._dirty.discard(window.window_uuid)
+        return issues
+
+    def invalidate(self, windows):
+        """Marks edited windows to be checked again by the next `revalidate`."""
+        self._dirty.update(window.window_uuid for window in windows)
+
+    def revalidate(self, windows):
+        """
+        Brings the results up to date with the window hierarchy `windows` and returns all issues, in tree order.
+        :return: (issues, number of windows that were checked in this run)
+        """
+        issues = []
+        checked = 0
+        seen = set()
+        pending = list(reversed(windows))
+        while pending:
+            window = pending.pop()
+            seen.add(window.window_uuid)
+            if window.window_uuid in self._dirty or window.window_uuid not in self.results:
+                self.validate_window(window)
+                checked += 1
+            issues.extend(self.results[window.window_uuid])
+            pending.extend(reversed(window.children))
+
+        # Forget deleted windows
+        for window_uuid in self.results.keys() - seen:
+            del self.results[window_uuid]
+        self._dirty &= seen
+        return issues, checked
+
+    @staticmethod
+    def report(issues, file_path, line_number):
+        """
+        Reports issues found while loading through the ErrorHandler, with the line the window block starts at.
+        Critical (level 1) issues raise ValueError.
+        """
+        for issue in issues:
+            ErrorHandler.raise_error(file_path, -1, f"Window block that start in {line_number}",
+                                     f"Window name: {issue.window_name}:\n{issue.message}", error_level=issue.error_level)
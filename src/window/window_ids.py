@@ -0,0 +1,37 @@
+import itertools
+import uuid
+
+
+class WindowIdAllocator:
+    """
+    Hands out the ids of windows (Window.window_uuid): small ints counting up from 1, unique within the
+    running editor, cheap to hash and to compare. They are not written to files and do not outlive the
+    process; data that can leave it (drag and drop) is tagged with `session`, so ids of another editor
+    instance are told apart from ours.
+    """
+
+    def __init__(self):
+        self._counter = itertools.count(1)  # next() is atomic, background parsing threads can share it
+        self.session = uuid.uuid4().hex
+
+    def next_id(self):
+        return next(self._counter)
+
+    def encode(self, window_ids):
+        """Ids as text for data leaving the editor, e.g. QMimeData."""
+        return f"{self.session}:{','.join(map(str, window_ids))}"
+
+    def decode(self, text):
+        """Ids written by `encode`; none if they were written by another editor instance."""
+        session, _, ids = text.partition(":")
+        if session != self.session or not ids:
+            return []
+        return [int(window_id) for window_id in ids.split(",")]
+
+
+# Process-wide allocator
+window_ids = WindowIdAllocator()
+
+
+def new_window_id():
+    return window_ids.next_id()
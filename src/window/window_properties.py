@@ -1,5 +1,6 @@
-import re
-from src.error_handler import ErrorHandler, InvalidValuesError
+import sys
+from src.error_handler import ErrorHandler
+from src.window.attribute_data import AttributeData
 from src.window.controls.checkbox import CheckBoxControl
 from src.window.controls.combobox import ComboBoxControl
 from src.window.controls.entryfiled import EntryFieldControl
@@ -12,400 +13,195 @@ from src.window.controls.statictext import StaticTextControl
 from src.window.controls.user import UserControl
 from src.window.controls.vertslider import VertSliderControl
 from src.window.line_iterator import LineIterator
+from src.window.property_decoders import BLOCK_END_LINES, find_decoder, read_statement
+from src.window.validation import Validator
+from src.window.source_text import statement_values
 
 
 class ObjectFactory:
-    def __init__(self):
-        # Mapping from object types to control classes
-        self.control_classes = {
-            "USER": UserControl,
-            "PUSHBUTTON": PushButtonControl,
-            "STATICTEXT": StaticTextControl,
-            "ENTRYFIELD": EntryFieldControl,
-            "CHECKBOX": CheckBoxControl,
-            "RADIOBUTTON": RadioButtonControl,
-            "PROGRESSBAR": ProgressBarControl,
-            "HORZSLIDER": HorzSliderControl,
-            "VERTSLIDER": VertSliderControl,
-            "SCROLLLISTBOX": ScrollListBoxControl,
-            "COMBOBOX": ComboBoxControl
-        }
+    # Control type registry: WINDOWTYPE -> control class. The defaults of a new control come from the shared
+    # template of its class (UserControl.new_properties), parsed windows are built from their own properties.
+    control_classes = {
+        "USER": UserControl,
+        "PUSHBUTTON": PushButtonControl,
+        "STATICTEXT": StaticTextControl,
+        "ENTRYFIELD": EntryFieldControl,
+        "CHECKBOX": CheckBoxControl,
+        "RADIOBUTTON": RadioButtonControl,
+        "PROGRESSBAR": ProgressBarControl,
+        "HORZSLIDER": HorzSliderControl,
+        "VERTSLIDER": VertSliderControl,
+        "SCROLLLISTBOX": ScrollListBoxControl,
+        "COMBOBOX": ComboBoxControl
+    }
+
+    @classmethod
+    def register_control(cls, object_type, control_class):
+        cls.control_classes[object_type] = control_class
 
     def create_object(self, object_type, window_uuid, properties=None, children=None, file_name=None):
+        """A control of `object_type` with the given properties, or a copy of the defaults of the type if none."""
         control_class = self.control_classes.get(object_type)
         if not control_class:
             raise ValueError(f"Invalid window type: {object_type}")
         return control_class(window_uuid, properties, children, file_name)
 
 
-def parse_screenrect(lines_iter):
-    combined_line = ""
-    while True:
-        try:
-            line = lines_iter.peek().strip()
-            combined_line += line
-            if combined_line.endswith(';'):
-                match = re.match(
-                    r"SCREENRECT = UPPERLEFT: (\d+) (\d+),\s*BOTTOMRIGHT: (\d+) (\d+),\s*CREATIONRESOLUTION: (\d+) (\d+);",
-                    combined_line
-                )
-                if match:
-                    upper_left_x = int(match.group(1))
-                    upper_left_y = int(match.group(2))
-                    bottom_right_x = int(match.group(3))
-                    bottom_right_y = int(match.group(4))
-                    creation_res_x = int(match.group(5))
-                    creation_res_y = int(match.group(6))
+object_factory = ObjectFactory()
 
-                    return {
-                        "UPPERLEFT": (upper_left_x, upper_left_y),
-                        "BOTTOMRIGHT": (bottom_right_x, bottom_right_y),
-                        "CREATIONRESOLUTION": (creation_res_x, creation_res_y),
-                    }
-                else:
-                    raise ValueError("Invalid SCREENRECT format")
-            next(lines_iter)
-        except StopIteration:
-            break
-    raise ValueError("SCREENRECT not found or formatted incorrectly")
 
+# Function to parse the window properties and return a Window object
+def parse_window_properties(lines_iter, window_uuid, file_name, validator=None):
+    """
+    Parses the properties of a window block into a control of its WINDOWTYPE.
+    Each statement is decoded by the decoder registered for its tag (see property_decoders).
+    :param validator: If given, the window is checked against the validation rules afterwards and
+                      the issues are reported like parse errors. Without it, only the syntax is checked.
+    """
+    line_start = lines_iter.line_number
+    # Values of the missing tags
+    properties = {
+        'WINDOWTYPE': "",
+        'NAME': "",
+        'SCREENRECT': {},
+        'STATUS': [],
+        'STYLE': [],
+        'SYSTEMCALLBACK': "",
+        'INPUTCALLBACK': "",
+        'TOOLTIPCALLBACK': "",
+        'DRAWCALLBACK': "",
+        'FONT': {},
+        'HEADERTEMPLATE': "",
+        'TOOLTIPTEXT': "",
+        'TOOLTIPDELAY': None,
+        'TEXT': "",
+        'TEXTCOLOR': {},
+        'attributes': {},
+        'textures': {}
+    }
+
+    # The tags in the order they were encountered, for the tag order validation rule
+    encountered_tags = []
 
-def parse_text_colors(lines_iter):
-    combined_line = ""
-    text_colors = {}
     while True:
         try:
-            line = lines_iter.peek().strip()
-            combined_line += line
-            if combined_line.endswith(';'):
-                match = re.findall(r'(\w+):\s*(\d+)\s*(\d+)\s*(\d+)\s*(\d+);?', combined_line)
-                if match:
-                    for key, r, g, b, a in match:
-                        text_colors[key] = (int(r), int(g), int(b), int(a))
-                    return text_colors
-                else:
-                    raise ValueError("Invalid text color format")
-            next(lines_iter)
+            line = lines_iter.peek()
         except StopIteration:
             break
-    raise ValueError("TEXTCOLOR not found or formatted incorrectly")
-
-
-def parse_draw_data(lines_iter):
-    # Function to parse draw data with IMAGE, COLOR, BORDERCOLOR
-    draw_data = []
-    combined_line = ""
-    while True:
-        try:
-            line = lines_iter.peek().strip()
-            combined_line += line
-            if combined_line.endswith(';'):
-                draw_matches = re.findall(r'IMAGE: (\S+), COLOR: (\d+ \d+ \d+ \d+), BORDERCOLOR: (\d+ \d+ \d+ \d+)',
-                                          combined_line)
-                if draw_matches:
-                    for image, color, BORDERCOLOR in draw_matches:
-                        draw_data.append({
-                            "IMAGE": image,
-                            "COLOR": tuple(map(int, color.split())),
-                            "BORDERCOLOR": tuple(map(int, BORDERCOLOR.split()))
-                        })
-                    return draw_data  # Return if valid data found
-                else:
-                    raise ValueError("Invalid draw data format")
-
-            next(lines_iter)
-        except StopIteration:
+        if line.rstrip(";") in BLOCK_END_LINES:
             break
-    raise ValueError("Draw data not found or formatted incorrectly")
-
-
-def parse_color_field(value):
-    # Function to parse color-related properties (like TEXTCOLOR)
-    color_data = {}
-    color_matches = re.findall(r'(\w+):\s*(\d+)\s*(\d+)\s*(\d+)\s*(\d+)', value)
-    for name, r, g, b, a in color_matches:
-        # Store the color as a tuple (r, g, b, a)
-        color_data[name] = (int(r), int(g), int(b), int(a))
-    return color_data
-
-
-def parse_textures_properties(lines_iter):
-    # Dictionary to store parsed values
-    textures_properties = {}
-    combined_line = ""
-    tag_value_pattern = re.compile(r'(\w+)\s*=\s*([^;]+);')
-
-    while True:
-        try:
-            line = lines_iter.peek().strip()
-            if line in ["END", "CHILD"]:
-                break
-            combined_line += line
-            if combined_line.endswith(';'):
-                match = tag_value_pattern.match(combined_line)
-                if match:
-                    tag, value = match.groups()
-                    value = value.strip()
-                    # Handling draw data (like IMAGE, COLOR, BORDERCOLOR)
-                    textures_properties[tag] = parse_draw_data(LineIterator(combined_line.splitlines()))
-                else:
-                    raise ValueError("Invalid window_properties field format")
-                combined_line = ""
-            next(lines_iter)
-        except StopIteration:
-            break
-    return textures_properties
-
-
-def parse_attributes_properties(lines_iter):
-    # Dictionary to store parsed values
-    combined_line = ""
-    tag_value_pattern = re.compile(r'(\w+)\s*=\s*([^;]+)(?:,|;)?')
-    subfields = []
-    columns_value = None
-    columns_widths = 0
-
-    while True:
-        try:
-            line = lines_iter.peek().strip()
-            match = tag_value_pattern.match(line)
-            if line in ["END", "CHILD"] or (match and match.group(1).endswith("DRAWDATA")):
-                break
-            combined_line += line
-            if combined_line.endswith(';'):
-                match = tag_value_pattern.match(combined_line)
-                if match:
-                    tag, value = match.groups()
-                    value = value.strip()
-                    sub_lines_iter = LineIterator(value.split(','))  # create iterator for subfields
-
-                    while True:
-                        try:
-                            sub_line = next(sub_lines_iter).strip()
-                            sub_match = re.match(r'(\w+):\s*([^,;]+)(?:,|$)', sub_line)
-                            if sub_match:
-                                sub_name, sub_value = sub_match.groups()
-                                sub_value = int(sub_value.strip())
-
-                                if sub_name == "COLUMNS":
-                                    # Save the COLUMNS value to check COLUMNSWIDTH later
-                                    columns_value = sub_value
-                                elif sub_name == "COLUMNSWIDTH":
-                                    # Collect COLUMNSWIDTH appears
-                                    columns_widths += 1
-                                subfields.append({sub_name: sub_value})
-                            elif sub_line:  # Skip empty subfields
-                                raise ValueError(f"Invalid subfield format: '{sub_line}'")
-
-                        except StopIteration:
-                            # After processing, check if the number of COLUMNSWIDTH matches COLUMNS
-                            if columns_value is not None and columns_value > 1:
-                                if columns_widths != columns_value:
-                                    ErrorHandler.raise_error(lines_iter.file_path, lines_iter.line_number,
-                                                             combined_line,
-                                                             f"Number of COLUMNSWIDTH ({columns_widths}) does not match COLUMNS number({columns_value})",
-                                                             error_level=2)
-                            break
-                    if not subfields:
-                        raise ValueError("Invalid data")
-                else:
-                    raise ValueError("Invalid window_properties field format")
-                break
+        if not line or line.startswith(";"):
+            next(lines_iter)  # Blank line or comment
+            continue
+
+        tag, has_value, value = line.partition("=")
+        tag = tag.strip()
+        if not has_value:
+            ErrorHandler.raise_error(lines_iter.file_path, lines_iter.line_number, line,
+                                     "Unexpeced line", error_level=2)
             next(lines_iter)
-        except StopIteration:
-            break
+            continue
 
-    return subfields
-
-
-# Function to parse the window properties and return a Window object
-def parse_window_properties(lines_iter, window_uuid, file_name):
-    # Initialize variables to store parsed data
-    line_start = lines_iter.line_number
-    window_type = ""
-    screen_rect = {}
-    name = ""
-    status = []
-    style = []
-    system_callback = ""
-    input_callback = ""
-    tooltip_callback = ""
-    draw_callback = ""
-    font = {}
-    header_template = ""
-    tooltip_text = ""
-    tooltip_delay = None
-    text = ""
-    text_color = {}
-    textures = {}
-    attributes = {}
-
-    # A list to track tags we've seen so far, in the order they were encountered
-    encountered_tags = []
-
-    # Define the correct order of tags
-    correct_tag_order = [
-        "WINDOWTYPE", "SCREENRECT", "NAME", "STATUS", "STYLE",
-        "SYSTEMCALLBACK", "INPUTCALLBACK", "TOOLTIPCALLBACK", "DRAWCALLBACK",
-        "FONT", "HEADERTEMPLATE", "TOOLTIPTEXT", "TOOLTIPDELAY", "TEXT", "TEXTCOLOR",
-        "ENABLEDDRAWDATA", "DISABLEDDRAWDATA", "HILITEDRAWDATA"
-    ]
-    while True:
+        decoder = find_decoder(tag)
         try:
-            line = lines_iter.peek().strip().rstrip(";")  # Clean up the line
-
-            # If we encounter END or CHILD, break the loop
-            if line in ["END", "CHILD", "ENDALLCHILDREN"]:
-                break
-
-            if "=" not in line and not line.startswith(";"):
+            if decoder is None:
                 ErrorHandler.raise_error(lines_iter.file_path, lines_iter.line_number, line,
-                                         "Unexpeced line", error_level=2)
-
-            tag = line.split('=')[0].strip()
-            # Check if the tag appears in the correct order
-            if tag in correct_tag_order:
-                expected_index = correct_tag_order.index(tag)
-                if encountered_tags:
-                    last_encountered_tag = encountered_tags[-1]
-                    last_encountered_index = correct_tag_order.index(last_encountered_tag)
-                    if expected_index < last_encountered_index:
-                        # If the tag appears out of order, raise an error using _raise_error
-                        raise ValueError(f"Tag '{tag}' appeared out of order. Expected after '{last_encountered_tag}'.")
-
-            # Parse each line based on its tag
-            match tag:
-                case "WINDOWTYPE":
-                    window_type = line.split("=")[1].strip()
-
-                case "SCREENRECT":
-                    screen_rect = parse_screenrect(lines_iter)
-
-                case "NAME":
-                    file_name = line.split("=")[1].strip().strip('"').split(":")[0]
+                                         f"Unknown tag: {tag}", error_level=2)
+            else:
+                if decoder.multiline:
+                    statement = read_statement(lines_iter)
+                    if statement is None:
+                        ErrorHandler.raise_error(lines_iter.file_path, lines_iter.line_number, line,
+                                                 f"{tag} not found or formatted incorrectly", error_level=2)
+                        continue  # The line that ended it is parsed next
+                    value = statement.partition("=")[2]
+                value = decoder.decode(value.strip().rstrip(";"))
+
+                if decoder.key != tag:
+                    properties[decoder.key][tag] = value
+                elif tag == "NAME":
+                    file_name, properties['NAME'] = value
                     if file_name == "":
                         ErrorHandler.raise_error(lines_iter.file_path, lines_iter.line_number, line,
                                                  f"file name is missing in name", error_level=2)
-                    name = line.split("=")[1].strip().strip('"').split(":")[-1]
-
-                # Handle multiple STATUS values (e.g., ENABLED+IMAGE)
-                case "STATUS":
-                    status = [s.strip() for s in line.strip().split("=")[1].split("+")]
-
-                # Handle multiple STYLE values (e.g., MOUSETRACK+COMBOBOX)
-                case "STYLE":
-                    style = [s.strip() for s in line.strip().split("=")[1].strip().split("+")]
-
-                # Handle CALLBACK lines
-                case "SYSTEMCALLBACK" | "INPUTCALLBACK" | "TOOLTIPCALLBACK" | "DRAWCALLBACK":
-                    callback_value = line.split("=")[1].strip().strip('"')
-                    match tag:
-                        case "SYSTEMCALLBACK":
-                            system_callback = callback_value
-                        case "INPUTCALLBACK":
-                            input_callback = callback_value
-                        case "TOOLTIPCALLBACK":
-                            tooltip_callback = callback_value
-                        case "DRAWCALLBACK":
-                            draw_callback = callback_value
-
-                case "FONT":
-                    match = re.match(r'FONT = NAME: "(.+)", SIZE: (\d+), BOLD: (\d+)?', line)
-                    if match:
-                        font = {
-                            "name": match.group(1),
-                            "size": int(match.group(2)),
-                            "bold": int(match.group(3))
-                        }
-
-                case "HEADERTEMPLATE":
-                    header_template = line.split("=")[1].strip().strip('"')
-
-                case "TOOLTIPTEXT":
-                    tooltip_text = line.split("=")[1].strip().strip('"')
-
-                case "TOOLTIPDELAY":
-                    tooltip_delay = int(line.split("=")[1].strip())
-
-                case "TEXT":
-                    text = line.split("=")[1].strip().strip('"')
-
-                case "TEXTCOLOR":
-                    text_color = parse_text_colors(lines_iter)
-
-                # Handle other fields or additional custom parsing
-                case _:
-                    if tag.endswith("DRAWDATA"):
-                        textures[tag] = parse_draw_data(lines_iter)
-                    elif tag.endswith("DATA"):
-                        attributes[tag] = parse_attributes_properties(lines_iter)
-                    else:
-                        ErrorHandler.raise_error(lines_iter.file_path, lines_iter.line_number, line,
-                                                       f"Unknown tag: {tag}", error_level=2)
-
-            # After processing, add the tag to the list of encountered tags
-            line = lines_iter.peek().strip().rstrip(";")
-            encountered_tags.append(tag)
-            if line in ["END", "CHILD", "ENDALLCHILDREN"]:
-                break
-
-            next(lines_iter)
-
-        except StopIteration:
-            break
+                else:
+                    properties[tag] = value
+            encountered_tags.append(sys.intern(tag))
         except ValueError as e:
             ErrorHandler.raise_error(lines_iter.file_path, lines_iter.line_number, line, e, error_level=2)
+        next(lines_iter)
 
     # Return the  object with the parsed data, according to window_type
     try:
-        factory = ObjectFactory()
-
-        new_object = factory.create_object(window_type, window_uuid,
-                                           properties={
-                                               'WINDOWTYPE': window_type,
-                                               'NAME': name,
-                                               # 'SCREENRECT': screen_rect,
-                                               # 'STATUS': status,
-                                               'STYLE': style,
-                                               'SYSTEMCALLBACK': system_callback,
-                                               'INPUTCALLBACK': input_callback,
-                                               'TOOLTIPCALLBACK': tooltip_callback,
-                                               'DRAWCALLBACK': draw_callback,
-                                               # 'FONT': font,
-                                               'HEADERTEMPLATE': header_template,
-                                               'TOOLTIPTEXT': tooltip_text,
-                                               'TOOLTIPDELAY': tooltip_delay,
-                                               'TEXT': text,
-                                               # 'TEXTCOLOR': text_color,
-                                               'attributes': attributes,
-                                               # 'textures': textures
-                                           }, file_name=file_name)
-        new_object._set_SCREENRECT(screen_rect)
-        new_object._set_STATUS(status)
-        new_object._set_FONT(font)
-        new_object._set_TEXTCOLOR(text_color)
-        new_object._set_textures(textures)
+        window_type = properties['WINDOWTYPE']
+        new_object = object_factory.create_object(window_type, window_uuid, properties=properties, file_name=file_name)
+        new_object.source_tags = tuple(encountered_tags)
 
         # --- Default/migration: ensure SCROLLIFATEND exists for SCROLLLISTBOX ---
         if window_type == "SCROLLLISTBOX":
-            if attributes is None:
-                attributes = {}
-
-            listbox = attributes.get("LISTBOXDATA")
-            if listbox is None:
-                listbox = []
-                attributes["LISTBOXDATA"] = listbox
-
-            # LISTBOXDATA is a list of dicts like [{'AUTOSCROLL': 0}, ...]
-            has_scrollifatend = any(
-                isinstance(d, dict) and "SCROLLIFATEND" in d
-                for d in listbox
-            )
-            if not has_scrollifatend:
-                listbox.append({"SCROLLIFATEND": 0})
-
-        return new_object
+            attributes = properties['attributes']
+            listbox = attributes.get("LISTBOXDATA", AttributeData())
+            if "SCROLLIFATEND" not in listbox:
+                attributes["LISTBOXDATA"] = listbox.append("SCROLLIFATEND", 0)
     except ValueError as e:
         ErrorHandler.raise_error(lines_iter.file_path, -1, f"Window block that start in {line_start}", e, error_level=1)
-    except InvalidValuesError as e:
-        ErrorHandler.raise_error(lines_iter.file_path, -1, f"Window block that start in {line_start}", e, error_level=1)
+
+    if validator is not None:
+        Validator.report(validator.validate_window(new_object), lines_iter.file_path, line_start)
+    return new_object
+
+
+def parse_statements(statements, window_type, file_name):
+    """
+    Parses some property statements of a window of `window_type`, e.g. the ones edited in the Raw tab.
+    Properties without a statement get the values parse_window_properties gives missing tags.
+    :return: statement_values of the parsed window. Errors are reported through the ErrorHandler.
+    """
+    lines = [f"WINDOWTYPE = {window_type};"]
+    for statement in statements:
+        lines.extend(statement.splitlines())
+    lines_iter = LineIterator(lines)
+    lines_iter.file_path = file_name
+    parsed = parse_window_properties(lines_iter, window_uuid=None, file_name=file_name)
+    return statement_values(parsed.properties, parsed.file_name)
+
+
+class WindowBlockSource:
+    """Raw bytes of the properties of a window block, decoded on demand (see Window.properties)."""
+
+    def __init__(self, block, line_number, file_path, encoding, validator=None):
+        self.block = block
+        self.line_number = line_number  # Line of the first property, for error messages
+        self.file_path = file_path
+        self.encoding = encoding
+        self.validator = validator  # Checks the window once decoded, None if the file is trusted
+
+    def __deepcopy__(self, memo):
+        return self  # Immutable
+
+    def decode(self, window):
+        lines_iter = LineIterator(self.block.decode(self.encoding).splitlines())
+        lines_iter.file_path = self.file_path
+        lines_iter.line_number = self.line_number
+        decoded = parse_window_properties(lines_iter, window_uuid=window.window_uuid, file_name=window.file_name,
+                                          validator=self.validator)
+        window.source_tags = decoded.source_tags
+        if window.source_span is not None:
+            window.source_span.remember(decoded.properties)
+        return decoded.properties
+
+
+def create_lazy_window(window_type, name, window_uuid, file_name, source):
+    """
+    Window found by the structural scan of WndParser: only its type and name are known until
+    its properties are first used, which decodes (and validates, see WindowBlockSource) the rest from `source`.
+    """
+    try:
+        new_object = object_factory.create_object(window_type, window_uuid,
+                                                  properties={'WINDOWTYPE': window_type, 'NAME': name},
+                                                  file_name=file_name)
+    except ValueError as e:
+        ErrorHandler.raise_error(source.file_path, -1, f"Window block that start in {source.line_number}", e,
+                                 error_level=1)
+    new_object._source = source
+    return new_object
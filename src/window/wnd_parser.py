@@ -1,7 +1,17 @@
-import uuid
+import mmap
+import os
+import re
 from src.window.window_properties import *
 from src.error_handler import ErrorHandler
 from src.window.line_iterator import LineIterator
+from src.window.validation import Validator
+from src.window.source_text import SourceText, WindowSpan
+from src.window.window_ids import new_window_id
+from src.tracing import traced
+
+# WND files are plain ASCII in practice. Latin-1 maps every byte to one character,
+# so any file is read and written back byte for byte whatever the platform's default encoding is.
+WND_ENCODING = "latin-1"
 
 
 class WndParser:
@@ -11,15 +21,34 @@ class WndParser:
         "CHILD": "ENDALLCHILDREN"
     }
     tag_pattern = re.compile(r'^(\w+)\s*=\s*(.*);$')
+    encoding = WND_ENCODING
+
+    # Byte patterns of the structural scan (lazy parse)
+    _first_window_line = re.compile(rb'^[ \t\r\f\v]*WINDOW[^\n]*\n?', re.M)
+    # Starts with the newline instead of ^, which lets the regex engine jump between line breaks
+    _structure_line = re.compile(
+        rb'\n[ \t\r\f\v]*(WINDOW|END|CHILD|ENDALLCHILDREN|(?:WINDOWTYPE|NAME)\b[^\r\n]*?)[ \t\r\f\v]*$', re.M)
+    _comment_lines = re.compile(rb'[ \t\r\f\v]*(?:\n[ \t\r\f\v]*;[^\n]*)*\n?')
 
     def __init__(self):
         self.file_metadata = {}
         self.windows = []
+        self.validator = Validator()  # Results of the validation rules, kept up to date by the editor
+        self.source = None  # SourceText of a lossless parse
 
     def __repr__(self):
         """
         Returns a string representation of the WndParser instance in the format of the original WND file.
         """
+        lines = self._repr_metadata()
+
+        # Windows section
+        for window in self.windows:
+            self._repr_window(window, lines, indent_level=0)
+
+        return "\n".join(lines)
+
+    def _repr_metadata(self):
         lines = []
 
         # Metadata section
@@ -33,12 +62,26 @@ class WndParser:
             for key, value in layout_block.items():
                 lines.append(f"  {key} = {value};")
             lines.append("ENDLAYOUTBLOCK")
+        return lines
 
-        # Windows section
-        for window in self.windows:
-            self._repr_window(window, lines, indent_level=0)
-
-        return "\n".join(lines)
+    def to_text(self):
+        """
+        Text to save: the text the file was parsed from with only the modified parts regenerated
+        (see SourceText) after a lossless parse, the canonical representation otherwise.
+        """
+        if self.source is None:
+            return repr(self)
+        return self.source.render(self)
+
+    def write_file(self, file_path):
+        """Saves the windows to `file_path` (see to_text)."""
+        if self.source is None:
+            with open(file_path, 'w', encoding=self.encoding) as file:
+                file.write(repr(self))
+            return
+        # The text keeps the line endings of the parsed file
+        with open(file_path, 'w', encoding=self.encoding, newline='') as file:
+            file.write(self.source.render(self))
 
     def enforce_file_names(self, correct_filename):
         """Recursively repairs all windows to ensure their prefix matches the parent file."""
@@ -71,12 +114,32 @@ class WndParser:
         # Close the current window
         lines.append(f"{indent}END")
 
-    def parse_file(self, file_path):
+    @traced(category="parser")
+    def parse_file(self, file_path, lazy=False, validate=True, lossless=False):
         """
         Parse a WND file and extract metadata and windows hierarchy.
         :param file_path: Path to the WND file.
+        :param lazy: Only scan the window blocks (hierarchy, type and name). Each window decodes and
+                     validates its properties on first use, so errors in a block are reported then.
+        :param validate: Check every window against the validation rules (bounds, fonts, colors, tag order...).
+                         Trusted files, e.g. ones written by GenWND itself, can skip it and only get the syntax
+                         checked; `validator.revalidate` can check them later.
+        :param lossless: Keep the text of the file with its comments and formatting (see SourceText), so
+                         `write_file` only rewrites what was modified. Uses the structural scan; without
+                         `lazy`, every window is decoded right after it.
         """
-        with open(file_path, 'r') as file:
+        validator = self.validator if validate else None
+        if lazy or lossless:
+            self._scan_file(file_path, validator, lossless)
+            if not lazy:
+                pending = list(self.windows)
+                while pending:
+                    window = pending.pop()
+                    window.properties  # Decodes, in file order
+                    pending.extend(reversed(window.children))
+            return
+
+        with open(file_path, 'r', encoding=self.encoding) as file:
             lines = file.readlines()
 
         # Create a LineIterator for better line management
@@ -87,7 +150,7 @@ class WndParser:
         self._parse_metadata(lines_iter, file_path)
 
         # Parse windows
-        self._parse_windows(lines_iter, file_path)
+        self._parse_windows(lines_iter, file_path, validator)
 
     def _valid_match(self, match, i, line, file_path) -> bool:
         """
@@ -198,7 +261,7 @@ class WndParser:
         if not file_version_found:
             ErrorHandler.raise_error(file_path, lines_iter.line_number, 0, "Missing FILE_VERSION", error_level=2)
 
-    def _parse_windows(self, lines_iter, file_path):
+    def _parse_windows(self, lines_iter, file_path, validator=None):
         """
         Parses a hierarchical configuration of windows and their relationships, including parent-child structures.
 
@@ -219,6 +282,7 @@ class WndParser:
 
         :param lines_iter: An iterator over the configuration lines. Starts with the first "WINDOW" line.
         :param file_path: The path to the configuration file being parsed.
+        :param validator: Validator checking each window once parsed, None to skip the validation rules.
         :return: None. The parsed windows are stored in the instance attribute `self.windows`.
         :raises ValueError: If an unexpected line structure is encountered, such as "CHILD" without a parent window,
                              "END" without a corresponding "WINDOW", or missing "ENDALLCHILDREN" when required.
@@ -235,11 +299,12 @@ class WndParser:
 
             if line == "WINDOW":
                 next(lines_iter)
-                # Create a unique UUID for the window
-                window_uuid = str(uuid.uuid4())
+                # Create a unique id for the window
+                window_uuid = new_window_id()
 
                 # Parse the window's properties using the parse_window_properties function
-                new_window = parse_window_properties(lines_iter, file_name=lines_iter.file_path, window_uuid=window_uuid)
+                new_window = parse_window_properties(lines_iter, file_name=lines_iter.file_path, window_uuid=window_uuid,
+                                                     validator=validator)
 
                 # Create a new Window object with its properties
                 next_line = lines_iter.peek().strip()
@@ -289,6 +354,120 @@ class WndParser:
         if stack:
             ErrorHandler.raise_error(file_path, lines_iter.line_number, "EOF", "Unclosed windows found.")
 
+    def _scan_file(self, file_path, validator=None, lossless=False):
+        """
+        Lazy parse: memory-maps the file and scans its bytes for the block keywords. Only the metadata
+        and the WINDOWTYPE / NAME values are decoded; every window keeps the bytes of its properties.
+        """
+        with open(file_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+            try:
+                # The metadata parser stops at the first WINDOW line, so it gets everything up to and including it
+                first_window = self._first_window_line.search(data)
+                head_end = first_window.end() if first_window else len(data)
+                lines_iter = LineIterator(data[:head_end].decode(self.encoding).splitlines())
+                lines_iter.file_path = file_path
+                self._parse_metadata(lines_iter, file_path)
+
+                if lossless:
+                    self.source = SourceText(data[:].decode(self.encoding), self.file_metadata)
+                if first_window:
+                    self._scan_windows(data, first_window.start(), file_path, validator)
+                if lossless:
+                    self.source.set_windows(self.windows)
+            finally:
+                if size:
+                    data.close()
+
+    def _scan_windows(self, data, offset, file_path, validator=None):
+        """
+        Byte-level counterpart of _parse_windows, following the same nesting rules. The properties between a
+        WINDOW line and its END / CHILD line are skipped, apart from WINDOWTYPE and NAME.
+        """
+        stack = []
+        parent_window = None
+        # Window whose properties are being skipped: [start offset, line number, type, name, file name, WINDOW line offset]
+        block = None
+        gap_start = offset  # Outside of property blocks, only comment lines may follow the last keyword
+        offset = max(offset - 1, 0)  # The newline ending the metadata, matched by _structure_line
+        position, line_number = offset, data[:offset].count(b'\n')  # mmap has no count()
+
+        def unexpected_lines(start, end):
+            # From the end of a keyword line to the start of the next one, or to the end of the file
+            if not self._comment_lines.fullmatch(data, start, end):
+                lines = data[start:end].split(b'\n')
+                for index, line in enumerate(lines[1:], 1):
+                    line = line.strip()
+                    if not line.startswith(b';') and (line or index < len(lines) - 1):
+                        ErrorHandler.raise_error(file_path, data[:start].count(b'\n') + index,
+                                                 line.decode(self.encoding), "Unexpected line encountered.",
+                                                 error_level=2)
+
+        def close_block(end):
+            start, block_line, window_type, name, file_name, _ = block
+            source = WindowBlockSource(data[start:end], block_line, file_path, self.encoding,
+                                       validator)
+            new_window = create_lazy_window(window_type, name, new_window_id(), file_name, source)
+            if self.source is not None:
+                new_window.source_span = WindowSpan(self.source, block[5], start, end, file_name)
+            if parent_window:
+                parent_window.children.append(new_window)
+            else:
+                self.windows.append(new_window)
+            stack.append(new_window)
+            return new_window
+
+        for match in self._structure_line.finditer(data, offset):
+            line_number += data[position:match.start(1)].count(b'\n')
+            position = match.start(1)
+            token = match.group(1)
+
+            if block is not None:
+                if token.startswith(b'WINDOWTYPE'):
+                    block[2] = token.decode(self.encoding).rstrip(";").split("=")[1].strip()
+                    continue
+                if token.startswith(b'NAME'):
+                    value = token.decode(self.encoding).rstrip(";").split("=")[1].strip().strip('"')
+                    block[3], block[4] = value.split(":")[-1], value.split(":")[0]
+                    continue
+                if token == b'WINDOW':
+                    continue  # Reported when the window is decoded, like any other invalid property line
+                # END / CHILD / ENDALLCHILDREN closes the properties of the window
+                parent_window = close_block(match.start() + 1)
+                block = None
+            else:
+                unexpected_lines(gap_start, match.start() + 1)
+
+            if token == b'WINDOW':
+                block = [match.end() + 1, line_number + 1, "", "", file_path, match.start() + 1]
+            elif token == b'END':
+                if not stack:
+                    ErrorHandler.raise_error(file_path, line_number, "END", "Unexpected END without a corresponding WINDOW")
+                closed = stack.pop()
+                if closed.source_span is not None:
+                    closed.source_span.end = match.end(1)
+                    closed.source_span.child_uuids = tuple(child.window_uuid for child in closed.children)
+                parent_window = stack[-1] if stack else None
+            elif token == b'CHILD':
+                if not parent_window:
+                    ErrorHandler.raise_error(file_path, line_number, "CHILD", "Unexpected CHILD without a parent window")
+            elif token == b'ENDALLCHILDREN':
+                if not parent_window or not parent_window.children:
+                    ErrorHandler.raise_error(file_path, line_number, "ENDALLCHILDREN", "ENDALLCHILDREN found without children")
+            else:
+                ErrorHandler.raise_error(file_path, line_number, token.decode(self.encoding),
+                                         "Unexpected line encountered.", error_level=2)
+            gap_start = match.end()
+
+        if block is not None:
+            close_block(len(data))
+        else:
+            unexpected_lines(gap_start, len(data))
+
+        if stack:
+            ErrorHandler.raise_error(file_path, data[:].count(b'\n'), "EOF", "Unclosed windows found.")
+
     def get_metadata(self):
         """
         Get the parsed metadata from the file.
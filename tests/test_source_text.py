@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.error_handler import ErrorHandler
+from src.window.wnd_parser import WndParser
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "resources", "example.wnd")
+
+
+class SourceTextTest(unittest.TestCase):
+    def setUp(self):
+        self.parser = WndParser()
+        with ErrorHandler.headless():
+            self.parser.parse_file(EXAMPLE, lossless=True)
+        with open(EXAMPLE, encoding=self.parser.encoding, newline='') as file:
+            self.text = file.read()
+
+    def test_unchanged_file_is_kept(self):
+        self.assertEqual(self.parser.to_text(), self.text)
+
+    def test_added_statement_keeps_block_indentation(self):
+        window = self.parser.get_windows()[0]
+        window.properties['TEXT'] = "Hello"
+
+        lines, original = self.parser.to_text().splitlines(), self.text.splitlines()
+        added = next(index for index, line in enumerate(lines) if index >= len(original) or line != original[index])
+        self.assertEqual(lines[added], '  TEXT = "Hello";')
+        # Nothing but the new line differs
+        self.assertEqual(lines[:added] + lines[added + 1:], original)
+
+if __name__ == "__main__":
+    unittest.main()